@@ -1,10 +1,23 @@
 from __future__ import annotations
 
+import functools
 from functools import lru_cache
+from typing import Any, Callable
 
 from fastapi import Depends
 
-from backend.src.storage import cleanup_intraday, get_latest_intraday, init_db, list_daily, list_intraday
+from backend.src.api.readers import READERS
+from backend.src.api.timing import timed_phase
+from backend.src.storage import (
+    cleanup_intraday,
+    get_latest_curve,
+    get_latest_intraday,
+    init_db,
+    list_daily,
+    list_intraday,
+    list_job_runs,
+    list_source_health,
+)
 
 
 @lru_cache()
@@ -18,21 +31,52 @@ def ensure_storage():
     init_storage()
 
 
-def get_intraday_reader():
-    """Provide a bundle of intraday storage helpers for FastAPI dependency injection."""
+def _async_reader(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Awaitable version of ``func`` running on the API reader pool, timed as the ``storage`` phase."""
+    timed = timed_phase("storage", func)
+
+    @functools.wraps(func)
+    async def reader(*args: Any, **kwargs: Any) -> Any:
+        return await READERS.run(timed, *args, **kwargs)
+
+    return reader
+
+
+_INTRADAY_READERS = {
+    "get_latest_intraday": _async_reader(get_latest_intraday),
+    "list_intraday": _async_reader(list_intraday),
+    "get_latest_curve": _async_reader(get_latest_curve),
+    "cleanup_intraday": _async_reader(cleanup_intraday),
+}
+_DAILY_READERS = {
+    "list_daily": _async_reader(list_daily),
+}
+
+
+# The async providers below run on the event loop, not the threadpool: the schema is created by
+# the startup event, so ``ensure_storage()`` is a cache hit here.
+async def get_intraday_reader():
+    """Provide a bundle of awaitable intraday storage helpers for FastAPI dependency injection.
+
+    Each call runs on the bounded reader pool, and its time shows up as the ``queue`` and
+    ``storage`` phases of Server-Timing.
+    """
     ensure_storage()
-    return {
-        "get_latest_intraday": get_latest_intraday,
-        "list_intraday": list_intraday,
-        "cleanup_intraday": cleanup_intraday,
-    }
+    return _INTRADAY_READERS
+
+
+async def get_daily_reader():
+    """Provide awaitable read-only accessors for historical daily market data."""
+    ensure_storage()
+    return _DAILY_READERS
 
 
-def get_daily_reader():
-    """Provide read-only accessors for historical daily market data."""
+def get_ops_reader():
+    """Provide read-only accessors for scheduler operational history."""
     ensure_storage()
     return {
-        "list_daily": list_daily,
+        "list_job_runs": timed_phase("storage", list_job_runs),
+        "list_source_health": timed_phase("storage", list_source_health),
     }
 
 
@@ -40,4 +84,5 @@ __all__ = [
     "ensure_storage",
     "get_intraday_reader",
     "get_daily_reader",
+    "get_ops_reader",
 ]
@@ -7,13 +7,33 @@ from typing import Any, Dict, Optional
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_swagger_ui_html
-from fastapi.responses import RedirectResponse
+from fastapi.responses import PlainTextResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from swagger_ui_bundle import swagger_ui_path
 
 from backend.src.api.deps import ensure_storage, get_intraday_reader
-from backend.src.api.routers import dashboard, yearly
-from backend.src.config import get_intraday_interval_seconds, get_retention_hours
+from backend.src.api.middleware import (
+    MetricsMiddleware,
+    ProfilingMiddleware,
+    ServerTimingMiddleware,
+    TracingMiddleware,
+)
+from backend.src.api.readers import READERS
+from backend.src.api.routers import dashboard, ops, yearly
+from backend.src.api.timing import TimedRoute
+from backend.src.config import (
+    get_intraday_interval_seconds,
+    get_metrics_dir,
+    get_retention_hours,
+    get_settings,
+    primary_instrument,
+)
+from backend.src.metrics import render_with_textfiles
+from backend.src.profiling import ProfileBudget
+from backend.src.storage import IntradaySnapshotRecord
+from backend.src.tracing import configure_tracing
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
 
 LOGGER = logging.getLogger("nickel.api")
 
@@ -22,6 +42,8 @@ app = FastAPI(
     version="0.1.0",
     description="APIs for realtime and historical nickel data.",
 )
+# App-level routes (/health, /metrics) get the same phase markers as the routers.
+app.router.route_class = TimedRoute
 
 # Serve the bundled Swagger UI assets directly from the local bundle path.
 app.mount("/_swagger/static", StaticFiles(directory=swagger_ui_path), name="swagger_ui_static")
@@ -37,20 +59,52 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(MetricsMiddleware)
+# Server-Timing header plus the slow-request log behind /api/v1/ops/slow-requests.
+app.add_middleware(ServerTimingMiddleware)
+# Opt-in: sampled stacks of the first NICKEL_API_PROFILE_REQUESTS requests go to NICKEL_PROFILE_DIR.
+_settings = get_settings()
+if _settings.api_profile_requests > 0:
+    app.add_middleware(
+        ProfilingMiddleware,
+        budget=ProfileBudget(
+            _settings.api_profile_requests,
+            _settings.profile_dir,
+            float(_settings.profile_interval_ms) / 1000,
+            exclusive=True,
+        ),
+    )
+# Opt-in: request spans in Chrome Trace Event format next to the scheduler's (NICKEL_TRACE_ENABLED).
+if _settings.trace_enabled:
+    app.add_middleware(TracingMiddleware)
 
 
 @app.on_event("startup")
 async def startup_event() -> None:
     """Initialise dependencies that must be ready before the API begins serving."""
-    ensure_storage()
+    READERS.configure(_settings.api_reader_threads, _settings.api_reader_queue)
+    # Schema creation / migration is blocking sqlite work too; keep it off the event loop.
+    await READERS.run(ensure_storage)
+    configure_tracing("api")
     LOGGER.info("API startup completed, storage ready.")
 
 
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """Let in-flight storage reads finish before the process exits."""
+    READERS.shutdown()
+
+
 @app.get("/health", tags=["health"])
-def health_check(intraday=Depends(get_intraday_reader)) -> Dict[str, Any]:
+async def health_check(intraday=Depends(get_intraday_reader)) -> Dict[str, Any]:
     """Provide a basic readiness probe with the latest intraday snapshot metadata."""
-    record: Optional[Dict[str, Any]] = intraday["get_latest_intraday"]("lme")
-    latest_timestamp = record.get("captured_at") if record else None
+    # The LME nickel instrument, not whichever LME product was captured last.
+    lme = primary_instrument("lme")
+    record: Optional[IntradaySnapshotRecord] = await intraday["get_latest_intraday"](
+        "lme", instrument=lme.key if lme else None
+    )
+    # Unchanged ticks only bump last_confirmed_at, so it is the freshest sign of life.
+    latest_timestamp = (record.last_confirmed_at or record.captured_at) if record else None
     return {
         "status": "ok",
         "database": "ready",
@@ -63,6 +117,13 @@ def health_check(intraday=Depends(get_intraday_reader)) -> Dict[str, Any]:
 
 app.include_router(dashboard.router)
 app.include_router(yearly.router)
+app.include_router(ops.router)
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics() -> PlainTextResponse:
+    """Expose API metrics plus the scheduler's exported textfile in Prometheus format."""
+    return PlainTextResponse(render_with_textfiles(get_metrics_dir()), media_type=PROMETHEUS_CONTENT_TYPE)
 
 
 @app.get("/", include_in_schema=False)
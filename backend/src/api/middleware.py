@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Awaitable, Callable, Dict, MutableMapping
+
+from starlette.datastructures import MutableHeaders
+
+from backend.src.api.timing import (
+    REQUEST_TIMINGS,
+    SLOW_REQUESTS,
+    RequestTimings,
+    SlowRequestLog,
+    server_timing_header,
+    slow_request_entry,
+)
+from backend.src.metrics import REGISTRY
+from backend.src.profiling import ProfileBudget
+from backend.src.tracing import TRACER, now_us
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+REQUEST_DURATION = REGISTRY.histogram(
+    "nickel_api_request_seconds",
+    "API request latency by route template and status code.",
+    ("method", "route", "status"),
+)
+
+
+def _route_label(scope: Scope) -> str:
+    """Use the matched route template so path parameters do not explode label cardinality."""
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    return path if isinstance(path, str) else "unmatched"
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording request latency into the process metrics registry."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status: Dict[str, int] = {"code": 500}
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                status["code"] = int(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            REQUEST_DURATION.observe(
+                time.perf_counter() - started,
+                method=scope.get("method", "GET"),
+                route=_route_label(scope),
+                status=status["code"],
+            )
+
+
+class ServerTimingMiddleware:
+    """Pure ASGI middleware adding a ``Server-Timing`` header and feeding the slow-request log.
+
+    Phases come from ``TimedRoute`` and the timed storage readers through ``REQUEST_TIMINGS``;
+    the header is written when the response starts, so it covers everything before the body.
+    """
+
+    def __init__(self, app: ASGIApp, log: SlowRequestLog = SLOW_REQUESTS) -> None:
+        from backend.src.config import get_settings
+
+        settings = get_settings()
+        self.app = app
+        self.log = log
+        self.log.configure(int(settings.slow_request_capacity), float(settings.slow_request_threshold_ms))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = REQUEST_TIMINGS.set(timings)
+        result: Dict[str, Any] = {"status": 500, "phases": None}
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                result["status"] = int(message["status"])
+                result["phases"] = timings.phases(time.perf_counter() - timings.started)
+                MutableHeaders(scope=message).append("Server-Timing", server_timing_header(result["phases"]))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            REQUEST_TIMINGS.reset(token)
+            phases = result["phases"] or timings.phases(time.perf_counter() - timings.started)
+            self.log.offer(
+                phases["total"],
+                lambda: slow_request_entry(scope, result["status"], phases, _route_label(scope)),
+            )
+
+
+class ProfilingMiddleware:
+    """Pure ASGI middleware sampling the stacks of the next N requests (one at a time) into collapsed files.
+
+    Only installed when NICKEL_API_PROFILE_REQUESTS > 0; once the budget is spent each request
+    costs one integer comparison.
+    """
+
+    def __init__(self, app: ASGIApp, budget: ProfileBudget) -> None:
+        self.app = app
+        self.budget = budget
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with self.budget.profile(f"api{scope.get('path', '')}"):
+            await self.app(scope, receive, send)
+
+
+class TracingMiddleware:
+    """Pure ASGI middleware recording each request as a span in this process's trace file.
+
+    Only installed when NICKEL_TRACE_ENABLED is set; the capture-to-dashboard events that link a
+    request to the snapshot trace are emitted by the dashboard routes.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_us = now_us()
+        started = time.perf_counter()
+        status: Dict[str, int] = {"code": 500}
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                status["code"] = int(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            TRACER.complete(
+                f"{scope.get('method', 'GET')} {_route_label(scope)}",
+                started_us,
+                time.perf_counter() - started,
+                path=scope.get("path", ""),
+                status=status["code"],
+            )
+
+
+__all__ = [
+    "MetricsMiddleware",
+    "ProfilingMiddleware",
+    "ServerTimingMiddleware",
+    "TracingMiddleware",
+    "REQUEST_DURATION",
+]
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
 from pydantic import BaseModel, Field
 
+from backend.src.storage import JOB_STATUSES
+
 
 class APIResponse(BaseModel):
     """Standard envelope for JSON responses returned by this API."""
@@ -19,6 +21,7 @@ class IntradaySnapshot(BaseModel):
 
     id: Optional[int] = None
     exchange: str
+    instrument: Optional[str] = None
     contract: str
     captured_at: str
     quote_date: Optional[str] = None
@@ -37,6 +40,29 @@ class IntradaySnapshot(BaseModel):
     change_pct: Optional[float] = None
     tick_time: Optional[str] = None
     elapsed_seconds: Optional[float] = None
+    trace_id: Optional[str] = None
+    last_confirmed_at: Optional[str] = None
+
+
+class CurvePoint(BaseModel):
+    """One contract month of the latest term-structure snapshot."""
+
+    contract: str
+    latest_price: Optional[float] = None
+    prev_settlement: Optional[float] = None
+    bid: Optional[float] = None
+    ask: Optional[float] = None
+    volume: Optional[float] = None
+    open_interest: Optional[float] = None
+    tick_time: Optional[str] = None
+
+
+class CalendarSpread(BaseModel):
+    """Price difference between two consecutive contract months (near minus far)."""
+
+    near: str
+    far: str
+    spread: Optional[float] = None
 
 
 class DailyRecord(BaseModel):
@@ -44,6 +70,7 @@ class DailyRecord(BaseModel):
 
     id: Optional[int] = None
     exchange: str
+    instrument: Optional[str] = None
     contract: str
     trade_date: str
     open: Optional[float] = None
@@ -57,3 +84,57 @@ class DailyRecord(BaseModel):
     volume: Optional[float] = None
     open_interest: Optional[float] = None
     elapsed_seconds: Optional[float] = None
+
+
+# Outcomes written to the job ledger, defined once in storage next to the job_runs schema.
+JobStatus = Literal[JOB_STATUSES]  # type: ignore[valid-type]
+
+
+class JobRun(BaseModel):
+    """Schema for one scheduler job execution recorded in the job ledger."""
+
+    id: Optional[int] = None
+    job: str
+    trigger: str
+    scheduled_at: Optional[str] = None
+    started_at: str
+    finished_at: str
+    duration_seconds: float
+    attempts: int
+    rows_written: int
+    status: str
+    error_class: Optional[str] = None
+    error_message: Optional[str] = None
+
+
+class SlowRequest(BaseModel):
+    """Schema for one entry of the API slow-request log."""
+
+    method: str
+    path: str
+    route: str
+    query: Dict[str, str]
+    status: int
+    duration_ms: float
+    phases: Dict[str, float]
+    finished_at: str
+
+
+class SourceHealth(BaseModel):
+    """Schema for the circuit breaker / adaptive polling state of one upstream source."""
+
+    source: str
+    state: str
+    degraded: bool = False
+    consecutive_failures: int = 0
+    retry_in_seconds: Optional[float] = None
+    cooldown_seconds: Optional[float] = None
+    latency_ewma_seconds: Optional[float] = None
+    error_rate: Optional[float] = None
+    poll_multiplier: Optional[float] = None
+    total_calls: Optional[int] = None
+    total_failures: Optional[int] = None
+    last_error: Optional[str] = None
+    last_success_at: Optional[str] = None
+    last_failure_at: Optional[str] = None
+    updated_at: Optional[str] = None
@@ -0,0 +1,115 @@
+"""
+Dedicated thread pool for the API's blocking sqlite reads.
+
+Async routes hand storage calls to ``READERS`` instead of Starlette's shared threadpool, so a
+burst of dashboard polls can neither block the event loop nor starve other sync work. At most
+``threads`` reads run at once and at most ``queue`` more wait for a thread; anything beyond that
+is refused with 503 + ``Retry-After`` instead of piling up. Time spent waiting for a thread is
+exported as ``nickel_api_reader_queue_wait_seconds`` and as the ``queue`` Server-Timing phase.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException
+
+from backend.src.api.timing import REQUEST_TIMINGS
+from backend.src.metrics import REGISTRY
+
+LOGGER = logging.getLogger("nickel.api.readers")
+
+QUEUE_WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+QUEUE_WAIT = REGISTRY.histogram(
+    "nickel_api_reader_queue_wait_seconds",
+    "Seconds an API storage read waited for a reader thread.",
+    buckets=QUEUE_WAIT_BUCKETS,
+)
+PENDING = REGISTRY.gauge(
+    "nickel_api_reader_pending",
+    "API storage reads currently running or queued in the reader pool.",
+)
+REJECTED = REGISTRY.counter(
+    "nickel_api_reader_rejected_total",
+    "API storage reads refused with 503 because the reader queue was full.",
+)
+
+
+class ReaderPool:
+    """Bounded executor for blocking reads awaited from async routes; propagates the request context."""
+
+    def __init__(self, threads: int = 8, queue: int = 64) -> None:
+        self.threads = max(1, threads)
+        self.queue = max(0, queue)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def configure(self, threads: int, queue: int) -> None:
+        """Resize the pool; reads already submitted finish on the previous executor."""
+        with self._lock:
+            previous, self._executor = self._executor, None
+            self.threads = max(1, threads)
+            self.queue = max(0, queue)
+        if previous is not None:
+            previous.shutdown(wait=False)
+        LOGGER.info("API reader pool: %s threads, %s queued reads", self.threads, self.queue)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="nickel-reader")
+            return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Await ``func(*args, **kwargs)`` on a reader thread, or raise 503 when the queue is full."""
+        with self._lock:
+            if self._pending >= self.threads + self.queue:
+                REJECTED.inc()
+                raise HTTPException(
+                    status_code=503,
+                    detail="Storage readers are saturated, retry shortly.",
+                    headers={"Retry-After": "1"},
+                )
+            self._pending += 1
+            PENDING.set(self._pending)
+        submitted = time.perf_counter()
+        # Server-Timing phases and the current trace live in context variables.
+        context = contextvars.copy_context()
+
+        def call() -> Any:
+            waited = time.perf_counter() - submitted
+            QUEUE_WAIT.observe(waited)
+            timings = REQUEST_TIMINGS.get()
+            if timings is not None:
+                timings.add("queue", waited)
+            return func(*args, **kwargs)
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), context.run, call)
+        finally:
+            with self._lock:
+                self._pending -= 1
+                PENDING.set(self._pending)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+READERS = ReaderPool()
+
+
+__all__ = [
+    "READERS",
+    "ReaderPool",
+]
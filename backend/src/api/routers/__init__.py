@@ -1,5 +1,5 @@
 from __future__ import annotations
 
-from . import dashboard, yearly
+from . import dashboard, ops, yearly
 
-__all__ = ["dashboard", "yearly"]
+__all__ = ["dashboard", "ops", "yearly"]
@@ -1,14 +1,26 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Dict, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
 from backend.src.api.deps import get_daily_reader, get_intraday_reader
-from backend.src.api.models import APIResponse, DailyRecord, IntradaySnapshot
-
-router = APIRouter(prefix="/api/v1/dashboard", tags=["dashboard"])
+from backend.src.api.models import APIResponse
+from backend.src.api.readers import READERS
+from backend.src.api.timing import TimedRoute, timed_phase
+from backend.src.config import primary_instrument
+from backend.src.dashboard import SnapshotFile, calendar_spreads, render_dashboard_snapshot
+from backend.src.metrics import REGISTRY
+from backend.src.tracing import TRACER
+
+router = APIRouter(prefix="/api/v1/dashboard", tags=["dashboard"], route_class=TimedRoute)
+
+CAPTURE_TO_DASHBOARD = REGISTRY.histogram(
+    "nickel_capture_to_dashboard_seconds",
+    "Seconds from the start of a snapshot's capture trace to the first dashboard response serving it.",
+    ("exchange",),
+)
 
 # Localised labels used by the frontend to render human-friendly column names.
 INTRADAY_LABELS: Dict[str, str] = {
@@ -31,6 +43,8 @@ INTRADAY_LABELS: Dict[str, str] = {
     "change_pct": "涨跌幅(%)",
     "tick_time": "Tick 时间",
     "elapsed_seconds": "耗时(秒)",
+    "trace_id": "追踪 ID",
+    "last_confirmed_at": "最近确认时间",
 }
 
 DAILY_LABELS: Dict[str, str] = {
@@ -50,67 +64,152 @@ DAILY_LABELS: Dict[str, str] = {
     "elapsed_seconds": "耗时(秒)",
 }
 
-def _serialise_intraday(record: Dict[str, Any]) -> IntradaySnapshot:
-    """Project raw storage records into the public intraday response model."""
-    payload = {key: record.get(key) for key in IntradaySnapshot.model_fields.keys()}
-    return IntradaySnapshot.model_validate(payload)
+CURVE_LABELS: Dict[str, str] = {
+    "contract": "合约",
+    "latest_price": "最新价",
+    "prev_settlement": "昨日结算",
+    "bid": "买价",
+    "ask": "卖价",
+    "volume": "成交量",
+    "open_interest": "持仓量",
+    "tick_time": "Tick 时间",
+    "near": "近月合约",
+    "far": "远月合约",
+    "spread": "价差",
+}
+
+
+# Body published by the scheduler after each intraday cycle (see backend.src.dashboard).
+SNAPSHOT_FILE = SnapshotFile()
+
+
+def _instrument_filter(exchange: str, instrument: Optional[str], contract: Optional[str]) -> Optional[str]:
+    """Instrument key to read: the requested one, else the exchange's primary (nickel) instrument.
 
+    An explicit ``contract`` without ``instrument`` is matched on its own, as before instruments
+    were tagged.
+    """
+    if instrument or contract:
+        return instrument.lower() if instrument else None
+    primary = primary_instrument(exchange)
+    return primary.key if primary else None
 
-def _serialise_daily(record: Dict[str, Any]) -> DailyRecord:
-    """Project raw storage records into the public daily response model."""
-    payload = {key: record.get(key) for key in DailyRecord.model_fields.keys()}
-    return DailyRecord.model_validate(payload)
+
+def _record_delivery(exchange: str, trace_id: Optional[str], route: str) -> None:
+    """Observe capture-to-dashboard latency the first time this process serves the snapshot."""
+    latency = TRACER.delivered(trace_id, "dashboard", exchange=exchange, route=route)
+    if latency is not None:
+        CAPTURE_TO_DASHBOARD.observe(latency, exchange=exchange)
+
+
+@router.get("/snapshot", response_model=APIResponse)
+async def get_dashboard_snapshot(request: Request) -> Response:
+    """Return every dashboard card in one response: latest LME / SHFE snapshots, today's ranges,
+    sparkline points and derived spreads.
+
+    The scheduler precomputes the body after each intraday cycle, so this is a cached bytes
+    lookup; ``ETag`` / ``If-None-Match`` let pollers skip unchanged bodies.
+    """
+    published = SNAPSHOT_FILE.read()
+    if published is None:
+        # No scheduler has published yet (API-only debugging): build it from storage instead.
+        body = await READERS.run(timed_phase("storage", render_dashboard_snapshot))
+        return Response(content=body, media_type="application/json")
+    for exchange, trace_id in published.traces:
+        _record_delivery(exchange, trace_id, "snapshot")
+    headers = {"ETag": published.etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == published.etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=published.body, media_type="application/json", headers=headers)
 
 
 @router.get("/latest", response_model=APIResponse)
-def get_latest_snapshot(
+async def get_latest_snapshot(
     exchange: str = Query("lme", description="交易所标识，如 lme / shfe"),
+    instrument: Optional[str] = Query(None, description="品种标识（instruments 配置的 key），如 shfe / shfe_cu；默认为该交易所的镍"),
+    contract: Optional[str] = Query(None, description="存储的合约代码，如 NI2611；未指定 instrument 时单独按合约过滤"),
     intraday=Depends(get_intraday_reader),
 ) -> APIResponse:
-    """Return the freshest intraday record for the requested exchange."""
-    record = intraday["get_latest_intraday"](exchange)
+    """Return the freshest intraday record for the requested exchange (and instrument / contract)."""
+    key = _instrument_filter(exchange, instrument, contract)
+    record = await intraday["get_latest_intraday"](exchange, contract=contract, instrument=key)
     if record is None:
-        raise HTTPException(status_code=404, detail=f"No intraday data for exchange '{exchange}'")
+        raise HTTPException(status_code=404, detail=f"No intraday data for exchange '{exchange}' instrument '{key}'")
+    _record_delivery(record.exchange, record.trace_id, "latest")
+
+    # Storage records already carry the IntradaySnapshot shape; no per-request model validation.
+    return APIResponse(
+        data=record.to_api(),
+        meta={"labels": INTRADAY_LABELS, "exchange": exchange, "instrument": key},
+        error=None,
+    )
+
+
+@router.get("/curve", response_model=APIResponse)
+async def get_latest_curve(
+    exchange: str = Query("shfe", description="交易所标识，目前仅 shfe 提供完整合约曲线"),
+    product: str = Query("NI", description="品种代码（合约前缀），如 NI / CU / SS"),
+    intraday=Depends(get_intraday_reader),
+) -> APIResponse:
+    """Return the latest term-structure snapshot and its calendar spreads."""
+    points = await intraday["get_latest_curve"](exchange, product=product)
+    if not points:
+        raise HTTPException(status_code=404, detail=f"No curve data for exchange '{exchange}' product '{product}'")
 
-    snapshot = _serialise_intraday(record)
     return APIResponse(
-        data=snapshot.model_dump(),
-        meta={"labels": INTRADAY_LABELS, "exchange": exchange},
+        data={
+            "captured_at": points[0].captured_at,
+            "points": [point.to_api() for point in points],
+            "spreads": calendar_spreads(points),
+        },
+        meta={"labels": CURVE_LABELS, "exchange": exchange, "product": product.upper(), "count": len(points)},
         error=None,
     )
 
 
 @router.get("/intraday", response_model=APIResponse)
-def list_intraday_snapshots(
+async def list_intraday_snapshots(
     exchange: str = Query("lme", description="交易所标识，如 lme / shfe"),
     limit: int = Query(30, ge=1, le=500, description="返回条数"),
+    instrument: Optional[str] = Query(None, description="品种标识（instruments 配置的 key），如 shfe / shfe_cu；默认为该交易所的镍"),
+    contract: Optional[str] = Query(None, description="存储的合约代码，如 NI2611；未指定 instrument 时单独按合约过滤"),
     intraday=Depends(get_intraday_reader),
 ) -> APIResponse:
     """Return a bounded list of intraday snapshots ordered from newest to oldest."""
-    records = intraday["list_intraday"](exchange, limit=limit)
-    data = [_serialise_intraday(record).model_dump() for record in records]
+    key = _instrument_filter(exchange, instrument, contract)
+    records = await intraday["list_intraday"](exchange, limit=limit, contract=contract, instrument=key)
+    if records:
+        # Older rows of the page were already delivered by earlier polls.
+        _record_delivery(records[0].exchange, records[0].trace_id, "intraday")
+    data = [record.to_api() for record in records]
     return APIResponse(
         data=data,
-        meta={"labels": INTRADAY_LABELS, "exchange": exchange, "count": len(data)},
+        meta={"labels": INTRADAY_LABELS, "exchange": exchange, "instrument": key, "count": len(data)},
         error=None,
     )
 
 
 @router.get("/daily", response_model=APIResponse)
-def list_daily_records(
+async def list_daily_records(
     exchange: str = Query("lme", description="交易所标识，如 lme / shfe"),
     start_date: Optional[str] = Query(None, description="起始日期 (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="结束日期 (YYYY-MM-DD)"),
+    instrument: Optional[str] = Query(None, description="品种标识（instruments 配置的 key），如 shfe / shfe_cu；默认为该交易所的镍"),
+    contract: Optional[str] = Query(None, description="日线合约标签，如 NI_main / LME_Nickel"),
     daily=Depends(get_daily_reader),
 ) -> APIResponse:
     """Return historical day-level records for the provided date range."""
-    records = daily["list_daily"](exchange, start_date=start_date, end_date=end_date)
-    data = [_serialise_daily(record).model_dump() for record in records]
+    key = _instrument_filter(exchange, instrument, contract)
+    records = await daily["list_daily"](
+        exchange, start_date=start_date, end_date=end_date, contract=contract, instrument=key
+    )
+    data = [record.to_api() for record in records]
     return APIResponse(
         data=data,
         meta={
             "labels": DAILY_LABELS,
             "exchange": exchange,
+            "instrument": key,
             "count": len(data),
             "start_date": start_date,
             "end_date": end_date,
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from backend.src.api.deps import get_ops_reader
+from backend.src.api.models import APIResponse, JobRun, JobStatus, SlowRequest, SourceHealth
+from backend.src.api.timing import SLOW_REQUESTS, TimedRoute
+from backend.src.storage import JOB_STATUSES
+
+router = APIRouter(prefix="/api/v1/ops", tags=["ops"], route_class=TimedRoute)
+
+JOB_RUN_LABELS: Dict[str, str] = {
+    "job": "任务",
+    "trigger": "触发方式",
+    "scheduled_at": "计划时间",
+    "started_at": "开始时间",
+    "finished_at": "结束时间",
+    "duration_seconds": "耗时(秒)",
+    "attempts": "尝试次数",
+    "rows_written": "写入行数",
+    "status": "状态",
+    "error_class": "错误类型",
+    "error_message": "错误信息",
+}
+
+SLOW_REQUEST_LABELS: Dict[str, str] = {
+    "method": "方法",
+    "path": "路径",
+    "route": "路由",
+    "query": "查询参数",
+    "status": "状态码",
+    "duration_ms": "总耗时(毫秒)",
+    "phases": "分阶段耗时(毫秒)",
+    "finished_at": "完成时间",
+}
+
+SOURCE_HEALTH_LABELS: Dict[str, str] = {
+    "source": "数据源",
+    "state": "熔断状态",
+    "degraded": "是否降级",
+    "consecutive_failures": "连续失败次数",
+    "retry_in_seconds": "距下次探测(秒)",
+    "cooldown_seconds": "熔断时长(秒)",
+    "latency_ewma_seconds": "平均耗时(秒)",
+    "error_rate": "错误率",
+    "poll_multiplier": "轮询间隔倍数",
+    "total_calls": "调用次数",
+    "total_failures": "失败次数",
+    "last_error": "最近错误",
+    "last_success_at": "最近成功时间",
+    "last_failure_at": "最近失败时间",
+    "updated_at": "更新时间",
+}
+
+
+@router.get("/jobs", response_model=APIResponse)
+def list_job_runs(
+    job: Optional[str] = Query(None, description="任务名，如 lme_daily / shfe_intraday"),
+    status: Optional[JobStatus] = Query(None, description=f"运行结果：{' / '.join(JOB_STATUSES)}"),
+    since: Optional[str] = Query(None, description="开始时间下限 (ISO8601, UTC)"),
+    until: Optional[str] = Query(None, description="开始时间上限 (ISO8601, UTC)"),
+    min_duration: Optional[float] = Query(None, ge=0, description="仅返回耗时不少于该秒数的运行"),
+    limit: int = Query(100, ge=1, le=1000, description="返回条数"),
+    ops=Depends(get_ops_reader),
+) -> APIResponse:
+    """Return scheduler job runs from the ledger, newest first."""
+    records = ops["list_job_runs"](
+        job=job,
+        status=status,
+        since=since,
+        until=until,
+        min_duration=min_duration,
+        limit=limit,
+    )
+    data = [JobRun.model_validate(record).model_dump() for record in records]
+    return APIResponse(
+        data=data,
+        meta={
+            "labels": JOB_RUN_LABELS,
+            "count": len(data),
+            "job": job,
+            "status": status,
+            "since": since,
+            "until": until,
+        },
+        error=None,
+    )
+
+
+@router.get("/sources", response_model=APIResponse)
+def list_source_health(ops=Depends(get_ops_reader)) -> APIResponse:
+    """Return the circuit breaker and polling state of each upstream source as last written by the scheduler."""
+    data = []
+    for record in ops["list_source_health"]():
+        degraded = record.get("state") != "closed" or (record.get("poll_multiplier") or 1.0) > 1.0
+        data.append(SourceHealth.model_validate({**record, "degraded": degraded}).model_dump())
+    return APIResponse(
+        data=data,
+        meta={
+            "labels": SOURCE_HEALTH_LABELS,
+            "count": len(data),
+            "degraded": [item["source"] for item in data if item["degraded"]],
+        },
+        error=None,
+    )
+
+
+@router.get("/slow-requests", response_model=APIResponse)
+def list_slow_requests(
+    limit: int = Query(50, ge=1, le=1000, description="返回条数"),
+    reset: bool = Query(False, description="读取后清空记录"),
+) -> APIResponse:
+    """Return the slowest API requests seen by this process, slowest first, with per-phase timings."""
+    data = [SlowRequest.model_validate(entry).model_dump() for entry in SLOW_REQUESTS.slowest(limit)]
+    if reset:
+        SLOW_REQUESTS.reset()
+    return APIResponse(
+        data=data,
+        meta={
+            "labels": SLOW_REQUEST_LABELS,
+            "count": len(data),
+            "capacity": SLOW_REQUESTS.capacity,
+            "threshold_ms": SLOW_REQUESTS.threshold_ms,
+        },
+        error=None,
+    )
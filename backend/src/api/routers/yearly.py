@@ -1,14 +1,23 @@
 from __future__ import annotations
 
 import json
+import re
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse
 
-router = APIRouter(prefix="/api/v1/yearly", tags=["yearly"])
+from backend.src.api.timing import TimedRoute
+
+router = APIRouter(prefix="/api/v1/yearly", tags=["yearly"], route_class=TimedRoute)
 
 YEARLY_DATA_DIR = Path(__file__).resolve().parents[3] / "resources" / "yearly_data"
+# Written by scripts/build_yearly_data.py; maps each slide to its content-hashed JSON file.
+MANIFEST_FILENAME = "manifest.json"
+HASHED_ARTIFACT_RE = re.compile(r"^slide-\d{2}\.[0-9a-f]{12}\.json$")
+
+_manifest_cache: Optional[Tuple[float, Dict[str, Any]]] = None
 
 
 def _ensure_data_dir() -> Path:
@@ -26,12 +35,31 @@ def _load_json(path: Path) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=f"Failed to read {path.name}") from exc
 
 
+def _load_manifest() -> Optional[Dict[str, Any]]:
+    """Return the build manifest if present, re-reading it only when the file changes."""
+    global _manifest_cache
+    path = _ensure_data_dir() / MANIFEST_FILENAME
+    try:
+        mtime = path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+    if _manifest_cache is None or _manifest_cache[0] != mtime:
+        _manifest_cache = (mtime, _load_json(path))
+    return _manifest_cache[1]
+
+
 def _resolve_slide_path(slide_id: str) -> Path:
     slide_id = slide_id.strip()
     if not slide_id:
         raise HTTPException(status_code=400, detail="Slide id must not be empty.")
     if not slide_id.isdigit():
         raise HTTPException(status_code=400, detail="Slide id must be numeric.")
+    manifest = _load_manifest()
+    if manifest is not None:
+        for entry in manifest.get("slides") or []:
+            if entry.get("slide") == int(slide_id):
+                return _ensure_data_dir() / entry["file"]
+        raise HTTPException(status_code=404, detail="Slide not found.")
     filename = f"slide-{int(slide_id):02d}.json"
     return _ensure_data_dir() / filename
 
@@ -40,6 +68,19 @@ def _resolve_slide_path(slide_id: str) -> Path:
 def list_yearly_slides() -> Dict[str, List[Dict[str, Any]]]:
     """Return a lightweight index of available yearly report slides."""
     data_dir = _ensure_data_dir()
+    manifest = _load_manifest()
+    if manifest is not None:
+        return {
+            "slides": [
+                {
+                    "slide": entry.get("slide"),
+                    "title": entry.get("title"),
+                    "filename": entry.get("file"),
+                    "chart_count": entry.get("chartCount", 0),
+                }
+                for entry in manifest.get("slides") or []
+            ]
+        }
     slides: List[Dict[str, Any]] = []
     for file in sorted(data_dir.glob("slide-*.json")):
         payload = _load_json(file)
@@ -59,3 +100,27 @@ def get_yearly_slide(slide_id: str) -> Dict[str, Any]:
     """Return the complete payload for a specific yearly report slide."""
     path = _resolve_slide_path(slide_id)
     return _load_json(path)
+
+
+@router.get("/manifest")
+def get_yearly_manifest() -> Dict[str, Any]:
+    """Return the build manifest that maps slides to their content-hashed artifacts."""
+    manifest = _load_manifest()
+    if manifest is None:
+        raise HTTPException(status_code=404, detail="Yearly manifest not built.")
+    return manifest
+
+
+@router.get("/artifacts/{filename}")
+def get_yearly_artifact(filename: str) -> FileResponse:
+    """Serve a content-hashed slide payload; its name changes with its content, so it is cached forever."""
+    if not HASHED_ARTIFACT_RE.match(filename):
+        raise HTTPException(status_code=400, detail="Invalid artifact name.")
+    path = _ensure_data_dir() / filename
+    if not path.exists():
+        raise HTTPException(status_code=404, detail="Artifact not found.")
+    return FileResponse(
+        path,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=31536000, immutable"},
+    )
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import functools
+import heapq
+import inspect
+import itertools
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+# Order of the phases in Server-Timing headers; "endpoint" excludes the reader-queue wait and
+# storage time spent inside it.
+PHASES = ("deps", "queue", "storage", "endpoint", "serialize")
+
+
+class RequestTimings:
+    """Phase durations of one request, filled by ``TimedRoute`` and the timed storage readers.
+
+    Sync endpoints and reader-pool calls run on other threads with a copy of the request context,
+    which still points at this same object, so phases recorded there are visible to the middleware.
+    """
+
+    __slots__ = ("started", "marks", "durations")
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.marks: Dict[str, float] = {}
+        self.durations: Dict[str, float] = {}
+
+    def mark(self, name: str) -> None:
+        self.marks[name] = time.perf_counter()
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.durations[phase] = self.durations.get(phase, 0.0) + seconds
+
+    def phases(self, total: float) -> Dict[str, float]:
+        """Milliseconds per phase; requests that never reached a ``TimedRoute`` only report queue/storage."""
+        marks = self.marks
+        phases: Dict[str, float] = {}
+        if {"handler_start", "endpoint_start", "endpoint_end", "handler_end"} <= marks.keys():
+            queue = self.durations.get("queue", 0.0)
+            storage = self.durations.get("storage", 0.0)
+            phases["deps"] = marks["endpoint_start"] - marks["handler_start"]
+            if "queue" in self.durations:
+                phases["queue"] = queue
+            phases["storage"] = storage
+            phases["endpoint"] = max(0.0, marks["endpoint_end"] - marks["endpoint_start"] - queue - storage)
+            phases["serialize"] = marks["handler_end"] - marks["endpoint_end"]
+        else:
+            for phase in ("queue", "storage"):
+                if phase in self.durations:
+                    phases[phase] = self.durations[phase]
+        phases["total"] = total
+        return {name: round(seconds * 1000, 3) for name, seconds in phases.items()}
+
+
+REQUEST_TIMINGS: ContextVar[Optional[RequestTimings]] = ContextVar("nickel_request_timings", default=None)
+
+
+def timed_phase(phase: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap ``func`` so its duration is added to ``phase`` of the current request (no-op outside one)."""
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        timings = REQUEST_TIMINGS.get()
+        if timings is None:
+            return func(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            timings.add(phase, time.perf_counter() - started)
+
+    return wrapper
+
+
+def _timed_endpoint(call: Callable[..., Any]) -> Callable[..., Any]:
+    """Mark endpoint start/end around ``call``, keeping its sync/async nature and signature.
+
+    The signature is resolved against ``call``'s own module so FastAPI sees the real parameter
+    types even though the wrapper lives here.
+    """
+    if inspect.iscoroutinefunction(call):
+
+        @functools.wraps(call)
+        async def endpoint(**values: Any) -> Any:
+            timings = REQUEST_TIMINGS.get()
+            if timings is not None:
+                timings.mark("endpoint_start")
+            try:
+                return await call(**values)
+            finally:
+                if timings is not None:
+                    timings.mark("endpoint_end")
+
+    else:
+
+        @functools.wraps(call)
+        def endpoint(**values: Any) -> Any:
+            timings = REQUEST_TIMINGS.get()
+            if timings is not None:
+                timings.mark("endpoint_start")
+            try:
+                return call(**values)
+            finally:
+                if timings is not None:
+                    timings.mark("endpoint_end")
+
+    endpoint.__signature__ = inspect.signature(call, eval_str=True)  # type: ignore[attr-defined]
+    return endpoint
+
+
+class TimedRoute(APIRoute):
+    """APIRoute that marks where dependency resolution ends and serialization begins.
+
+    Everything between the handler start and the endpoint call is dependency resolution
+    (query validation plus ``Depends``); everything after the endpoint returns until the
+    response exists is response-model validation and JSON encoding.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        super().__init__(path, _timed_endpoint(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable[[Request], Any]:
+        handler = super().get_route_handler()
+
+        async def timed_handler(request: Request) -> Response:
+            timings = REQUEST_TIMINGS.get()
+            if timings is not None:
+                timings.mark("handler_start")
+            try:
+                return await handler(request)
+            finally:
+                if timings is not None:
+                    timings.mark("handler_end")
+
+        return timed_handler
+
+
+def server_timing_header(phases: Dict[str, float]) -> str:
+    """``deps;dur=0.4, storage;dur=3.1, ...`` in ``PHASES`` order followed by ``total``."""
+    names = [name for name in (*PHASES, "total") if name in phases]
+    return ", ".join(f"{name};dur={phases[name]:.3f}" for name in names)
+
+
+class SlowRequestLog:
+    """Keeps the ``capacity`` slowest requests at or above ``threshold_ms`` since start (or reset).
+
+    A min-heap makes each candidate O(log N): the fastest retained entry is the one evicted.
+    Each API process keeps its own log.
+    """
+
+    def __init__(self, capacity: int = 50, threshold_ms: float = 0.0) -> None:
+        self.capacity = max(0, capacity)
+        self.threshold_ms = threshold_ms
+        self._heap: List[Tuple[float, int, Dict[str, Any]]] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def configure(self, capacity: int, threshold_ms: float) -> None:
+        with self._lock:
+            self.capacity = max(0, capacity)
+            self.threshold_ms = threshold_ms
+            while len(self._heap) > self.capacity:
+                heapq.heappop(self._heap)
+
+    def offer(self, total_ms: float, entry: Callable[[], Dict[str, Any]]) -> bool:
+        """Record the request if it qualifies; ``entry`` is only built for requests that are kept."""
+        if total_ms < self.threshold_ms or self.capacity == 0:
+            return False
+        with self._lock:
+            if len(self._heap) >= self.capacity and total_ms <= self._heap[0][0]:
+                return False
+            item = (total_ms, next(self._sequence), entry())
+            if len(self._heap) < self.capacity:
+                heapq.heappush(self._heap, item)
+            else:
+                heapq.heapreplace(self._heap, item)
+        return True
+
+    def slowest(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            items = sorted(self._heap, key=lambda item: item[0], reverse=True)
+        return [entry for _, _, entry in items[:limit]]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._heap.clear()
+
+
+SLOW_REQUESTS = SlowRequestLog()
+
+
+def slow_request_entry(scope: Dict[str, Any], status: int, phases: Dict[str, float], route: str) -> Dict[str, Any]:
+    """The ops view of one request: what was asked, when, and where the time went."""
+    query = scope.get("query_string", b"").decode("latin-1")
+    return {
+        "method": scope.get("method", "GET"),
+        "path": scope.get("path", ""),
+        "route": route,
+        "query": dict(parse_qsl(query, keep_blank_values=True)),
+        "status": status,
+        "duration_ms": phases["total"],
+        "phases": {name: value for name, value in phases.items() if name != "total"},
+        "finished_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+    }
+
+
+__all__ = [
+    "PHASES",
+    "REQUEST_TIMINGS",
+    "RequestTimings",
+    "SLOW_REQUESTS",
+    "SlowRequestLog",
+    "TimedRoute",
+    "server_timing_header",
+    "slow_request_entry",
+    "timed_phase",
+]
@@ -4,9 +4,13 @@
 Nickel futures data collector.
 
 Provides two public functions:
-    1. get_realtime_nickel()          -> SHFE realtime snapshot for today.
+    1. get_realtime_nickel()          -> SHFE realtime snapshot for today (main contract plus the
+                                         full contract curve from the same response).
     2. get_historical_nickel(date)    -> Historical main contract data (Sina) for the given date.
 
+Both take an optional Sina continuous symbol (default ``NI0``) so other SHFE metals such as
+``CU0`` or ``SS0`` can be collected through the same code path.
+
 Running this script without arguments exercises both functions:
     - realtime: today (SHFE)
     - historical: fixed test date 2025-10-23 (Sina)
@@ -18,11 +22,14 @@ from __future__ import annotations
 
 import argparse
 import io
+import logging
+import math
+import re
 import sys
 import time
 import numbers
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 import akshare as ak
 import pandas as pd
@@ -30,7 +37,13 @@ import numpy as np
 from akshare.futures.futures_zh_sina import futures_symbol_mark
 
 # Ensure UTF-8 stdout for readable Chinese if present in data.
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+# reconfigure() keeps the same stream, so importing both collectors does not close stdout.
+if isinstance(sys.stdout, io.TextIOWrapper):
+    sys.stdout.reconfigure(encoding="utf-8")
+
+LOGGER = logging.getLogger("nickel.collectors.shfe")
+REALTIME_LOG_CONTEXT = {"exchange": "shfe", "contract": "NI0", "job": "shfe_realtime"}
+HISTORY_LOG_CONTEXT = {"exchange": "shfe", "contract": "NI0", "job": "shfe_history"}
 
 # Fields we surface when printing realtime snapshots (Sina接口字段+补算指标).
 REALTIME_FIELDS = (
@@ -94,24 +107,60 @@ FIELD_LABELS = {
     "elapsed_seconds": "耗时(秒)",
 }
 
-try:
-    # Cache the SHFE nickel symbol.
-    _SHFE_NI_SYMBOL = (
-        futures_symbol_mark()
-        .loc[futures_symbol_mark()["mark"] == "ni_qh", "symbol"]
-        .iloc[0]
-    )
-except Exception:
-    _SHFE_NI_SYMBOL = None
+DEFAULT_SYMBOL = "NI0"
+
+# Numeric fields of the columnar history block (see get_historical_nickel_columns).
+HISTORY_VALUE_FIELDS = (
+    "open",
+    "high",
+    "low",
+    "close",
+    "settlement",
+    "prev_settlement",
+    "change",
+    "change_pct",
+    "volume",
+    "open_interest",
+)
+
+# Sina realtime board names per product prefix, looked up on first use and kept for the process.
+_SINA_BOARD_CACHE: Dict[str, str] = {}
+
+
+def _product_prefix(symbol: str) -> str:
+    """Product code of a Sina continuous symbol, e.g. ``NI0`` -> ``NI``."""
+    match = re.match(r"[A-Za-z]+", symbol)
+    if match is None:
+        raise ValueError(f"Invalid SHFE symbol '{symbol}'")
+    return match.group(0).upper()
+
+
+def history_contract_name(symbol: str = DEFAULT_SYMBOL) -> str:
+    """Contract label stored with daily records of ``symbol`` (``NI0`` -> ``NI_main``)."""
+    return f"{_product_prefix(symbol)}_main"
+
+
+def _log_context(base: Dict[str, str], symbol: str) -> Dict[str, str]:
+    return base if symbol == DEFAULT_SYMBOL else {**base, "contract": symbol}
+
+
+def _sina_board(symbol: str) -> str:
+    """Board name futures_zh_realtime expects for ``symbol`` (the ``<prefix>_qh`` mark)."""
+    prefix = _product_prefix(symbol)
+    if prefix not in _SINA_BOARD_CACHE:
+        marks = futures_symbol_mark()
+        _SINA_BOARD_CACHE[prefix] = marks.loc[marks["mark"] == f"{prefix.lower()}_qh", "symbol"].iloc[0]
+    return _SINA_BOARD_CACHE[prefix]
 
 
 def _coerce_to_float(value: Any) -> Optional[float]:
-    """Convert assorted numeric-like values to float, preserving None."""
+    """Convert assorted numeric-like values to float; None, NaN and blanks become None."""
     if value is None:
         return None
 
     if isinstance(value, numbers.Real) or isinstance(value, np.number):
-        return float(value)
+        number = float(value)
+        return None if math.isnan(number) else number
 
     if isinstance(value, str):
         stripped = value.strip()
@@ -128,6 +177,12 @@ def _coerce_to_float(value: Any) -> Optional[float]:
     return None
 
 
+def _round_or_none(value: Any, digits: int) -> Optional[float]:
+    """Round like ``Series.round`` (NumPy) so per-row and columnar records carry identical values."""
+    numeric = _coerce_to_float(value)
+    return float(np.round(numeric, digits)) if numeric is not None else None
+
+
 # Assemble dict consumed by CLI / downstream storage for realtime SHFE data
 def _build_realtime_record(
     *,
@@ -162,9 +217,7 @@ def _build_realtime_record(
         "prev_settlement": _coerce_to_float(prev_settlement),
         "settlement": _coerce_to_float(settlement),
         "change": _coerce_to_float(change),
-        "change_pct": (
-            round(_coerce_to_float(change_pct), 6) if change_pct is not None else None
-        ),
+        "change_pct": _round_or_none(change_pct, 6),
         "bid": _coerce_to_float(bid),
         "ask": _coerce_to_float(ask),
         "volume": _coerce_to_float(volume),
@@ -208,9 +261,7 @@ def _build_historical_record(
         "settlement": _coerce_to_float(settlement),
         "prev_settlement": _coerce_to_float(prev_settlement),
         "change": _coerce_to_float(change),
-        "change_pct": (
-            round(_coerce_to_float(change_pct), 6) if change_pct is not None else None
-        ),
+        "change_pct": _round_or_none(change_pct, 6),
         "volume": _coerce_to_float(volume),
         "open_interest": _coerce_to_float(open_interest),
         "source": source,
@@ -262,20 +313,19 @@ def _print_record(label: str, data: Optional[Dict[str, Optional[Any]]], fields)
 # Internal fetchers
 # ---------------------------------------------------------------------------
 
-def _fetch_sina_history(date_str: str) -> Optional[Dict[str, Optional[Any]]]:
-    """Fetch historical main contract data from Sina for the given date."""
-    target_date = _parse_date(date_str).date()
-
+def _load_sina_history(symbol: str = DEFAULT_SYMBOL) -> Optional[tuple[pd.DataFrame, float]]:
+    """Download the full Sina main-contract history once, sorted by date."""
+    log_context = _log_context(HISTORY_LOG_CONTEXT, symbol)
     fetch_start = time.perf_counter()
     try:
-        df = ak.futures_main_sina(symbol="NI0")
+        df = ak.futures_main_sina(symbol=symbol)
     except Exception as exc:
-        print(f"[Sina] Request failed: {exc}")
+        LOGGER.warning("Sina history request failed: %s", exc, extra=log_context)
         return None
     elapsed = time.perf_counter() - fetch_start
 
     if df is None or df.empty:
-        print("[Sina] Empty response")
+        LOGGER.warning("Sina history empty response", extra=log_context)
         return None
     df = df.copy()
     rename_map = {
@@ -291,15 +341,25 @@ def _fetch_sina_history(date_str: str) -> Optional[Dict[str, Optional[Any]]]:
     df = df.rename(columns=rename_map)
 
     if "date" not in df.columns:
-        print("[Sina] Unexpected response: missing 'date' column")
+        LOGGER.warning("Sina history unexpected response: missing 'date' column", extra=log_context)
         return None
 
     df["date"] = pd.to_datetime(df["date"], errors="coerce").dt.date
     df = df.sort_values("date").reset_index(drop=True)
+    return df, elapsed
+
 
+def _sina_history_record(
+    df: pd.DataFrame,
+    date_str: str,
+    elapsed: float,
+    symbol: str = DEFAULT_SYMBOL,
+) -> Optional[Dict[str, Optional[Any]]]:
+    """Build the historical record for ``date_str`` from an already downloaded history frame."""
+    target_date = _parse_date(date_str).date()
     matching_idx = df.index[df["date"] == target_date]
     if matching_idx.size == 0:
-        print(f"[Sina] No record for {date_str}")
+        LOGGER.warning("Sina history has no record for %s", date_str, extra=_log_context(HISTORY_LOG_CONTEXT, symbol))
         return None
 
     row_idx = matching_idx[-1]
@@ -323,7 +383,7 @@ def _fetch_sina_history(date_str: str) -> Optional[Dict[str, Optional[Any]]]:
 
     return _build_historical_record(
         date_str=date_str,
-        contract="NI_main",
+        contract=history_contract_name(symbol),
         open_price=row.get("open"),
         high_price=row.get("high"),
         low_price=row.get("low"),
@@ -339,28 +399,117 @@ def _fetch_sina_history(date_str: str) -> Optional[Dict[str, Optional[Any]]]:
     )
 
 
-def _fetch_shfe_realtime(date_str: str) -> Optional[Dict[str, Optional[Any]]]:
+def _numeric_column(df: pd.DataFrame, column: str) -> pd.Series:
+    if column not in df.columns:
+        return pd.Series(np.nan, index=df.index, dtype=float)
+    return pd.to_numeric(df[column], errors="coerce").astype(float)
+
+
+def _sina_history_columns(
+    df: pd.DataFrame,
+    date_strs: Iterable[str],
+    elapsed: float,
+    symbol: str = DEFAULT_SYMBOL,
+) -> Dict[str, Any]:
+    """Vectorised counterpart of ``_sina_history_record`` for many dates: one pass over the frame.
+
+    Returns ``{"contract", "source", "elapsed_seconds", "columns": {"date": [...], field: [...]}}``
+    with NaN for missing values, ready to become typed NumPy columns in the bridge.
+    """
+    wanted = {_parse_date(date_str).date() for date_str in date_strs}
+    settlement = _numeric_column(df, "settlement")
+    close = _numeric_column(df, "close")
+    prev_settlement = settlement.shift(1)
+    divisor = prev_settlement.where(prev_settlement != 0)
+    change = settlement.fillna(close) - divisor
+    values = {
+        "open": _numeric_column(df, "open"),
+        "high": _numeric_column(df, "high"),
+        "low": _numeric_column(df, "low"),
+        "close": close,
+        "settlement": settlement,
+        "prev_settlement": prev_settlement,
+        "change": change,
+        "change_pct": (change / divisor * 100).round(6),
+        "volume": _numeric_column(df, "volume"),
+        "open_interest": _numeric_column(df, "open_interest"),
+    }
+    # Same row choice as the per-date path: the last row of each requested date.
+    selected = (df["date"].isin(wanted) & ~df["date"].duplicated(keep="last")).to_numpy()
+    dates = [value.isoformat() for value in df.loc[selected, "date"]]
+    if len(dates) < len(wanted):
+        LOGGER.warning(
+            "Sina history has no record for %s of %s requested dates",
+            len(wanted) - len(dates),
+            len(wanted),
+            extra=_log_context(HISTORY_LOG_CONTEXT, symbol),
+        )
+    return {
+        "contract": history_contract_name(symbol),
+        "source": "sina_main",
+        "elapsed_seconds": round(float(elapsed), 4),
+        "columns": {"date": dates, **{field: values[field][selected].tolist() for field in HISTORY_VALUE_FIELDS}},
+    }
+
+
+def _fetch_sina_history(date_str: str, symbol: str = DEFAULT_SYMBOL) -> Optional[Dict[str, Optional[Any]]]:
+    """Fetch historical main contract data from Sina for the given date."""
+    _parse_date(date_str)
+    loaded = _load_sina_history(symbol)
+    if loaded is None:
+        return None
+    df, elapsed = loaded
+    return _sina_history_record(df, date_str, elapsed, symbol)
+
+
+def _nonzero_float(value: Any) -> Optional[float]:
+    """Sina reports missing quotes as 0; treat them as absent."""
+    numeric = _coerce_to_float(value)
+    return numeric if numeric not in (None, 0.0) else None
+
+
+def _curve_points(realtime_df: pd.DataFrame, symbol: str = DEFAULT_SYMBOL) -> List[Dict[str, Optional[Any]]]:
+    """Every dated contract of the product in the realtime response, ordered by delivery month."""
+    # Dated contracts (e.g. NI2511); continuous aliases such as NI0 are left out of the curve.
+    contract_month = re.compile(rf"^{_product_prefix(symbol)}\d{{4}}$")
+    symbols = realtime_df["symbol"].astype(str).str.upper()
+    dated = realtime_df[symbols.str.match(contract_month)]
+    points = []
+    for _, row in dated.iterrows():
+        points.append(
+            {
+                "contract": str(row.get("symbol", "")).upper(),
+                "latest_price": _nonzero_float(row.get("trade")),
+                "prev_settlement": _nonzero_float(row.get("presettlement") or row.get("prevsettlement")),
+                "bid": _nonzero_float(row.get("bidprice1") or row.get("bid")),
+                "ask": _nonzero_float(row.get("askprice1") or row.get("ask")),
+                "volume": _coerce_to_float(row.get("volume")),
+                "open_interest": _coerce_to_float(row.get("position")),
+                "tick_time": row.get("ticktime"),
+            }
+        )
+    points.sort(key=lambda point: point["contract"])
+    return points
+
+
+def _fetch_shfe_realtime(date_str: str, symbol: str = DEFAULT_SYMBOL) -> Optional[Dict[str, Optional[Any]]]:
     """Fetch SHFE realtime snapshot via Sina interface."""
     target_date = _parse_date(date_str)
+    log_context = _log_context(REALTIME_LOG_CONTEXT, symbol)
 
     fetch_start = time.perf_counter()
     try:
-        symbol_for_fetch = _SHFE_NI_SYMBOL
-        if symbol_for_fetch is None:
-            symbol_for_fetch = futures_symbol_mark().loc[
-                futures_symbol_mark()["mark"] == "ni_qh", "symbol"
-            ].iloc[0]
-        realtime_df = ak.futures_zh_realtime(symbol=symbol_for_fetch)
+        realtime_df = ak.futures_zh_realtime(symbol=_sina_board(symbol))
     except Exception as exc:
-        print(f"[SHFE realtime] Request failed: {exc}")
+        LOGGER.warning("SHFE realtime request failed: %s", exc, extra=log_context)
         return None
     elapsed = time.perf_counter() - fetch_start
 
     if realtime_df is None or realtime_df.empty:
-        print("[SHFE realtime] Empty response")
+        LOGGER.warning("SHFE realtime empty response", extra=log_context)
         return None
 
-    main_mask = realtime_df["symbol"].str.upper().eq("NI0")
+    main_mask = realtime_df["symbol"].str.upper().eq(symbol.upper())
     row_df = realtime_df[main_mask]
     row = row_df.iloc[0] if not row_df.empty else realtime_df.iloc[0]
 
@@ -401,7 +550,7 @@ def _fetch_shfe_realtime(date_str: str) -> Optional[Dict[str, Optional[Any]]]:
     ask_numeric = _coerce_to_float(ask_candidate)
     ask = ask_numeric if ask_numeric not in (None, 0.0) else None
 
-    return _build_realtime_record(
+    record = _build_realtime_record(
         date_str=str(record_date),
         contract=str(row.get("symbol", "")),
         open_price=open_price,
@@ -421,21 +570,33 @@ def _fetch_shfe_realtime(date_str: str) -> Optional[Dict[str, Optional[Any]]]:
         source="shfe_realtime",
         elapsed_seconds=elapsed,
     )
+    # The same response lists every contract month; keep them instead of refetching per contract.
+    record["curve"] = _curve_points(realtime_df, symbol)
+    return record
 
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def get_realtime_nickel() -> Optional[Dict[str, Optional[Any]]]:
+def get_realtime_nickel(symbol: str = DEFAULT_SYMBOL) -> Optional[Dict[str, Optional[Any]]]:
     """Interface 1: realtime SHFE data for today."""
     today_str = datetime.now().strftime("%Y-%m-%d")
-    return _fetch_shfe_realtime(today_str)
+    return _fetch_shfe_realtime(today_str, symbol)
 
 
-def get_historical_nickel(date_str: str) -> Optional[Dict[str, Optional[Any]]]:
+def get_historical_nickel(date_str: str, symbol: str = DEFAULT_SYMBOL) -> Optional[Dict[str, Optional[Any]]]:
     """Interface 2: historical main contract (Sina) data for the given date."""
-    return _fetch_sina_history(date_str)
+    return _fetch_sina_history(date_str, symbol)
+
+
+def get_historical_nickel_columns(date_strs: Iterable[str], symbol: str = DEFAULT_SYMBOL) -> Optional[Dict[str, Any]]:
+    """Columnar history for several dates from a single Sina download (the bulk backfill path)."""
+    loaded = _load_sina_history(symbol)
+    if loaded is None:
+        return None
+    df, elapsed = loaded
+    return _sina_history_columns(df, date_strs, elapsed, symbol)
 
 
 # ---------------------------------------------------------------------------
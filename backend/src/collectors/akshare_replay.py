@@ -0,0 +1,235 @@
+"""
+Record AkShare responses to local fixtures and replay them offline.
+
+Recording wraps the real AkShare calls made by the collectors and stores every
+returned DataFrame (plus its measured latency) under a fixture directory.
+Replaying serves those frames back with configurable latency and injected
+failures, so collectors, the scheduler and benchmarks run without network.
+
+Usage (settings come from the .env file, not the process environment):
+    # .env: NICKEL_AKSHARE_MODE=record
+    python -m backend.src.tasks.scheduler --once intraday
+    # .env: NICKEL_AKSHARE_MODE=replay
+    python -m backend.src.tasks.scheduler --once intraday
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+LOGGER = logging.getLogger("nickel.collectors.replay")
+
+MANIFEST_NAME = "manifest.json"
+
+# (collector module, attribute) pairs that reach AkShare; "ak" is the module itself.
+PATCH_POINTS = (
+    ("backend.src.collectors.SHFE_data_collection", "ak"),
+    ("backend.src.collectors.SHFE_data_collection", "futures_symbol_mark"),
+    ("backend.src.collectors.lme_data_collection", "ak"),
+)
+
+
+class FixtureMissingError(LookupError):
+    """Raised in replay mode when no recording exists for a call."""
+
+
+class InjectedFailureError(ConnectionError):
+    """Raised in replay mode to simulate an upstream failure."""
+
+
+def call_key(function: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+    """Stable fixture name for one call, e.g. ``futures_zh_realtime-3f2a9c1b``."""
+    signature = json.dumps([list(args), sorted(kwargs.items())], ensure_ascii=False, default=str)
+    return f"{function}-{hashlib.blake2b(signature.encode('utf-8'), digest_size=4).hexdigest()}"
+
+
+class FixtureStore:
+    """Directory of pickled DataFrames plus a ``manifest.json`` describing each recorded call."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        self._manifest: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        if self._manifest is None:
+            path = self.directory / MANIFEST_NAME
+            self._manifest = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+        return self._manifest
+
+    def save(self, function: str, args: Tuple[Any, ...], kwargs: Dict[str, Any], frame: Any, elapsed: float) -> str:
+        key = call_key(function, args, kwargs)
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            pd.to_pickle(frame, self.directory / f"{key}.pkl")
+            manifest = self._load_manifest()
+            manifest[key] = {
+                "function": function,
+                "args": list(args),
+                "kwargs": kwargs,
+                "elapsed_seconds": round(elapsed, 4),
+                "rows": len(frame) if hasattr(frame, "__len__") else None,
+                "recorded_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+            }
+            (self.directory / MANIFEST_NAME).write_text(
+                json.dumps(manifest, ensure_ascii=False, indent=2, default=str), encoding="utf-8"
+            )
+        return key
+
+    def load(self, function: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Tuple[Any, float]:
+        """Return the recorded frame and its recorded latency in seconds."""
+        key = call_key(function, args, kwargs)
+        with self._lock:
+            entry = self._load_manifest().get(key)
+        path = self.directory / f"{key}.pkl"
+        if entry is None or not path.exists():
+            raise FixtureMissingError(f"no recording of {function}{args or ''}{kwargs or ''} in {self.directory}")
+        return pd.read_pickle(path), float(entry.get("elapsed_seconds") or 0.0)
+
+
+class AkShareRecorder:
+    """Calls the real AkShare function and stores whatever it returned."""
+
+    def __init__(self, store: FixtureStore) -> None:
+        self.store = store
+
+    def wrap(self, function: str, real: Optional[Callable[..., Any]]) -> Callable[..., Any]:
+        if real is None:
+            raise AttributeError(f"akshare has no function '{function}'")
+
+        def recorded(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            result = real(*args, **kwargs)
+            elapsed = time.perf_counter() - started
+            if result is not None:
+                key = self.store.save(function, args, kwargs, result, elapsed)
+                LOGGER.info("Recorded %s as %s (%.2fs)", function, key, elapsed)
+            return result
+
+        return recorded
+
+
+class AkShareReplay:
+    """Serves recorded frames with optional latency and failure injection.
+
+    ``latency_scale`` multiplies each recording's own latency (0 replays instantly);
+    ``latency_seconds`` replaces it with a fixed delay. ``failure_rate`` applies to
+    every function unless ``failures`` gives a per-function rate.
+    """
+
+    def __init__(
+        self,
+        store: FixtureStore,
+        latency_scale: float = 1.0,
+        latency_seconds: Optional[float] = None,
+        failure_rate: float = 0.0,
+        failures: Optional[Dict[str, float]] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.store = store
+        self.latency_scale = max(0.0, latency_scale)
+        self.latency_seconds = latency_seconds
+        self.failure_rate = failure_rate
+        self.failures = dict(failures or {})
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _should_fail(self, function: str) -> bool:
+        rate = self.failures.get(function, self.failure_rate)
+        if rate <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < rate
+
+    def wrap(self, function: str, real: Optional[Callable[..., Any]] = None) -> Callable[..., Any]:
+        def replayed(*args: Any, **kwargs: Any) -> Any:
+            frame, recorded_latency = self.store.load(function, args, kwargs)
+            delay = self.latency_seconds if self.latency_seconds is not None else recorded_latency * self.latency_scale
+            if delay > 0:
+                time.sleep(delay)
+            if self._should_fail(function):
+                raise InjectedFailureError(f"injected failure in {function}")
+            return frame.copy() if isinstance(frame, pd.DataFrame) else frame
+
+        return replayed
+
+
+class _AkShareModuleProxy:
+    """Stands in for the ``akshare`` module inside a collector, routing each call through ``source``."""
+
+    def __init__(self, module: Any, source: Any) -> None:
+        self._module = module
+        self._source = source
+
+    def __getattr__(self, name: str) -> Any:
+        return self._source.wrap(name, getattr(self._module, name, None))
+
+
+_ORIGINALS: Dict[Tuple[str, str], Any] = {}
+
+
+def install(source: Any) -> None:
+    """Route every collector's AkShare calls through ``source`` (a recorder or replay)."""
+    for module_name, attribute in PATCH_POINTS:
+        module = importlib.import_module(module_name)
+        original = _ORIGINALS.setdefault((module_name, attribute), getattr(module, attribute))
+        if attribute == "ak":
+            setattr(module, attribute, _AkShareModuleProxy(original, source))
+        else:
+            setattr(module, attribute, source.wrap(attribute, original))
+
+
+def uninstall() -> None:
+    """Restore the real AkShare entry points."""
+    for (module_name, attribute), original in _ORIGINALS.items():
+        setattr(importlib.import_module(module_name), attribute, original)
+    _ORIGINALS.clear()
+
+
+def install_from_settings() -> Optional[str]:
+    """Apply ``NICKEL_AKSHARE_MODE`` in this process (scheduler or fetch worker); returns the active mode."""
+    from backend.src.config import get_settings
+
+    settings = get_settings()
+    mode = str(settings.akshare_mode).lower()
+    if mode == "live":
+        return None
+    store = FixtureStore(Path(settings.akshare_fixture_dir))
+    if mode == "record":
+        install(AkShareRecorder(store))
+    elif mode == "replay":
+        install(
+            AkShareReplay(
+                store,
+                latency_scale=float(settings.replay_latency_scale),
+                failure_rate=float(settings.replay_failure_rate),
+            )
+        )
+    else:
+        raise ValueError(f"Unknown NICKEL_AKSHARE_MODE '{mode}' (expected live, record or replay)")
+    LOGGER.info("AkShare calls in %s mode using %s", mode, store.directory)
+    return mode
+
+
+__all__ = [
+    "FixtureStore",
+    "FixtureMissingError",
+    "InjectedFailureError",
+    "AkShareRecorder",
+    "AkShareReplay",
+    "call_key",
+    "install",
+    "uninstall",
+    "install_from_settings",
+]
@@ -7,6 +7,9 @@ Public interfaces:
     - get_realtime_lme_nickel():   realtime snapshot from LME (via AkShare)
     - get_historical_lme_nickel(date_str): historical daily data for a given date
 
+Both take an optional AkShare foreign-futures symbol (default ``NID``) so other LME metals
+such as ``CAD`` (copper) use the same code path.
+
 When executed as a script:
     * without arguments: tests realtime (today) and historical (2025-10-23)
     * with YYYY-MM-DD argument: fetches only that day's historical data
@@ -16,18 +19,33 @@ from __future__ import annotations
 
 import argparse
 import io
+import logging
+import math
 import sys
 import time
 import numbers
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 import akshare as ak
 import pandas as pd
 import numpy as np
 
 # Force UTF-8 output (AkShare returns Chinese column names)
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+# reconfigure() keeps the same stream, so importing both collectors does not close stdout.
+if isinstance(sys.stdout, io.TextIOWrapper):
+    sys.stdout.reconfigure(encoding="utf-8")
+
+LOGGER = logging.getLogger("nickel.collectors.lme")
+REALTIME_LOG_CONTEXT = {"exchange": "lme", "contract": "NID", "job": "lme_realtime"}
+HISTORY_LOG_CONTEXT = {"exchange": "lme", "contract": "NID", "job": "lme_history"}
+
+DEFAULT_SYMBOL = "NID"
+
+# Numeric fields of the columnar history block (see get_historical_lme_nickel_columns).
+HISTORY_VALUE_FIELDS = ("open", "high", "low", "close", "volume", "open_interest")
+# Contract labels already used in stored daily rows; other symbols are stored as LME_<symbol>.
+HISTORY_CONTRACT_NAMES = {"NID": "LME_Nickel"}
 
 
 # Column names returned by AkShare for the realtime feed (Chinese -> English keywords).
@@ -106,12 +124,13 @@ FIELD_LABELS = {
 
 
 def _coerce_to_float(value: Any) -> Optional[float]:
-    """Convert assorted numeric-like values to float, preserving None."""
+    """Convert assorted numeric-like values to float; None, NaN and blanks become None."""
     if value is None:
         return None
 
     if isinstance(value, numbers.Real) or isinstance(value, np.number):
-        return float(value)
+        number = float(value)
+        return None if math.isnan(number) else number
 
     if isinstance(value, str):
         stripped = value.strip()
@@ -210,21 +229,31 @@ def _build_historical_record(
     }
 
 
-def _fetch_lme_daily_snapshot(date_str: str) -> Dict[str, Optional[float]]:
+def history_contract_name(symbol: str = DEFAULT_SYMBOL) -> str:
+    """Contract label stored with daily records of ``symbol`` (``NID`` -> ``LME_Nickel``)."""
+    return HISTORY_CONTRACT_NAMES.get(symbol.upper(), f"LME_{symbol.upper()}")
+
+
+def _log_context(base: Dict[str, str], symbol: str) -> Dict[str, str]:
+    return base if symbol == DEFAULT_SYMBOL else {**base, "contract": symbol}
+
+
+def _fetch_lme_daily_snapshot(date_str: str, symbol: str = DEFAULT_SYMBOL) -> Dict[str, Optional[float]]:
     """
     Retrieve daily LME stats (volume & settlement proxy) matching the given date.
 
     Uses the historical endpoint so we can surface intraday volume/settlement
     metrics on the realtime card. Returns None when data is unavailable.
     """
+    log_context = _log_context(REALTIME_LOG_CONTEXT, symbol)
     try:
-        hist_df = ak.futures_foreign_hist(symbol="NID")
+        hist_df = ak.futures_foreign_hist(symbol=symbol)
     except Exception as exc:
-        print(f"[LME realtime] Daily stats request failed: {exc}")
+        LOGGER.warning("LME realtime daily stats request failed: %s", exc, extra=log_context)
         return {"volume": None, "close": None, "settlement": None}
 
     if hist_df is None or hist_df.empty:
-        print("[LME realtime] Daily stats empty")
+        LOGGER.warning("LME realtime daily stats empty", extra=log_context)
         return {"volume": None, "close": None, "settlement": None}
 
     df = hist_df.copy()
@@ -283,18 +312,19 @@ def _print_record(label: str, data: Optional[Dict[str, Optional[Any]]], field_or
 # Data fetchers
 # ---------------------------------------------------------------------------
 
-def _fetch_lme_realtime() -> Optional[Dict[str, Optional[float]]]:
-    """Fetch realtime LME nickel data via AkShare."""
+def _fetch_lme_realtime(symbol: str = DEFAULT_SYMBOL) -> Optional[Dict[str, Optional[float]]]:
+    """Fetch realtime LME data for ``symbol`` via AkShare."""
+    log_context = _log_context(REALTIME_LOG_CONTEXT, symbol)
     fetch_start = time.perf_counter()
     try:
-        df = ak.futures_foreign_commodity_realtime(symbol="NID")
+        df = ak.futures_foreign_commodity_realtime(symbol=symbol)
     except Exception as exc:
-        print(f"[LME realtime] Request failed: {exc}")
+        LOGGER.warning("LME realtime request failed: %s", exc, extra=log_context)
         return None
     elapsed = time.perf_counter() - fetch_start
 
     if df is None or df.empty:
-        print("[LME realtime] Empty response")
+        LOGGER.warning("LME realtime empty response", extra=log_context)
         return None
 
     # Normalize column names to English keywords
@@ -308,7 +338,7 @@ def _fetch_lme_realtime() -> Optional[Dict[str, Optional[float]]]:
         date_str = str(date_value) if date_value is not None else datetime.now().strftime("%Y-%m-%d")
 
     # Use daily snapshot to back-fill settlement/volume since realtime feed lacks them.
-    daily_snapshot = _fetch_lme_daily_snapshot(date_str)
+    daily_snapshot = _fetch_lme_daily_snapshot(date_str, symbol)
 
     return _build_realtime_record(
         date_str=date_str,
@@ -331,37 +361,47 @@ def _fetch_lme_realtime() -> Optional[Dict[str, Optional[float]]]:
     )
 
 
-def _fetch_lme_history(date_str: str) -> Optional[Dict[str, Optional[float]]]:
-    """Fetch historical LME nickel data for the given date."""
-    target_date = _parse_date(date_str).date()
-
+def _load_lme_history(symbol: str = DEFAULT_SYMBOL) -> Optional[tuple[pd.DataFrame, float]]:
+    """Download the full LME history of ``symbol`` once."""
+    log_context = _log_context(HISTORY_LOG_CONTEXT, symbol)
     fetch_start = time.perf_counter()
     try:
-        df = ak.futures_foreign_hist(symbol="NID")
+        df = ak.futures_foreign_hist(symbol=symbol)
     except Exception as exc:
-        print(f"[LME history] Request failed: {exc}")
+        LOGGER.warning("LME history request failed: %s", exc, extra=log_context)
         return None
     elapsed = time.perf_counter() - fetch_start
 
     if df is None or df.empty:
-        print("[LME history] Empty response")
+        LOGGER.warning("LME history empty response", extra=log_context)
         return None
 
     df = df.copy()
     if "date" not in df.columns:
-        print("[LME history] Unexpected schema (missing 'date')")
+        LOGGER.warning("LME history unexpected schema (missing 'date')", extra=log_context)
         return None
 
     df["date"] = pd.to_datetime(df["date"], errors="coerce").dt.date
+    return df, elapsed
+
+
+def _lme_history_record(
+    df: pd.DataFrame,
+    date_str: str,
+    elapsed: float,
+    symbol: str = DEFAULT_SYMBOL,
+) -> Optional[Dict[str, Optional[float]]]:
+    """Build the historical record for ``date_str`` from an already downloaded history frame."""
+    target_date = _parse_date(date_str).date()
     day_df = df[df["date"] == target_date]
     if day_df.empty:
-        print(f"[LME history] No record for {date_str}")
+        LOGGER.warning("LME history has no record for %s", date_str, extra=_log_context(HISTORY_LOG_CONTEXT, symbol))
         return None
 
     row = day_df.iloc[-1]
     return _build_historical_record(
         date_str=date_str,
-        contract="LME_Nickel",
+        contract=history_contract_name(symbol),
         open_price=row.get("open"),
         high_price=row.get("high"),
         low_price=row.get("low"),
@@ -374,18 +414,67 @@ def _fetch_lme_history(date_str: str) -> Optional[Dict[str, Optional[float]]]:
     )
 
 
+def _lme_history_columns(
+    df: pd.DataFrame,
+    date_strs: Iterable[str],
+    elapsed: float,
+    symbol: str = DEFAULT_SYMBOL,
+) -> Dict[str, Any]:
+    """Vectorised counterpart of ``_lme_history_record`` for many dates (NaN for missing values)."""
+    wanted = {_parse_date(date_str).date() for date_str in date_strs}
+    selected = (df["date"].isin(wanted) & ~df["date"].duplicated(keep="last")).to_numpy()
+    frame = df[selected].rename(columns={"position": "open_interest"})
+    dates = [value.isoformat() for value in frame["date"]]
+    if len(dates) < len(wanted):
+        LOGGER.warning(
+            "LME history has no record for %s of %s requested dates",
+            len(wanted) - len(dates),
+            len(wanted),
+            extra=_log_context(HISTORY_LOG_CONTEXT, symbol),
+        )
+    columns: Dict[str, List[Any]] = {"date": dates}
+    for field in HISTORY_VALUE_FIELDS:
+        if field in frame.columns:
+            columns[field] = pd.to_numeric(frame[field], errors="coerce").astype(float).tolist()
+    return {
+        "contract": history_contract_name(symbol),
+        "source": "lme_history",
+        "elapsed_seconds": round(float(elapsed), 4),
+        "columns": columns,
+    }
+
+
+def _fetch_lme_history(date_str: str, symbol: str = DEFAULT_SYMBOL) -> Optional[Dict[str, Optional[float]]]:
+    """Fetch historical LME data of ``symbol`` for the given date."""
+    _parse_date(date_str)
+    loaded = _load_lme_history(symbol)
+    if loaded is None:
+        return None
+    df, elapsed = loaded
+    return _lme_history_record(df, date_str, elapsed, symbol)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def get_realtime_lme_nickel() -> Optional[Dict[str, Optional[float]]]:
-    """Realtime interface for LME nickel."""
-    return _fetch_lme_realtime()
+def get_realtime_lme_nickel(symbol: str = DEFAULT_SYMBOL) -> Optional[Dict[str, Optional[float]]]:
+    """Realtime interface for LME nickel (or another LME metal via ``symbol``)."""
+    return _fetch_lme_realtime(symbol)
 
 
-def get_historical_lme_nickel(date_str: str) -> Optional[Dict[str, Optional[float]]]:
-    """Historical interface for LME nickel."""
-    return _fetch_lme_history(date_str)
+def get_historical_lme_nickel(date_str: str, symbol: str = DEFAULT_SYMBOL) -> Optional[Dict[str, Optional[float]]]:
+    """Historical interface for LME nickel (or another LME metal via ``symbol``)."""
+    return _fetch_lme_history(date_str, symbol)
+
+
+def get_historical_lme_nickel_columns(date_strs: Iterable[str], symbol: str = DEFAULT_SYMBOL) -> Optional[Dict[str, Any]]:
+    """Columnar history for several dates from a single download (the bulk backfill path)."""
+    loaded = _load_lme_history(symbol)
+    if loaded is None:
+        return None
+    df, elapsed = loaded
+    return _lme_history_columns(df, date_strs, elapsed, symbol)
 
 
 # ---------------------------------------------------------------------------
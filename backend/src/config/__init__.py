@@ -2,14 +2,22 @@ from __future__ import annotations
 
 from .settings import (
     Settings,
+    get_collector_workers,
     get_daily_run_time,
+    get_dashboard_snapshot_path,
     get_database_url,
+    get_holiday_file,
+    get_instrument_file,
+    get_intraday_heartbeat_seconds,
     get_intraday_interval_seconds,
     get_log_level,
     get_max_retries,
+    get_metrics_dir,
     get_retention_hours,
     get_settings,
 )
+from .sessions import SessionCalendar, get_session_calendar
+from .instruments import Instrument, get_instrument, get_instruments, primary_instrument
 
 __all__ = [
     "Settings",
@@ -18,6 +26,18 @@ __all__ = [
     "get_retention_hours",
     "get_log_level",
     "get_intraday_interval_seconds",
+    "get_intraday_heartbeat_seconds",
+    "get_holiday_file",
+    "get_instrument_file",
+    "get_collector_workers",
     "get_daily_run_time",
     "get_max_retries",
+    "get_metrics_dir",
+    "get_dashboard_snapshot_path",
+    "SessionCalendar",
+    "get_session_calendar",
+    "Instrument",
+    "get_instruments",
+    "get_instrument",
+    "primary_instrument",
 ]
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, fields, replace
+from datetime import tzinfo
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from .sessions import SHANGHAI_TZ
+from .settings import get_daily_run_time, get_instrument_file
+
+LOGGER = logging.getLogger("nickel.config.instruments")
+
+
+@dataclass(frozen=True)
+class Instrument:
+    """One collected instrument: where it trades, which upstream adapter fetches it and when its daily job runs.
+
+    ``key`` prefixes job and source names (``<key>_intraday``, ``<key>_daily``, ``<key>_realtime``),
+    so the built-in ``shfe`` / ``lme`` keys keep the names already stored in the ledger.
+    """
+
+    key: str
+    exchange: str
+    symbol: str
+    adapter: str
+    session: str
+    daily_hour: int
+    daily_minute: int
+    daily_tz: tzinfo = SHANGHAI_TZ
+    enabled: bool = True
+
+
+def _default_instruments() -> Dict[str, Instrument]:
+    """Nickel on SHFE (Sina continuous main contract) and LME (AkShare foreign futures)."""
+    shfe_hour, shfe_minute = get_daily_run_time("shfe")
+    lme_hour, lme_minute = get_daily_run_time("lme")
+    return {
+        "shfe": Instrument("shfe", "shfe", "NI0", "sina_futures", "shfe", shfe_hour, shfe_minute),
+        "lme": Instrument("lme", "lme", "NID", "lme_foreign", "lme", lme_hour, lme_minute),
+    }
+
+
+def _parse_timezone(name: str) -> tzinfo:
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError) as exc:
+        raise ValueError(f"unknown time zone '{name}'") from exc
+
+
+def _instrument_fields(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Translate one file entry into Instrument keyword arguments."""
+    known = {field.name for field in fields(Instrument)}
+    values = {name: value for name, value in entry.items() if name in known and name != "daily_tz"}
+    if "daily_time" in entry:
+        hour, _, minute = str(entry["daily_time"]).partition(":")
+        values["daily_hour"], values["daily_minute"] = int(hour), int(minute or 0)
+    if "timezone" in entry:
+        values["daily_tz"] = _parse_timezone(str(entry["timezone"]))
+    for name in ("exchange", "session"):
+        if name in values:
+            values[name] = str(values[name]).lower()
+    return values
+
+
+def load_instruments(path: Optional[Path]) -> List[Instrument]:
+    """Built-in instruments merged with ``{"instruments": [{"key": ..., ...}]}`` from ``path``.
+
+    Entries with a built-in key override its fields; new keys inherit adapter, session and daily
+    time from the built-in instrument of the same exchange, so ``{"key": "shfe_cu", "exchange":
+    "shfe", "symbol": "CU0"}`` is enough to add SHFE copper. A broken file leaves the defaults.
+    """
+    instruments = _default_instruments()
+    if path is None:
+        return list(instruments.values())
+    if not path.exists():
+        LOGGER.warning("Instrument file %s not found; collecting the built-in instruments only", path)
+        return list(instruments.values())
+    try:
+        entries = json.loads(path.read_text(encoding="utf-8")).get("instruments", [])
+        merged = dict(instruments)
+        for entry in entries:
+            key = str(entry["key"]).lower()
+            values = _instrument_fields(entry)
+            values.pop("key", None)
+            if key in merged:
+                merged[key] = replace(merged[key], **values)
+                continue
+            template = instruments.get(str(values.get("exchange", "")))
+            if template is None:
+                if not {"exchange", "symbol", "adapter", "daily_hour"} <= values.keys():
+                    raise ValueError(f"instrument '{key}' needs exchange, symbol, adapter and daily_time")
+                values.setdefault("session", values["exchange"])
+                merged[key] = Instrument(key=key, **values)
+            else:
+                merged[key] = replace(template, key=key, **values)
+    except (OSError, ValueError, KeyError, AttributeError, TypeError) as exc:
+        LOGGER.error("Failed to load instrument file %s: %s", path, exc)
+        return list(instruments.values())
+    return list(merged.values())
+
+
+@lru_cache()
+def get_instruments() -> List[Instrument]:
+    """Return the cached list of enabled instruments."""
+    return [instrument for instrument in load_instruments(get_instrument_file()) if instrument.enabled]
+
+
+def get_instrument(key: str) -> Instrument:
+    """Look up an enabled instrument by key."""
+    for instrument in get_instruments():
+        if instrument.key == key.lower():
+            return instrument
+    raise ValueError(f"Unknown or disabled instrument: {key}")
+
+
+def primary_instrument(exchange: str) -> Optional[Instrument]:
+    """Instrument readers fall back to when they name none: the exchange's built-in nickel entry
+    (whose key is the exchange), else its first enabled instrument; None if it has none."""
+    exchange = exchange.lower()
+    candidates = [instrument for instrument in get_instruments() if instrument.exchange == exchange]
+    for instrument in candidates:
+        if instrument.key == exchange:
+            return instrument
+    return candidates[0] if candidates else None
+
+
+__all__ = [
+    "Instrument",
+    "load_instruments",
+    "get_instruments",
+    "get_instrument",
+    "primary_instrument",
+]
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from .settings import get_holiday_file
+
+LOGGER = logging.getLogger("nickel.config.sessions")
+
+SHANGHAI_TZ = timezone(timedelta(hours=8), name="Asia/Shanghai")
+# How far ahead next_open() searches; covers the longest SHFE holiday (Spring Festival / National Day).
+MAX_LOOKAHEAD_DAYS = 14
+
+Window = Tuple[time, time]
+
+
+def _london_tz() -> tzinfo:
+    try:
+        return ZoneInfo("Europe/London")
+    except ZoneInfoNotFoundError:  # pragma: no cover - Windows without tzdata
+        LOGGER.warning("Europe/London time zone unavailable (install tzdata); LME sessions fall back to UTC")
+        return timezone.utc
+
+
+@dataclass(frozen=True)
+class ExchangeSessions:
+    """Trading windows of one exchange, expressed in its local time zone.
+
+    ``night`` windows open on the evening of a trading day and may run past midnight;
+    they are skipped when the next weekday is a holiday, as SHFE does before long breaks.
+    """
+
+    tz: tzinfo
+    day: Tuple[Window, ...]
+    night: Tuple[Window, ...] = ()
+    holidays: FrozenSet[date] = field(default_factory=frozenset)
+
+    def is_trading_day(self, day: date) -> bool:
+        return day.weekday() < 5 and day not in self.holidays
+
+    def _has_night_session(self, day: date) -> bool:
+        if not self.night or not self.is_trading_day(day):
+            return False
+        following = day + timedelta(days=1)
+        while following.weekday() >= 5:
+            following += timedelta(days=1)
+        return following not in self.holidays
+
+    def windows_for(self, day: date) -> List[Tuple[datetime, datetime]]:
+        """Timezone-aware (start, end) intervals that open on ``day`` in local time."""
+        windows: List[Tuple[datetime, datetime]] = []
+        if self.is_trading_day(day):
+            windows.extend(self._materialise(day, self.day))
+        if self._has_night_session(day):
+            windows.extend(self._materialise(day, self.night))
+        return windows
+
+    def _materialise(self, day: date, spec: Iterable[Window]) -> List[Tuple[datetime, datetime]]:
+        windows = []
+        for start, end in spec:
+            opened = datetime.combine(day, start, tzinfo=self.tz)
+            closed = datetime.combine(day, end, tzinfo=self.tz)
+            if closed <= opened:
+                closed += timedelta(days=1)
+            windows.append((opened, closed))
+        return windows
+
+
+# Nickel trading hours. SHFE: day session with the 10:15-10:30 and midday breaks plus the
+# 21:00-01:00 night session. LME: LMEselect electronic hours, which cover the ring sessions.
+DEFAULT_SESSIONS: Dict[str, Tuple[tzinfo, Tuple[Window, ...], Tuple[Window, ...]]] = {
+    "shfe": (
+        SHANGHAI_TZ,
+        ((time(9, 0), time(10, 15)), (time(10, 30), time(11, 30)), (time(13, 30), time(15, 0))),
+        ((time(21, 0), time(1, 0)),),
+    ),
+    "lme": (_london_tz(), ((time(1, 0), time(19, 0)),), ()),
+}
+
+
+class SessionCalendar:
+    """Answer "is this exchange trading now?" and "when does it open next?" for the scheduler."""
+
+    def __init__(self, sessions: Dict[str, ExchangeSessions]) -> None:
+        self._sessions = sessions
+
+    @property
+    def exchanges(self) -> List[str]:
+        return list(self._sessions)
+
+    def _get(self, exchange: str) -> ExchangeSessions:
+        try:
+            return self._sessions[exchange.lower()]
+        except KeyError as exc:
+            raise ValueError(f"No trading sessions configured for exchange: {exchange}") from exc
+
+    def local_tz(self, exchange: str) -> tzinfo:
+        """Local time zone the exchange's session windows are defined in."""
+        return self._get(exchange).tz
+
+    def is_trading_day(self, exchange: str, day: date | str) -> bool:
+        if isinstance(day, str):
+            day = date.fromisoformat(day)
+        return self._get(exchange).is_trading_day(day)
+
+    def is_open(self, exchange: str, at: datetime) -> bool:
+        sessions = self._get(exchange)
+        local_day = at.astimezone(sessions.tz).date()
+        # Windows opened yesterday evening may still be running after midnight.
+        for day in (local_day - timedelta(days=1), local_day):
+            if any(start <= at < end for start, end in sessions.windows_for(day)):
+                return True
+        return False
+
+    def next_open(self, exchange: str, at: datetime) -> Optional[datetime]:
+        """Start of the first session after ``at`` (None if nothing opens within the lookahead)."""
+        sessions = self._get(exchange)
+        local_day = at.astimezone(sessions.tz).date()
+        for offset in range(MAX_LOOKAHEAD_DAYS + 1):
+            starts = [start for start, _ in sessions.windows_for(local_day + timedelta(days=offset)) if start > at]
+            if starts:
+                return min(starts)
+        return None
+
+    def trading_days(self, exchange: str, start: date, end: date) -> List[str]:
+        sessions = self._get(exchange)
+        days = (start + timedelta(days=offset) for offset in range((end - start).days + 1))
+        return [day.isoformat() for day in days if sessions.is_trading_day(day)]
+
+
+def load_holidays(path: Optional[Path]) -> Dict[str, FrozenSet[date]]:
+    """Read ``{"shfe": ["YYYY-MM-DD", ...], "lme": [...]}``; a missing or broken file means no holidays."""
+    if path is None or not path.exists():
+        if path is not None:
+            LOGGER.warning("Holiday file %s not found; only weekends are treated as closed", path)
+        return {}
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        return {
+            exchange.lower(): frozenset(date.fromisoformat(value) for value in values)
+            for exchange, values in raw.items()
+            if not exchange.startswith("_")
+        }
+    except (OSError, ValueError, AttributeError, TypeError) as exc:
+        LOGGER.error("Failed to load holiday file %s: %s", path, exc)
+        return {}
+
+
+@lru_cache()
+def get_session_calendar() -> SessionCalendar:
+    """Return the cached calendar built from the default sessions and the configured holiday file."""
+    holidays = load_holidays(get_holiday_file())
+    sessions = {
+        exchange: ExchangeSessions(tz, day, night, holidays.get(exchange, frozenset()))
+        for exchange, (tz, day, night) in DEFAULT_SESSIONS.items()
+    }
+    return SessionCalendar(sessions)
+
+
+__all__ = [
+    "ExchangeSessions",
+    "SessionCalendar",
+    "DEFAULT_SESSIONS",
+    "load_holidays",
+    "get_session_calendar",
+]
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import Literal
+from pathlib import Path
+from typing import Literal, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+BUNDLED_HOLIDAY_FILE = Path(__file__).resolve().parents[2] / "resources" / "calendar" / "holidays.json"
+
+
 class Settings(BaseSettings):
     """Global configuration shared across scheduler, storage, and API.
 
@@ -22,6 +26,18 @@ class Settings(BaseSettings):
     # Interval in seconds between intraday data collection runs
     intraday_interval_seconds: int = 30
 
+    # Slow heartbeat poll interval in seconds while an exchange is outside its trading sessions
+    intraday_heartbeat_seconds: int = 900
+
+    # JSON file listing exchange holidays ({"shfe": ["YYYY-MM-DD", ...], "lme": [...]}); empty uses the bundled file
+    holiday_file: Optional[str] = None
+
+    # JSON file adding or overriding collected instruments ({"instruments": [{"key": "shfe_cu", ...}]})
+    instrument_file: Optional[str] = None
+
+    # Threads fanning a scheduler cycle out over instruments
+    collector_workers: int = 4
+
     # Daily data collection time for SHFE (Shanghai Futures Exchange) — Beijing time
     shfe_daily_hour: int = 15
     shfe_daily_minute: int = 1
@@ -33,9 +49,100 @@ class Settings(BaseSettings):
     # Maximum number of retry attempts for failed operations
     max_retries: int = 1
 
+    # Worker processes that run AkShare calls under hard deadlines (0 runs them in the scheduler process)
+    fetch_workers: int = 2
+
+    # Wall-clock deadline per realtime call and per history download; overrunning workers are killed
+    fetch_timeout_seconds: float = 20.0
+    fetch_history_timeout_seconds: float = 90.0
+
+    # Replace a healthy fetch worker after this many calls or once its RSS reaches this many MB (0 = never)
+    fetch_worker_recycle_calls: int = 0
+    fetch_worker_recycle_rss_mb: float = 0.0
+
+    # Memory sampling of the scheduler: interval (0 disables), tracemalloc frames per allocation (0 = RSS only)
+    # and how many of the fastest-growing allocation sites to log per sample
+    memory_sample_seconds: float = 300.0
+    memory_tracemalloc_frames: int = 0
+    memory_top_allocations: int = 10
+
+    # The scheduler exits for a restart by run_all.py after this many cycles or at this RSS in MB (0 = never)
+    scheduler_recycle_cycles: int = 0
+    scheduler_recycle_rss_mb: float = 0.0
+
+    # AkShare access: "live", "record" (live calls saved as fixtures) or "replay" (fixtures only, offline)
+    akshare_mode: Literal["live", "record", "replay"] = "live"
+    akshare_fixture_dir: str = "storage/akshare_fixtures"
+
+    # Replay only: factor applied to each recorded latency (0 = instant) and share of calls failed on purpose
+    replay_latency_scale: float = 1.0
+    replay_failure_rate: float = 0.0
+
+    # Rate limit per upstream source adapter (e.g. Sina futures, LME foreign futures), on top of the shared one
+    source_rate_per_minute: float = 20.0
+    source_burst: int = 3
+
+    # Shared upstream (AkShare) rate limit across all sources: calls per minute and burst size
+    upstream_rate_per_minute: float = 30.0
+    upstream_burst: int = 5
+
+    # Per-source circuit breaker: consecutive failures before opening, first and maximum open duration
+    breaker_failure_threshold: int = 3
+    breaker_cooldown_seconds: float = 60.0
+    breaker_max_cooldown_seconds: float = 1800.0
+
+    # Average call latency above which a source is treated as degraded and polled more slowly
+    source_slow_call_seconds: float = 10.0
+
     # Logging level for application components
     log_level: Literal["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "NOTSET"] | str = "INFO"
 
+    # Directory where each process exports its Prometheus metrics textfile
+    metrics_dir: str = "logs/metrics"
+
+    # Precomputed /api/v1/dashboard/snapshot body written by the scheduler after each intraday cycle,
+    # and how many recent intraday points each exchange's sparkline carries
+    dashboard_snapshot_path: str = "storage/dashboard_snapshot.json"
+    dashboard_sparkline_points: int = 60
+
+    # Opt-in sampling profiler: output directory, sampling interval, and how many API requests to profile
+    # after startup (0 disables; the scheduler uses --profile N instead)
+    profile_dir: str = "logs/profiles"
+    profile_interval_ms: float = 5.0
+    api_profile_requests: int = 0
+
+    # Span tracing: each process appends Chrome Trace Event JSON to its own file in trace_dir
+    trace_enabled: bool = False
+    trace_dir: str = "logs/traces"
+
+    # API reader pool for blocking sqlite reads of async routes: concurrent reads and reads allowed to
+    # wait for a thread (beyond that requests get 503 + Retry-After)
+    api_reader_threads: int = 8
+    api_reader_queue: int = 64
+
+    # API slow-request log: how many of the slowest requests to keep and the minimum duration to qualify
+    slow_request_capacity: int = 50
+    slow_request_threshold_ms: float = 100.0
+
+    # Log line format for scheduler/storage/collector logs: "text" or one JSON object per line
+    log_format: Literal["text", "json"] = "text"
+
+    # Fraction (0-1) of routine success/cycle log events that are written
+    log_success_sample_rate: float = 1.0
+
+    # Maximum warnings/errors per component per minute (0 disables the limit)
+    log_error_limit_per_minute: int = 30
+
+    # Storage log shipping: records buffered per process before being dropped
+    storage_log_buffer_size: int = 10000
+
+    # Storage log shipping: records per batch and maximum seconds between flushes
+    storage_log_batch_size: int = 256
+    storage_log_flush_seconds: float = 0.5
+
+    # Storage log shipping: which record to drop when the buffer is full ("oldest" or "newest")
+    storage_log_drop_policy: Literal["oldest", "newest"] = "oldest"
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -82,6 +189,30 @@ def get_intraday_interval_seconds() -> int:
     return max(1, int(get_settings().intraday_interval_seconds))
 
 
+def get_intraday_heartbeat_seconds() -> int:
+    """Polling interval used outside trading sessions, never faster than the intraday interval."""
+    return max(get_intraday_interval_seconds(), int(get_settings().intraday_heartbeat_seconds))
+
+
+def get_holiday_file() -> Path:
+    """Holiday calendar consulted by the session calendar."""
+    configured = get_settings().holiday_file
+    if configured:
+        return Path(configured)
+    return BUNDLED_HOLIDAY_FILE
+
+
+def get_instrument_file() -> Optional[Path]:
+    """Optional JSON file extending the built-in instrument list."""
+    configured = get_settings().instrument_file
+    return Path(configured) if configured else None
+
+
+def get_collector_workers() -> int:
+    """Size of the scheduler's collector fan-out pool, clamped to >= 1."""
+    return max(1, int(get_settings().collector_workers))
+
+
 def _clamp_hour_minute(hour: int, minute: int) -> tuple[int, int]:
     hour = max(0, min(23, hour))
     minute = max(0, min(59, minute))
@@ -104,6 +235,16 @@ def get_max_retries() -> int:
     return max(0, int(get_settings().max_retries))
 
 
+def get_metrics_dir() -> Path:
+    """Directory holding per-process metrics textfiles re-exported by the API."""
+    return Path(get_settings().metrics_dir)
+
+
+def get_dashboard_snapshot_path() -> Path:
+    """File holding the precomputed dashboard snapshot served by the API."""
+    return Path(get_settings().dashboard_snapshot_path)
+
+
 __all__ = [
     "Settings",
     "get_settings",
@@ -111,6 +252,12 @@ __all__ = [
     "get_retention_hours",
     "get_log_level",
     "get_intraday_interval_seconds",
+    "get_intraday_heartbeat_seconds",
+    "get_holiday_file",
+    "get_instrument_file",
+    "get_collector_workers",
     "get_daily_run_time",
     "get_max_retries",
+    "get_metrics_dir",
+    "get_dashboard_snapshot_path",
 ]
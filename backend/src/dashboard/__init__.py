@@ -0,0 +1,228 @@
+"""
+Precomputed dashboard snapshot: everything the realtime dashboard's cards need in one response.
+
+After each intraday cycle the scheduler calls ``publish_dashboard_snapshot()``, which reads the
+latest snapshot of each exchange's primary (nickel) instrument, today's price range, the recent
+sparkline points and the derived spreads, and writes the complete JSON body of ``/api/v1/dashboard/snapshot`` (the usual
+``data`` / ``meta`` / ``error`` envelope) atomically to NICKEL_DASHBOARD_SNAPSHOT_PATH. The API
+serves those bytes through ``SnapshotFile``, which re-reads the file only when it changes, so a
+request costs one ``stat``. Until a scheduler has published once the API builds the body itself.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.src.config import (
+    get_dashboard_snapshot_path,
+    get_intraday_interval_seconds,
+    get_retention_hours,
+    get_settings,
+    primary_instrument,
+)
+from backend.src.storage import (
+    CurvePointRecord,
+    StorageError,
+    get_intraday_range,
+    get_latest_curve,
+    get_latest_intraday,
+    list_intraday,
+)
+from backend.src.storage.records import to_iso
+
+LOGGER = logging.getLogger("nickel.dashboard")
+
+EXCHANGES = ("lme", "shfe")
+_PRODUCT_RE = re.compile(r"^[A-Za-z]+")
+
+# Localised labels of the snapshot-specific fields; latest snapshots use the /latest labels.
+SNAPSHOT_LABELS: Dict[str, str] = {
+    "generated_at": "生成时间",
+    "latest": "最新快照",
+    "updated_at": "最近确认时间",
+    "today_range": "今日区间",
+    "quote_date": "行情日期",
+    "low": "最低价",
+    "high": "最高价",
+    "points": "采样点数",
+    "first_at": "首次抓取时间",
+    "last_at": "最近抓取时间",
+    "sparkline": "日内走势",
+    "bid_ask_spread": "买卖价差",
+    "calendar_spreads": "跨期价差",
+    "shfe_lme_ratio": "沪伦比",
+    "intraday_interval_seconds": "采集间隔(秒)",
+    "retention_hours": "日内保留(小时)",
+}
+
+
+def curve_price(point: CurvePointRecord) -> Optional[float]:
+    """Last trade, falling back to the previous settlement for contracts that have not traded yet."""
+    return point.latest_price if point.latest_price is not None else point.prev_settlement
+
+
+def calendar_spreads(points: List[CurvePointRecord]) -> List[Dict[str, Any]]:
+    """Near-minus-far spreads between each pair of consecutive contract months."""
+    spreads = []
+    for near, far in zip(points, points[1:]):
+        near_price, far_price = curve_price(near), curve_price(far)
+        spread = near_price - far_price if near_price is not None and far_price is not None else None
+        spreads.append({"near": near.contract, "far": far.contract, "spread": spread})
+    return spreads
+
+
+def _exchange_snapshot(exchange: str, instrument: Optional[str], sparkline_points: int) -> Optional[Dict[str, Any]]:
+    if instrument is None:
+        return None
+    latest = get_latest_intraday(exchange, instrument=instrument)
+    if latest is None:
+        return None
+    captured_at = to_iso(latest.captured_at)
+    # Same trading day as the latest tick: by quote date when the source reports one, else by UTC day.
+    if latest.quote_date:
+        today = get_intraday_range(exchange, latest.contract, quote_date=latest.quote_date, instrument=instrument)
+    else:
+        today = get_intraday_range(exchange, latest.contract, since=str(captured_at)[:10], instrument=instrument)
+    recent = list_intraday(exchange, limit=sparkline_points, contract=latest.contract, instrument=instrument)
+    product = _PRODUCT_RE.match(latest.contract or "")
+    curve = get_latest_curve(exchange, product=product.group(0)) if product else []
+    bid_ask = latest.ask - latest.bid if latest.ask is not None and latest.bid is not None else None
+    return {
+        "latest": latest.to_api(),
+        "updated_at": latest.last_confirmed_at or captured_at,
+        "today_range": {"quote_date": latest.quote_date, **today},
+        "sparkline": [[to_iso(record.captured_at), record.latest_price] for record in reversed(recent)],
+        "bid_ask_spread": bid_ask,
+        "calendar_spreads": calendar_spreads(curve),
+    }
+
+
+def _instrument_key(exchange: str) -> Optional[str]:
+    instrument = primary_instrument(exchange)
+    return instrument.key if instrument else None
+
+
+def build_dashboard_snapshot(sparkline_points: Optional[int] = None) -> Dict[str, Any]:
+    """The ``/api/v1/dashboard/snapshot`` envelope, read from storage now."""
+    points = sparkline_points or max(1, int(get_settings().dashboard_sparkline_points))
+    instruments = {exchange: _instrument_key(exchange) for exchange in EXCHANGES}
+    exchanges = {exchange: _exchange_snapshot(exchange, instruments[exchange], points) for exchange in EXCHANGES}
+    prices = {exchange: (item or {}).get("latest", {}).get("latest_price") for exchange, item in exchanges.items()}
+    # Only nickel against nickel: the built-in instrument of each exchange (key == exchange) is its
+    # nickel contract; a card that fell back to another product has no meaningful ratio.
+    nickel = all(instruments[exchange] == exchange for exchange in ("shfe", "lme"))
+    ratio = prices["shfe"] / prices["lme"] if nickel and prices["shfe"] is not None and prices["lme"] else None
+    return {
+        "data": {
+            "generated_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+            "intraday_interval_seconds": get_intraday_interval_seconds(),
+            "retention_hours": get_retention_hours(),
+            "exchanges": exchanges,
+            "shfe_lme_ratio": round(ratio, 4) if ratio is not None else None,
+        },
+        "meta": {
+            "labels": SNAPSHOT_LABELS,
+            "exchanges": list(EXCHANGES),
+            "instruments": instruments,
+            "sparkline_points": points,
+        },
+        "error": None,
+    }
+
+
+def render_dashboard_snapshot(sparkline_points: Optional[int] = None) -> bytes:
+    """Compact UTF-8 JSON body of the snapshot, as the API sends it."""
+    body = build_dashboard_snapshot(sparkline_points)
+    return json.dumps(body, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def publish_dashboard_snapshot(path: Optional[Path] = None) -> Optional[Path]:
+    """Atomically write the snapshot for the API; failures are logged and never fail the caller."""
+    path = Path(path or get_dashboard_snapshot_path())
+    try:
+        body = render_dashboard_snapshot()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(body)
+        os.replace(tmp_path, path)
+    except (StorageError, OSError) as exc:
+        LOGGER.warning("Failed to publish dashboard snapshot to %s: %s", path, exc)
+        return None
+    return path
+
+
+@dataclass(frozen=True, slots=True)
+class PublishedSnapshot:
+    """One published snapshot body plus what the API needs besides the bytes."""
+
+    body: bytes
+    etag: str
+    # (exchange, trace_id) of the latest snapshots inside, for capture-to-dashboard latency.
+    traces: Tuple[Tuple[str, str], ...] = ()
+
+    @classmethod
+    def from_body(cls, body: bytes) -> "PublishedSnapshot":
+        try:
+            exchanges = json.loads(body)["data"]["exchanges"]
+            traces = tuple(
+                (exchange, item["latest"]["trace_id"])
+                for exchange, item in exchanges.items()
+                if item and item["latest"].get("trace_id")
+            )
+        except (ValueError, KeyError, TypeError, AttributeError):
+            traces = ()
+        return cls(body, f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"', traces)
+
+
+class SnapshotFile:
+    """The snapshot published by another process, re-read only when the file's mtime or size changes."""
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self._path = path
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._cached: Optional[PublishedSnapshot] = None
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return Path(self._path or get_dashboard_snapshot_path())
+
+    def read(self) -> Optional[PublishedSnapshot]:
+        """The current snapshot, or None while none has been published."""
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            if stamp == self._stamp and self._cached is not None:
+                return self._cached
+        try:
+            cached = PublishedSnapshot.from_body(self.path.read_bytes())
+        except OSError:
+            return None
+        with self._lock:
+            self._stamp, self._cached = stamp, cached
+        return cached
+
+
+__all__ = [
+    "EXCHANGES",
+    "PublishedSnapshot",
+    "SNAPSHOT_LABELS",
+    "SnapshotFile",
+    "build_dashboard_snapshot",
+    "calendar_spreads",
+    "curve_price",
+    "publish_dashboard_snapshot",
+    "render_dashboard_snapshot",
+]
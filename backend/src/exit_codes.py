@@ -0,0 +1,14 @@
+"""
+Process exit codes shared by the scheduler and its supervisor (``run_all.py``).
+
+Kept free of imports so the supervisor can read them without loading the scheduler, pandas or
+AkShare.
+"""
+
+# EX_TEMPFAIL: "try again"; run_all.py restarts a scheduler that exits with it.
+RECYCLE_EXIT_CODE = 75
+
+
+__all__ = [
+    "RECYCLE_EXIT_CODE",
+]
@@ -1,19 +1,198 @@
 from __future__ import annotations
 
+import atexit
 import base64
+import json
 import logging
 import logging.handlers
 import multiprocessing
 import os
 import secrets
+import shutil
+import socket
+import socketserver
+import struct
+import tempfile
 import threading
+import time
+from collections import deque
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from multiprocessing.managers import SyncManager
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
 
 STORAGE_QUEUE_ADDR_ENV = "NICKEL_STORAGE_LOG_QUEUE_ADDR"
 STORAGE_QUEUE_AUTH_ENV = "NICKEL_STORAGE_LOG_QUEUE_AUTH"
+STORAGE_LOG_SOCKET_ENV = "NICKEL_STORAGE_LOG_SOCKET"
+
+# Each shipped batch is a 4-byte big-endian length followed by a JSON array of record dicts.
+_FRAME_HEADER = struct.Struct(">I")
+_SUPPORTS_UNIX_SOCKETS = hasattr(socket, "AF_UNIX")
+
+TEXT_LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+
+# Context fields every structured record carries (null when the caller has no value).
+STRUCTURED_FIELDS = ("exchange", "contract", "job", "duration_ms", "attempt")
+
+# Record ``event`` tags that are routine enough to be sampled.
+SAMPLED_EVENTS = frozenset({"success", "cycle"})
+
+
+class JsonFormatter(logging.Formatter):
+    """Render each record as a single-line JSON object with a fixed set of context fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            payload[field] = getattr(record, field, None)
+        event = getattr(record, "event", None)
+        if event is not None:
+            payload["event"] = event
+        suppressed = getattr(record, "suppressed", None)
+        if suppressed:
+            payload["suppressed"] = suppressed
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class SuccessSampler(logging.Filter):
+    """Keep roughly ``rate`` of the records tagged with a routine ``event``.
+
+    Sampling is deterministic per (logger, job) so every job still surfaces
+    periodically; all other records pass untouched.
+    """
+
+    def __init__(self, rate: float, events: Iterable[str] = SAMPLED_EVENTS) -> None:
+        super().__init__()
+        self.rate = max(0.0, min(1.0, rate))
+        self.events = frozenset(events)
+        self._every = int(round(1.0 / self.rate)) if self.rate > 0 else 0
+        self._counters: Dict[Tuple[str, Any], int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "event", None) not in self.events or self._every == 1:
+            return True
+        if self._every == 0:
+            return False
+        key = (record.name, getattr(record, "job", None))
+        with self._lock:
+            count = self._counters.get(key, 0)
+            self._counters[key] = count + 1
+        return count % self._every == 0
+
+
+class ErrorRateLimiter(logging.Filter):
+    """Allow at most ``limit`` WARNING+ records per component in each ``window`` seconds.
+
+    A component is the logger name plus the record's job (or exchange). The first
+    record let through after a suppressed stretch carries ``suppressed=<count>``.
+    """
+
+    def __init__(self, limit: int, window: float = 60.0) -> None:
+        super().__init__()
+        self.limit = max(0, limit)
+        self.window = window
+        self._state: Dict[Tuple[str, Any], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.limit == 0 or record.levelno < logging.WARNING:
+            return True
+        key = (record.name, getattr(record, "job", None) or getattr(record, "exchange", None))
+        now = time.monotonic()
+        with self._lock:
+            state = self._state.get(key)
+            if state is None or now - state[0] >= self.window:
+                suppressed = int(state[2]) if state else 0
+                state = [now, 0, 0]
+                self._state[key] = state
+            else:
+                suppressed = 0
+            if state[1] >= self.limit:
+                state[2] += 1
+                return False
+            state[1] += 1
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+def build_log_formatter() -> logging.Formatter:
+    """Return the formatter selected by ``NICKEL_LOG_FORMAT`` (text or json)."""
+    from backend.src.config import get_settings
+
+    if str(get_settings().log_format).lower() == "json":
+        return JsonFormatter()
+    return logging.Formatter(TEXT_LOG_FORMAT)
+
+
+def apply_log_policies(target: logging.Filterer) -> None:
+    """Attach the configured success sampler and error rate limiter to a logger or handler once.
+
+    Attach to handlers when records arrive from child loggers: logger-level filters
+    only see records logged on that exact logger.
+    """
+    from backend.src.config import get_settings
+
+    settings = get_settings()
+    if not any(isinstance(existing, SuccessSampler) for existing in target.filters):
+        target.addFilter(SuccessSampler(float(settings.log_success_sample_rate)))
+    if not any(isinstance(existing, ErrorRateLimiter) for existing in target.filters):
+        target.addFilter(ErrorRateLimiter(int(settings.log_error_limit_per_minute)))
+
+
+SCHEDULER_LOG_PATH = Path("logs") / "scheduler.log"
+# Scheduler-side loggers: the scheduler itself and every collector it (or a fetch worker) runs.
+SCHEDULER_LOGGERS = ("nickel.scheduler", "nickel.collectors")
+
+
+def configure_scheduler_logging(rotate: bool = True) -> None:
+    """Send the scheduler and collector loggers to ``logs/scheduler.log`` and stderr.
+
+    Both handlers use the ``NICKEL_LOG_FORMAT`` formatter plus the sampling / rate-limit policies.
+    Only the scheduler process rotates the file; fetch workers pass ``rotate=False`` and get a
+    ``WatchedFileHandler``, which reopens the file after the scheduler has rotated it.
+    """
+    loggers = [logging.getLogger(name) for name in SCHEDULER_LOGGERS]
+    if loggers[0].handlers:
+        return
+    SCHEDULER_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    if rotate:
+        handler: logging.Handler = logging.handlers.TimedRotatingFileHandler(
+            SCHEDULER_LOG_PATH,
+            when="midnight",
+            backupCount=7,
+            encoding="utf-8",
+        )
+    else:
+        handler = logging.handlers.WatchedFileHandler(SCHEDULER_LOG_PATH, encoding="utf-8")
+    formatter = build_log_formatter()
+    handler.setFormatter(formatter)
+    console_handler = logging.StreamHandler()  # defaults to stderr, avoids closed-stdout issues
+    console_handler.setFormatter(formatter)
+    for target in (handler, console_handler):
+        apply_log_policies(target)
+    for logger in loggers:
+        logger.addHandler(handler)
+        logger.addHandler(console_handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+
+def configure_fetch_worker_logging() -> None:
+    """Fetch-worker initialiser: collector records get the scheduler's format, policies and log file."""
+    configure_scheduler_logging(rotate=False)
+
 
 _MANAGED_QUEUE: Optional[multiprocessing.Queue] = None
 
@@ -36,6 +215,188 @@ _StorageQueueManager.register("get_queue", callable=_shared_queue)
 _StorageQueueClient.register("get_queue")
 
 
+class BatchingShipHandler(logging.Handler):
+    """Buffer records locally and ship them in batches over a Unix domain socket.
+
+    ``emit`` only appends to a bounded in-memory buffer; a background thread frames
+    and sends batches, so the logging caller never waits on socket or file I/O.
+    When the buffer is full, records are dropped according to ``drop_policy``
+    ("oldest" evicts the head, "newest" discards the incoming record) and counted;
+    the count is shipped as a warning once the writer catches up.
+    """
+
+    def __init__(
+        self,
+        address: str,
+        capacity: int = 10000,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+        drop_policy: str = "oldest",
+    ) -> None:
+        super().__init__()
+        if drop_policy not in ("oldest", "newest"):
+            raise ValueError(f"Unsupported drop policy: {drop_policy}")
+        self.address = address
+        self.capacity = max(1, capacity)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.01, flush_interval)
+        self.drop_policy = drop_policy
+        self.setFormatter(logging.Formatter("%(message)s"))
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._cond = threading.Condition(threading.Lock())
+        self._closed = False
+        self._sock: Optional[socket.socket] = None
+        self.shipped = 0
+        self.dropped = 0
+        self.send_errors = 0
+        self._reported_dropped = 0
+        self._thread = threading.Thread(target=self._run, name="storage-log-shipper", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _prepare(self, record: logging.LogRecord) -> Dict[str, Any]:
+        """Snapshot a record into a plain dict, folding args and traceback into the message."""
+        data = dict(record.__dict__)
+        data["msg"] = self.format(record)
+        data["args"] = None
+        data["exc_info"] = None
+        data["exc_text"] = None
+        data["stack_info"] = None
+        data.pop("message", None)
+        return data
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            item = self._prepare(record)
+        except Exception:
+            self.handleError(record)
+            return
+        with self._cond:
+            if self._closed:
+                return
+            if len(self._buffer) >= self.capacity:
+                self.dropped += 1
+                if self.drop_policy == "newest":
+                    return
+                self._buffer.popleft()
+            self._buffer.append(item)
+            if len(self._buffer) >= self.batch_size:
+                self._cond.notify()
+
+    def stats(self) -> Dict[str, int]:
+        """Return buffer depth and shipping counters."""
+        with self._cond:
+            return {
+                "buffered": len(self._buffer),
+                "capacity": self.capacity,
+                "shipped": self.shipped,
+                "dropped": self.dropped,
+                "send_errors": self.send_errors,
+            }
+
+    def _next_batch(self) -> Optional[Tuple[List[Dict[str, Any]], int]]:
+        with self._cond:
+            if len(self._buffer) < self.batch_size and not self._closed:
+                self._cond.wait(self.flush_interval)
+            if not self._buffer and self._closed:
+                return None
+            count = min(self.batch_size, len(self._buffer))
+            batch = [self._buffer.popleft() for _ in range(count)]
+            dropped = self.dropped
+        unreported = dropped - self._reported_dropped
+        if unreported:
+            notice = logging.LogRecord(
+                "nickel.logging", logging.WARNING, __file__, 0,
+                "Dropped %s storage log records (buffer full or writer unavailable)", (unreported,), None,
+            )
+            batch.append(self._prepare(notice))
+        return batch, dropped
+
+    def _run(self) -> None:
+        while True:
+            pending = self._next_batch()
+            if pending is None:
+                return
+            batch, dropped = pending
+            if batch and self._send(batch):
+                self._reported_dropped = dropped
+
+    def _connect(self) -> socket.socket:
+        if self._sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(2.0)
+            sock.connect(self.address)
+            self._sock = sock
+        return self._sock
+
+    def _send(self, batch: List[Dict[str, Any]]) -> bool:
+        payload = json.dumps(batch, ensure_ascii=False, default=str).encode("utf-8")
+        try:
+            self._connect().sendall(_FRAME_HEADER.pack(len(payload)) + payload)
+        except OSError:
+            with self._cond:
+                self.send_errors += 1
+                self.dropped += len(batch)
+            if self._sock is not None:
+                self._sock.close()
+                self._sock = None
+            return False
+        with self._cond:
+            self.shipped += len(batch)
+        return True
+
+    def flush(self) -> None:
+        with self._cond:
+            self._cond.notify()
+
+    def close(self) -> None:
+        """Flush what is buffered (bounded wait) and stop the shipping thread."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout=2.0)
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        super().close()
+
+
+class _LogBatchRequestHandler(socketserver.StreamRequestHandler):
+    def _read_exact(self, size: int) -> Optional[bytes]:
+        data = self.rfile.read(size)
+        if len(data) < size:
+            return None
+        return data
+
+    def handle(self) -> None:
+        while True:
+            header = self._read_exact(_FRAME_HEADER.size)
+            if header is None:
+                return
+            (length,) = _FRAME_HEADER.unpack(header)
+            payload = self._read_exact(length)
+            if payload is None:
+                return
+            try:
+                records = json.loads(payload.decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                continue
+            for item in records:
+                self.server.log_queue.put_nowait(logging.makeLogRecord(item))  # type: ignore[attr-defined]
+
+
+if _SUPPORTS_UNIX_SOCKETS:
+
+    class _LogBatchServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+        def __init__(self, address: str, log_queue: multiprocessing.Queue) -> None:
+            self.log_queue = log_queue
+            super().__init__(address, _LogBatchRequestHandler)
+
+
 @dataclass
 class StorageLoggingServer:
     """Encapsulates the lifetime of the shared storage log writer."""
@@ -47,20 +408,33 @@ class StorageLoggingServer:
     listener: logging.handlers.QueueListener
     handler: logging.Handler
     authkey: bytes
+    socket_server: Optional[Any] = None
+    socket_thread: Optional[threading.Thread] = None
+    socket_path: Optional[Path] = None
 
     def env(self) -> Dict[str, str]:
         host, port = self.server.address  # type: ignore[misc]
-        return {
+        env = {
             STORAGE_QUEUE_ADDR_ENV: f"{host}:{port}",
             STORAGE_QUEUE_AUTH_ENV: base64.b64encode(self.authkey).decode("ascii"),
         }
+        if self.socket_path is not None:
+            env[STORAGE_LOG_SOCKET_ENV] = str(self.socket_path)
+        return env
 
     def stop(self) -> None:
         """Stop the listener and shut down the manager cleanly."""
         try:
+            if self.socket_server is not None:
+                self.socket_server.shutdown()
+                self.socket_server.server_close()
+                if self.socket_thread is not None:
+                    self.socket_thread.join(timeout=5)
             self.listener.stop()
         finally:
             self.handler.close()
+            if self.socket_path is not None:
+                shutil.rmtree(self.socket_path.parent, ignore_errors=True)
             try:
                 self.server.stop_event.set()
                 self.server_thread.join(timeout=5)
@@ -90,12 +464,32 @@ def start_storage_logging_server(log_path: Path) -> StorageLoggingServer:
         backupCount=7,
         encoding="utf-8",
     )
-    formatter = logging.Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s")
+    formatter = build_log_formatter()
     handler.setFormatter(formatter)
     listener = logging.handlers.QueueListener(_MANAGED_QUEUE, handler)
     listener.start()
 
-    return StorageLoggingServer(manager, server, server_thread, _MANAGED_QUEUE, listener, handler, authkey)
+    socket_server = None
+    socket_thread = None
+    socket_path = None
+    if _SUPPORTS_UNIX_SOCKETS:
+        socket_path = Path(tempfile.mkdtemp(prefix="nickel-log-")) / "storage.sock"
+        socket_server = _LogBatchServer(str(socket_path), _MANAGED_QUEUE)
+        socket_thread = threading.Thread(target=socket_server.serve_forever, daemon=True)
+        socket_thread.start()
+
+    return StorageLoggingServer(
+        manager,
+        server,
+        server_thread,
+        _MANAGED_QUEUE,
+        listener,
+        handler,
+        authkey,
+        socket_server,
+        socket_thread,
+        socket_path,
+    )
 
 
 def _connect_to_storage_queue() -> Optional[object]:
@@ -127,8 +521,29 @@ def _connect_to_storage_queue() -> Optional[object]:
     return queue
 
 
+def _build_ship_handler(address: str) -> BatchingShipHandler:
+    from backend.src.config import get_settings
+
+    settings = get_settings()
+    return BatchingShipHandler(
+        address,
+        capacity=int(settings.storage_log_buffer_size),
+        batch_size=int(settings.storage_log_batch_size),
+        flush_interval=float(settings.storage_log_flush_seconds),
+        drop_policy=str(settings.storage_log_drop_policy),
+    )
+
+
 def configure_storage_logger(logger: logging.Logger, log_path: Optional[Path] = None) -> None:
-    """Attach either the shared queue handler or a local fallback handler."""
+    """Attach the batching socket shipper, the shared queue handler or a local fallback handler."""
+    apply_log_policies(logger)
+    address = os.environ.get(STORAGE_LOG_SOCKET_ENV)
+    if address and _SUPPORTS_UNIX_SOCKETS:
+        if not any(isinstance(handler, BatchingShipHandler) for handler in logger.handlers):
+            logger.addHandler(_build_ship_handler(address))
+        logger.propagate = False
+        return
+
     queue = _connect_to_storage_queue()
     if queue is not None:
         if not any(isinstance(handler, logging.handlers.QueueHandler) for handler in logger.handlers):
@@ -148,7 +563,7 @@ def configure_storage_logger(logger: logging.Logger, log_path: Optional[Path] =
         backupCount=7,
         encoding="utf-8",
     )
-    formatter = logging.Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s")
+    formatter = build_log_formatter()
     handler.setFormatter(formatter)
     logger.addHandler(handler)
     logger.propagate = False
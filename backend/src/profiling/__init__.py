@@ -0,0 +1,170 @@
+"""
+Opt-in sampling profiler for scheduler cycles and API requests.
+
+A ``ProfileBudget`` profiles the next N units of work (cycles or requests).
+While a unit runs, a sampler thread reads every other thread's stack via
+``sys._current_frames()`` at a fixed interval and counts identical stacks;
+the result is written to ``logs/profiles/`` in the collapsed-stack format read
+by flamegraph.pl, speedscope and inferno (``thread;module.func;... count``).
+
+Sampling (rather than cProfile) covers the collector fan-out and threadpool
+threads as well as the thread that started the unit. Fetch worker processes
+are separate interpreters and are not sampled. Once the budget is spent,
+``profile()`` returns a shared no-op context, so the disabled cost is one
+integer comparison per unit.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from pathlib import Path
+from types import FrameType
+from typing import ContextManager, Iterator, Optional
+
+LOGGER = logging.getLogger("nickel.profiling")
+
+DEFAULT_PROFILE_DIR = "logs/profiles"
+COLLAPSED_SUFFIX = ".collapsed"
+_NO_PROFILE: ContextManager[None] = nullcontext()
+_UNSAFE_LABEL = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def _frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}.{getattr(code, 'co_qualname', code.co_name)}"
+
+
+def collapse_stack(frame: Optional[FrameType], root: str) -> str:
+    """``root;outermost;...;innermost`` for one thread's current stack."""
+    names = []
+    while frame is not None:
+        names.append(_frame_name(frame))
+        frame = frame.f_back
+    names.append(root)
+    return ";".join(reversed(names)).replace(" ", "_")
+
+
+class StackSampler:
+    """Counts the collapsed stacks of all other threads every ``interval`` seconds until stopped."""
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = max(0.0005, interval)
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profiler-sampler", daemon=True)
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident != own:
+                    self.stacks[collapse_stack(frame, names.get(ident, f"thread-{ident}"))] += 1
+            self.samples += 1
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> Counter[str]:
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+
+def write_collapsed(stacks: Counter[str], path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as handle:
+        for stack, count in stacks.most_common():
+            handle.write(f"{stack} {count}\n")
+    return path
+
+
+class ProfileBudget:
+    """Profiles the next ``remaining`` units of work, then turns into a no-op.
+
+    ``exclusive`` skips (without spending budget) units that start while another one is being
+    profiled, which keeps concurrent API requests from sharing one flame graph.
+    """
+
+    def __init__(
+        self,
+        remaining: int = 0,
+        directory: Path | str = DEFAULT_PROFILE_DIR,
+        interval: float = 0.005,
+        exclusive: bool = False,
+    ) -> None:
+        self.remaining = max(0, remaining)
+        self.directory = Path(directory)
+        self.interval = interval
+        self.exclusive = exclusive
+        self._active = 0
+        self._sequence = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def arm(self, count: int, directory: Optional[Path | str] = None, interval: Optional[float] = None) -> None:
+        """Profile the next ``count`` units (0 disables)."""
+        with self._lock:
+            self.remaining = max(0, count)
+            if directory is not None:
+                self.directory = Path(directory)
+            if interval is not None:
+                self.interval = interval
+
+    def profile(self, label: str) -> ContextManager[None]:
+        if self.remaining <= 0:
+            return _NO_PROFILE
+        with self._lock:
+            if self.remaining <= 0 or (self.exclusive and self._active):
+                return _NO_PROFILE
+            self.remaining -= 1
+            self._active += 1
+            sequence = next(self._sequence)
+        return self._profiled(label, sequence)
+
+    @contextmanager
+    def _profiled(self, label: str, sequence: int) -> Iterator[None]:
+        sampler = StackSampler(self.interval)
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            yield
+        finally:
+            stacks = sampler.stop()
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._active -= 1
+            stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+            name = f"{_UNSAFE_LABEL.sub('_', label).strip('_') or 'unit'}-{stamp}-{sequence:03d}{COLLAPSED_SUFFIX}"
+            try:
+                path = write_collapsed(stacks, self.directory / name)
+            except OSError as exc:
+                LOGGER.warning("Failed to write profile %s: %s", name, exc)
+            else:
+                LOGGER.info(
+                    "Profiled %s in %.3fs (%s samples, %s distinct stacks) -> %s",
+                    label,
+                    elapsed,
+                    sampler.samples,
+                    len(stacks),
+                    path,
+                )
+
+
+__all__ = [
+    "COLLAPSED_SUFFIX",
+    "DEFAULT_PROFILE_DIR",
+    "ProfileBudget",
+    "StackSampler",
+    "collapse_stack",
+    "write_collapsed",
+]
@@ -0,0 +1,691 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TypedDict
+
+from backend.src.config import get_database_url, get_log_level, get_retention_hours
+from backend.src.logging import configure_storage_logger
+
+from .records import (
+    CURVE_COLUMNS,
+    DAILY_COLUMNS,
+    INTRADAY_COLUMNS,
+    CurvePointRecord,
+    DailyMarketRecord,
+    IntradaySnapshotRecord,
+    to_iso as _to_iso,
+)
+
+LOGGER = logging.getLogger("nickel.storage")
+configure_storage_logger(LOGGER)
+LOGGER.setLevel(getattr(logging, get_log_level(), logging.INFO))
+
+SQLITE_PREFIX = "sqlite:///"
+
+SOURCE_HEALTH_COLUMNS = (
+    "source",
+    "state",
+    "consecutive_failures",
+    "retry_in_seconds",
+    "cooldown_seconds",
+    "latency_ewma_seconds",
+    "error_rate",
+    "poll_multiplier",
+    "total_calls",
+    "total_failures",
+    "last_error",
+    "last_success_at",
+    "last_failure_at",
+)
+
+JOB_RUN_COLUMNS = (
+    "job",
+    "trigger",
+    "scheduled_at",
+    "started_at",
+    "finished_at",
+    "duration_seconds",
+    "attempts",
+    "rows_written",
+    "status",
+    "error_class",
+    "error_message",
+)
+
+# Columns added after the first release; init_db() adds them to existing databases.
+MIGRATIONS = (
+    ("intraday_snapshots", "last_confirmed_at", "TEXT"),
+    ("intraday_snapshots", "trace_id", "TEXT"),
+    ("intraday_snapshots", "instrument", "TEXT"),
+    ("daily_market_data", "instrument", "TEXT"),
+)
+
+# Run once when the column is added: rows stored before instruments were tagged all came from the
+# built-in instruments, whose keys equal their exchange.
+MIGRATION_BACKFILLS = {
+    ("intraday_snapshots", "instrument"): "UPDATE intraday_snapshots SET instrument = exchange WHERE instrument IS NULL",
+    ("daily_market_data", "instrument"): "UPDATE daily_market_data SET instrument = exchange WHERE instrument IS NULL",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS intraday_snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    captured_at TEXT NOT NULL,
+    exchange TEXT NOT NULL,
+    instrument TEXT,
+    source_detail TEXT NOT NULL,
+    contract TEXT NOT NULL,
+    quote_date TEXT,
+    latest_price REAL,
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL,
+    settlement REAL,
+    prev_settlement REAL,
+    volume REAL,
+    open_interest REAL,
+    bid REAL,
+    ask REAL,
+    change REAL,
+    change_pct REAL,
+    tick_time TEXT,
+    elapsed_seconds REAL,
+    trace_id TEXT,
+    extras TEXT,
+    last_confirmed_at TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_intraday_exchange_captured
+    ON intraday_snapshots (exchange, captured_at);
+
+CREATE TABLE IF NOT EXISTS daily_market_data (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    trade_date TEXT NOT NULL,
+    exchange TEXT NOT NULL,
+    instrument TEXT,
+    source_detail TEXT NOT NULL,
+    contract TEXT NOT NULL,
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL,
+    settlement REAL,
+    prev_settlement REAL,
+    change REAL,
+    change_pct REAL,
+    volume REAL,
+    open_interest REAL,
+    elapsed_seconds REAL,
+    extras TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    UNIQUE (exchange, contract, trade_date, source_detail)
+);
+CREATE INDEX IF NOT EXISTS idx_daily_exchange_trade_date
+    ON daily_market_data (exchange, trade_date);
+
+CREATE TABLE IF NOT EXISTS job_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job TEXT NOT NULL,
+    trigger TEXT NOT NULL,
+    scheduled_at TEXT,
+    started_at TEXT NOT NULL,
+    finished_at TEXT NOT NULL,
+    duration_seconds REAL NOT NULL,
+    attempts INTEGER NOT NULL,
+    rows_written INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    error_class TEXT,
+    error_message TEXT,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_job_runs_job_started
+    ON job_runs (job, started_at);
+CREATE INDEX IF NOT EXISTS idx_job_runs_status_started
+    ON job_runs (status, started_at);
+CREATE INDEX IF NOT EXISTS idx_job_runs_duration
+    ON job_runs (duration_seconds);
+
+CREATE TABLE IF NOT EXISTS curve_snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    captured_at TEXT NOT NULL,
+    exchange TEXT NOT NULL,
+    contract TEXT NOT NULL,
+    latest_price REAL,
+    prev_settlement REAL,
+    bid REAL,
+    ask REAL,
+    volume REAL,
+    open_interest REAL,
+    tick_time TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_curve_exchange_captured
+    ON curve_snapshots (exchange, captured_at);
+
+CREATE TABLE IF NOT EXISTS source_health (
+    source TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    consecutive_failures INTEGER NOT NULL,
+    retry_in_seconds REAL,
+    cooldown_seconds REAL,
+    latency_ewma_seconds REAL,
+    error_rate REAL,
+    poll_multiplier REAL,
+    total_calls INTEGER,
+    total_failures INTEGER,
+    last_error TEXT,
+    last_success_at TEXT,
+    last_failure_at TEXT,
+    updated_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS job_checkpoints (
+    job TEXT NOT NULL,
+    trade_date TEXT NOT NULL,
+    completed_at TEXT NOT NULL,
+    source TEXT NOT NULL,
+    PRIMARY KEY (job, trade_date)
+);
+"""
+
+
+class StorageError(RuntimeError):
+    """Raised when a storage operation fails."""
+
+
+# Every ``job_runs.status`` the scheduler writes; the /ops/jobs filter accepts exactly these.
+# "empty": the collector returned nothing; "error": an unexpected exception; "skipped": the daily
+# slot was already checkpointed or stored; "circuit_open": the source's breaker refused the call.
+JOB_STATUSES = ("success", "failure", "empty", "error", "skipped", "circuit_open")
+
+
+class JobRunPayload(TypedDict, total=False):
+    """One scheduler job execution as recorded in the ``job_runs`` ledger."""
+
+    job: str
+    trigger: str
+    scheduled_at: Optional[datetime | str]
+    started_at: datetime | str
+    finished_at: datetime | str
+    duration_seconds: float
+    attempts: int
+    rows_written: int
+    status: str
+    error_class: Optional[str]
+    error_message: Optional[str]
+
+
+class SourceHealthPayload(TypedDict, total=False):
+    """Circuit breaker and adaptive polling state of one upstream source."""
+
+    source: str
+    state: str
+    consecutive_failures: int
+    retry_in_seconds: float
+    cooldown_seconds: float
+    latency_ewma_seconds: Optional[float]
+    error_rate: float
+    poll_multiplier: float
+    total_calls: int
+    total_failures: int
+    last_error: Optional[str]
+    last_success_at: Optional[datetime | str]
+    last_failure_at: Optional[datetime | str]
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+
+
+def _resolve_sqlite_path(database_url: Optional[str] = None) -> Path:
+    """Translate ``sqlite:///relative/or/absolute.db`` into a filesystem path."""
+    url = database_url or get_database_url()
+    if not url.startswith(SQLITE_PREFIX):
+        raise StorageError(f"Unsupported database URL (only sqlite is implemented): {url}")
+    return Path(url[len(SQLITE_PREFIX):])
+
+
+@contextmanager
+def _connect() -> Iterator[sqlite3.Connection]:
+    """Open a short-lived connection, committing on success and rolling back on error."""
+    path = _resolve_sqlite_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(path, timeout=30)
+    except (OSError, sqlite3.Error) as exc:
+        LOGGER.error("Failed to open database %s: %s", path, exc)
+        raise StorageError(f"Failed to open database {path}: {exc}") from exc
+    conn.row_factory = sqlite3.Row
+    try:
+        yield conn
+        conn.commit()
+    except sqlite3.Error as exc:
+        conn.rollback()
+        raise StorageError(str(exc)) from exc
+    finally:
+        conn.close()
+
+
+def init_db() -> None:
+    """Create tables and indexes if they do not exist yet."""
+    with _connect() as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+        for table, column, column_type in MIGRATIONS:
+            existing = {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+            if column not in existing:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+                backfill = MIGRATION_BACKFILLS.get((table, column))
+                if backfill:
+                    conn.execute(backfill)
+                LOGGER.info("Added column %s.%s", table, column)
+    LOGGER.info("Database ready at %s", _resolve_sqlite_path())
+
+
+def save_intraday_snapshot(record: IntradaySnapshotRecord) -> int:
+    """Insert one realtime snapshot and return its row id."""
+    now = _utc_now()
+    values = record.to_row()
+    columns = ", ".join((*INTRADAY_COLUMNS, "last_confirmed_at", "created_at", "updated_at"))
+    placeholders = ", ".join("?" for _ in range(len(INTRADAY_COLUMNS) + 3))
+    try:
+        with _connect() as conn:
+            cursor = conn.execute(
+                f"INSERT INTO intraday_snapshots ({columns}) VALUES ({placeholders})",
+                (*values, values[0], now, now),
+            )
+            return int(cursor.lastrowid)
+    except StorageError as exc:
+        LOGGER.error("Failed to save intraday snapshot for %s: %s", record.exchange, exc)
+        raise
+
+
+def confirm_intraday_snapshot(row_id: int, confirmed_at: datetime | str) -> bool:
+    """Record that an unchanged tick re-confirmed snapshot ``row_id``; False if the row no longer exists."""
+    try:
+        with _connect() as conn:
+            cursor = conn.execute(
+                "UPDATE intraday_snapshots SET last_confirmed_at = ?, updated_at = ? WHERE id = ?",
+                (_to_iso(confirmed_at), _utc_now(), int(row_id)),
+            )
+            return cursor.rowcount > 0
+    except StorageError as exc:
+        LOGGER.error("Failed to confirm intraday snapshot %s: %s", row_id, exc)
+        raise
+
+
+def _daily_upsert_sql() -> str:
+    columns = ", ".join((*DAILY_COLUMNS, "created_at", "updated_at"))
+    placeholders = ", ".join("?" for _ in range(len(DAILY_COLUMNS) + 2))
+    updates = ", ".join(
+        f"{column} = excluded.{column}"
+        for column in (*DAILY_COLUMNS, "updated_at")
+        if column not in ("exchange", "contract", "trade_date", "source_detail")
+    )
+    return (
+        f"INSERT INTO daily_market_data ({columns}) VALUES ({placeholders}) "
+        f"ON CONFLICT (exchange, contract, trade_date, source_detail) DO UPDATE SET {updates}"
+    )
+
+
+def save_daily_market_data(record: DailyMarketRecord) -> int:
+    """Upsert one daily record keyed by (exchange, contract, trade_date, source_detail)."""
+    now = _utc_now()
+    try:
+        with _connect() as conn:
+            conn.execute(_daily_upsert_sql(), (*record.to_row(), now, now))
+            row = conn.execute(
+                "SELECT id FROM daily_market_data WHERE exchange = ? AND contract = ? AND trade_date = ? AND source_detail = ?",
+                (record.exchange, record.contract, record.trade_date, record.source_detail),
+            ).fetchone()
+            return int(row["id"]) if row else 0
+    except StorageError as exc:
+        LOGGER.error("Failed to save daily data for %s %s: %s", record.exchange, record.trade_date, exc)
+        raise
+
+
+def save_daily_market_data_batch(records: List[DailyMarketRecord]) -> int:
+    """Upsert many daily records in a single transaction and return how many were written."""
+    return save_daily_market_rows([record.to_row() for record in records])
+
+
+def save_daily_market_rows(rows: List[tuple]) -> int:
+    """Upsert pre-built tuples in ``DAILY_COLUMNS`` order (extras already JSON or None) in one transaction.
+
+    This is the bulk path fed by columnar normalisation; values must already be plain
+    Python scalars (None for missing), dates ISO strings.
+    """
+    if not rows:
+        return 0
+    now = _utc_now()
+    try:
+        with _connect() as conn:
+            conn.executemany(_daily_upsert_sql(), [(*row, now, now) for row in rows])
+    except StorageError as exc:
+        LOGGER.error("Failed to save %s daily rows in batch: %s", len(rows), exc)
+        raise
+    LOGGER.info("Upserted %s daily rows in one batch", len(rows))
+    return len(rows)
+
+
+def list_stored_trade_dates(
+    exchanges: List[str],
+    start_date: str,
+    end_date: str,
+    contract: Optional[str] = None,
+) -> Dict[str, set]:
+    """Return the trade dates already stored per exchange (optionally for one contract) within ``[start_date, end_date]``."""
+    stored: Dict[str, set] = {exchange.lower(): set() for exchange in exchanges}
+    if not stored:
+        return stored
+    placeholders = ", ".join("?" for _ in stored)
+    params: List[Any] = [*stored, start_date, end_date]
+    contract_clause = ""
+    if contract:
+        contract_clause = " AND contract = ?"
+        params.append(contract)
+    with _connect() as conn:
+        rows = conn.execute(
+            f"SELECT DISTINCT exchange, trade_date FROM daily_market_data "
+            f"WHERE exchange IN ({placeholders}) AND trade_date BETWEEN ? AND ?{contract_clause}",
+            params,
+        ).fetchall()
+    for row in rows:
+        stored[row["exchange"]].add(row["trade_date"])
+    return stored
+
+
+def _market_filter(exchange: str, contract: Optional[str], instrument: Optional[str]) -> tuple[str, List[Any]]:
+    clauses = ["exchange = ?"]
+    params: List[Any] = [exchange.lower()]
+    if instrument:
+        clauses.append("instrument = ?")
+        params.append(instrument.lower())
+    if contract:
+        clauses.append("contract = ?")
+        params.append(contract)
+    return " AND ".join(clauses), params
+
+
+def get_latest_intraday(
+    exchange: str,
+    contract: Optional[str] = None,
+    instrument: Optional[str] = None,
+) -> Optional[IntradaySnapshotRecord]:
+    """Return the most recent intraday snapshot for ``exchange`` (optionally one instrument / contract), or None."""
+    where, params = _market_filter(exchange, contract, instrument)
+    with _connect() as conn:
+        row = conn.execute(
+            f"SELECT * FROM intraday_snapshots WHERE {where} ORDER BY captured_at DESC, id DESC LIMIT 1",
+            params,
+        ).fetchone()
+    return IntradaySnapshotRecord.from_row(row) if row else None
+
+
+def list_intraday(
+    exchange: str,
+    limit: int = 30,
+    contract: Optional[str] = None,
+    instrument: Optional[str] = None,
+) -> List[IntradaySnapshotRecord]:
+    """Return up to ``limit`` intraday snapshots for ``exchange`` (optionally one instrument / contract), newest first."""
+    where, params = _market_filter(exchange, contract, instrument)
+    with _connect() as conn:
+        rows = conn.execute(
+            f"SELECT * FROM intraday_snapshots WHERE {where} ORDER BY captured_at DESC, id DESC LIMIT ?",
+            (*params, int(limit)),
+        ).fetchall()
+    return [IntradaySnapshotRecord.from_row(row) for row in rows]
+
+
+def get_intraday_range(
+    exchange: str,
+    contract: Optional[str] = None,
+    quote_date: Optional[str] = None,
+    since: Optional[datetime | str] = None,
+    instrument: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Low / high of ``latest_price``, row count and first / last capture time over matching intraday rows."""
+    where, params = _market_filter(exchange, contract, instrument)
+    if quote_date:
+        where += " AND quote_date = ?"
+        params.append(quote_date)
+    if since is not None:
+        where += " AND captured_at >= ?"
+        params.append(_to_iso(since))
+    with _connect() as conn:
+        row = conn.execute(
+            "SELECT MIN(latest_price) AS low, MAX(latest_price) AS high, COUNT(*) AS points, "
+            f"MIN(captured_at) AS first_at, MAX(captured_at) AS last_at FROM intraday_snapshots WHERE {where}",
+            params,
+        ).fetchone()
+    return dict(row)
+
+
+def list_daily(
+    exchange: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    contract: Optional[str] = None,
+    instrument: Optional[str] = None,
+) -> List[DailyMarketRecord]:
+    """Return daily records for ``exchange`` (optionally one instrument / contract) within the optional inclusive date range."""
+    where, params = _market_filter(exchange, contract, instrument)
+    clauses = [where]
+    if start_date:
+        clauses.append("trade_date >= ?")
+        params.append(start_date)
+    if end_date:
+        clauses.append("trade_date <= ?")
+        params.append(end_date)
+    with _connect() as conn:
+        rows = conn.execute(
+            f"SELECT * FROM daily_market_data WHERE {' AND '.join(clauses)} ORDER BY trade_date ASC, contract ASC",
+            params,
+        ).fetchall()
+    return [DailyMarketRecord.from_row(row) for row in rows]
+
+
+def cleanup_intraday(before_timestamp: Optional[datetime] = None, retention_hours: Optional[int] = None) -> int:
+    """Delete intraday snapshots older than the cutoff and return the number removed."""
+    if before_timestamp is None:
+        hours = get_retention_hours() if retention_hours is None else retention_hours
+        before_timestamp = datetime.now(timezone.utc) - timedelta(hours=hours)
+    cutoff = _to_iso(before_timestamp)
+    with _connect() as conn:
+        # Rows still being re-confirmed by unchanged ticks stay, so /latest never goes empty in quiet markets.
+        cursor = conn.execute(
+            "DELETE FROM intraday_snapshots WHERE COALESCE(last_confirmed_at, captured_at) < ?",
+            (cutoff,),
+        )
+        deleted = cursor.rowcount
+        conn.execute("DELETE FROM curve_snapshots WHERE captured_at < ?", (cutoff,))
+    if deleted:
+        LOGGER.info("Removed %s intraday rows last seen before %s", deleted, cutoff)
+    return deleted
+
+
+def save_curve_snapshot(exchange: str, captured_at: datetime | str, points: Iterable[CurvePointRecord]) -> int:
+    """Store every contract month captured in one cycle under a shared ``captured_at``."""
+    columns = ", ".join(CURVE_COLUMNS)
+    placeholders = ", ".join("?" for _ in CURVE_COLUMNS)
+    rows = [point.to_row(exchange, captured_at) for point in points]
+    if not rows:
+        return 0
+    try:
+        with _connect() as conn:
+            conn.executemany(f"INSERT INTO curve_snapshots ({columns}) VALUES ({placeholders})", rows)
+    except StorageError as exc:
+        LOGGER.error("Failed to save %s curve snapshot: %s", exchange, exc)
+        raise
+    return len(rows)
+
+
+def get_latest_curve(exchange: str, product: str = "NI") -> List[CurvePointRecord]:
+    """Return the most recent curve snapshot of ``product`` (contract prefix) on ``exchange``, by contract month."""
+    where = "exchange = ? AND contract LIKE ?"
+    params = (exchange.lower(), f"{product.upper()}%")
+    with _connect() as conn:
+        rows = conn.execute(
+            f"SELECT * FROM curve_snapshots WHERE {where} AND captured_at = "
+            f"(SELECT MAX(captured_at) FROM curve_snapshots WHERE {where}) ORDER BY contract ASC",
+            (*params, *params),
+        ).fetchall()
+    return [CurvePointRecord.from_row(row) for row in rows]
+
+
+def save_job_runs(payloads: List[JobRunPayload]) -> int:
+    """Append scheduler job executions to the ``job_runs`` ledger in one transaction."""
+    if not payloads:
+        return 0
+    now = _utc_now()
+    columns = ", ".join((*JOB_RUN_COLUMNS, "created_at"))
+    placeholders = ", ".join("?" for _ in range(len(JOB_RUN_COLUMNS) + 1))
+    rows = [(*(_to_iso(payload.get(column)) for column in JOB_RUN_COLUMNS), now) for payload in payloads]
+    try:
+        with _connect() as conn:
+            conn.executemany(f"INSERT INTO job_runs ({columns}) VALUES ({placeholders})", rows)
+    except StorageError as exc:
+        LOGGER.error("Failed to record %s job runs: %s", len(payloads), exc)
+        raise
+    return len(rows)
+
+
+def list_job_runs(
+    job: Optional[str] = None,
+    status: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    min_duration: Optional[float] = None,
+    limit: int = 100,
+) -> List[Dict[str, Any]]:
+    """Query the job ledger, newest first, filtered by job, status, start window and duration."""
+    clauses: List[str] = []
+    params: List[Any] = []
+    if job:
+        clauses.append("job = ?")
+        params.append(job)
+    if status:
+        clauses.append("status = ?")
+        params.append(status)
+    if since:
+        clauses.append("started_at >= ?")
+        params.append(since)
+    if until:
+        clauses.append("started_at <= ?")
+        params.append(until)
+    if min_duration is not None:
+        clauses.append("duration_seconds >= ?")
+        params.append(float(min_duration))
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    params.append(int(limit))
+    with _connect() as conn:
+        rows = conn.execute(
+            f"SELECT * FROM job_runs {where} ORDER BY started_at DESC, id DESC LIMIT ?",
+            params,
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def save_source_health(payloads: List[SourceHealthPayload]) -> int:
+    """Replace the stored state of each source in ``payloads``."""
+    if not payloads:
+        return 0
+    now = _utc_now()
+    columns = ", ".join((*SOURCE_HEALTH_COLUMNS, "updated_at"))
+    placeholders = ", ".join("?" for _ in range(len(SOURCE_HEALTH_COLUMNS) + 1))
+    rows = [(*(_to_iso(payload.get(column)) for column in SOURCE_HEALTH_COLUMNS), now) for payload in payloads]
+    with _connect() as conn:
+        conn.executemany(f"INSERT OR REPLACE INTO source_health ({columns}) VALUES ({placeholders})", rows)
+    return len(rows)
+
+
+def list_source_health() -> List[Dict[str, Any]]:
+    """Return the last persisted state of every upstream source."""
+    with _connect() as conn:
+        rows = conn.execute("SELECT * FROM source_health ORDER BY source").fetchall()
+    return [dict(row) for row in rows]
+
+
+def has_daily_market_data(exchange: str, trade_date: str, contract: Optional[str] = None) -> bool:
+    """Return True when a daily row is stored for ``exchange`` (and ``contract`` if given) on ``trade_date``."""
+    query = "SELECT 1 FROM daily_market_data WHERE exchange = ? AND trade_date = ?"
+    params: List[Any] = [exchange.lower(), trade_date]
+    if contract:
+        query += " AND contract = ?"
+        params.append(contract)
+    with _connect() as conn:
+        row = conn.execute(f"{query} LIMIT 1", params).fetchone()
+    return row is not None
+
+
+def save_job_checkpoint(job: str, trade_date: str, source: str = "fetch") -> None:
+    """Mark ``job`` as completed for ``trade_date``; ``source`` tells whether data was fetched or already stored."""
+    with _connect() as conn:
+        conn.execute(
+            "INSERT INTO job_checkpoints (job, trade_date, completed_at, source) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (job, trade_date) DO UPDATE SET completed_at = excluded.completed_at, source = excluded.source",
+            (job, trade_date, _utc_now(), source),
+        )
+
+
+def get_job_checkpoint(job: str, trade_date: str) -> Optional[Dict[str, Any]]:
+    """Return the checkpoint of ``job`` for ``trade_date`` (or None if it has not completed)."""
+    with _connect() as conn:
+        row = conn.execute(
+            "SELECT * FROM job_checkpoints WHERE job = ? AND trade_date = ?",
+            (job, trade_date),
+        ).fetchone()
+    return dict(row) if row else None
+
+
+def get_last_checkpoint(job: str) -> Optional[Dict[str, Any]]:
+    """Return the checkpoint with the latest trade date for ``job``."""
+    with _connect() as conn:
+        row = conn.execute(
+            "SELECT * FROM job_checkpoints WHERE job = ? ORDER BY trade_date DESC LIMIT 1",
+            (job,),
+        ).fetchone()
+    return dict(row) if row else None
+
+
+__all__ = [
+    "StorageError",
+    "INTRADAY_COLUMNS",
+    "DAILY_COLUMNS",
+    "CURVE_COLUMNS",
+    "IntradaySnapshotRecord",
+    "DailyMarketRecord",
+    "CurvePointRecord",
+    "JOB_STATUSES",
+    "JobRunPayload",
+    "SourceHealthPayload",
+    "init_db",
+    "save_intraday_snapshot",
+    "save_curve_snapshot",
+    "get_latest_curve",
+    "confirm_intraday_snapshot",
+    "save_daily_market_data",
+    "save_daily_market_data_batch",
+    "save_daily_market_rows",
+    "list_stored_trade_dates",
+    "get_latest_intraday",
+    "list_intraday",
+    "get_intraday_range",
+    "list_daily",
+    "cleanup_intraday",
+    "save_job_runs",
+    "list_job_runs",
+    "save_source_health",
+    "list_source_health",
+    "has_daily_market_data",
+    "save_job_checkpoint",
+    "get_job_checkpoint",
+    "get_last_checkpoint",
+]
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from operator import attrgetter
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+INTRADAY_COLUMNS = (
+    "captured_at",
+    "exchange",
+    "instrument",
+    "source_detail",
+    "contract",
+    "quote_date",
+    "latest_price",
+    "open",
+    "high",
+    "low",
+    "close",
+    "settlement",
+    "prev_settlement",
+    "volume",
+    "open_interest",
+    "bid",
+    "ask",
+    "change",
+    "change_pct",
+    "tick_time",
+    "elapsed_seconds",
+    "trace_id",
+    "extras",
+)
+
+DAILY_COLUMNS = (
+    "trade_date",
+    "exchange",
+    "instrument",
+    "source_detail",
+    "contract",
+    "open",
+    "high",
+    "low",
+    "close",
+    "settlement",
+    "prev_settlement",
+    "change",
+    "change_pct",
+    "volume",
+    "open_interest",
+    "elapsed_seconds",
+    "extras",
+)
+
+CURVE_COLUMNS = (
+    "captured_at",
+    "exchange",
+    "contract",
+    "latest_price",
+    "prev_settlement",
+    "bid",
+    "ask",
+    "volume",
+    "open_interest",
+    "tick_time",
+)
+
+# Public field order of each record (mirrors the API models in backend.src.api.models).
+INTRADAY_API_FIELDS = (
+    "id",
+    "exchange",
+    "instrument",
+    "contract",
+    "captured_at",
+    "quote_date",
+    "latest_price",
+    "open",
+    "high",
+    "low",
+    "close",
+    "settlement",
+    "prev_settlement",
+    "volume",
+    "open_interest",
+    "bid",
+    "ask",
+    "change",
+    "change_pct",
+    "tick_time",
+    "elapsed_seconds",
+    "trace_id",
+    "last_confirmed_at",
+)
+
+DAILY_API_FIELDS = (
+    "id",
+    "exchange",
+    "instrument",
+    "contract",
+    "trade_date",
+    "open",
+    "high",
+    "low",
+    "close",
+    "settlement",
+    "prev_settlement",
+    "change",
+    "change_pct",
+    "volume",
+    "open_interest",
+    "elapsed_seconds",
+)
+
+CURVE_API_FIELDS = CURVE_COLUMNS[2:]
+
+
+def to_iso(value: Any) -> Any:
+    """Serialise datetimes to ISO8601 (UTC when naive) and pass other values through."""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.isoformat()
+    return value
+
+
+def dump_extras(extras: Any) -> Optional[str]:
+    if not extras:
+        return None
+    return json.dumps(extras, ensure_ascii=False, default=str)
+
+
+def load_extras(raw: Any) -> Optional[Dict[str, Any]]:
+    if not isinstance(raw, str):
+        return raw
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        return None
+
+
+def _row_value(row: sqlite3.Row, keys: frozenset, name: str) -> Any:
+    return row[name] if name in keys else None
+
+
+# attrgetter(*names) builds the whole tuple in C, so to_row()/to_api() cost one call per record.
+_INTRADAY_VALUES = attrgetter(*INTRADAY_COLUMNS[1:-1])
+_INTRADAY_API_VALUES = attrgetter(*INTRADAY_API_FIELDS)
+_DAILY_VALUES = attrgetter(*DAILY_COLUMNS[1:-1])
+_DAILY_API_VALUES = attrgetter(*DAILY_API_FIELDS)
+_CURVE_VALUES = attrgetter(*CURVE_API_FIELDS)
+
+
+@dataclass(frozen=True, slots=True)
+class CurvePointRecord:
+    """One contract month of a term-structure snapshot; ``captured_at`` is only set on reads."""
+
+    contract: str
+    latest_price: Optional[float] = None
+    prev_settlement: Optional[float] = None
+    bid: Optional[float] = None
+    ask: Optional[float] = None
+    volume: Optional[float] = None
+    open_interest: Optional[float] = None
+    tick_time: Optional[str] = None
+    captured_at: Optional[str] = None
+
+    def to_row(self, exchange: str, captured_at: datetime | str) -> tuple:
+        """Values in ``CURVE_COLUMNS`` order."""
+        return (to_iso(captured_at), exchange.lower(), *_CURVE_VALUES(self))
+
+    def to_api(self) -> Dict[str, Any]:
+        return dict(zip(CURVE_API_FIELDS, _CURVE_VALUES(self)))
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "CurvePointRecord":
+        return cls(*(row[name] for name in CURVE_API_FIELDS), captured_at=row["captured_at"])
+
+
+@dataclass(frozen=True, slots=True)
+class IntradaySnapshotRecord:
+    """Realtime snapshot shared by the collectors bridge, storage and API.
+
+    ``extras`` holds only collector fields that have no column of their own (usually none), so a
+    snapshot is stored once rather than next to a JSON copy of itself. ``curve`` rides along to
+    ``curve_snapshots``; ``id`` and ``last_confirmed_at`` are filled when read back from storage.
+    ``trace_id`` links the row to the spans of the job run that captured it (backend.src.tracing).
+    ``instrument`` is the registry key (backend.src.config.instruments) the snapshot was collected
+    for; readers filter on it because one exchange can carry several products.
+    """
+
+    exchange: str
+    source_detail: str
+    contract: str
+    captured_at: datetime | str
+    quote_date: Optional[str] = None
+    latest_price: Optional[float] = None
+    open: Optional[float] = None
+    high: Optional[float] = None
+    low: Optional[float] = None
+    close: Optional[float] = None
+    settlement: Optional[float] = None
+    prev_settlement: Optional[float] = None
+    volume: Optional[float] = None
+    open_interest: Optional[float] = None
+    bid: Optional[float] = None
+    ask: Optional[float] = None
+    change: Optional[float] = None
+    change_pct: Optional[float] = None
+    tick_time: Optional[str] = None
+    elapsed_seconds: Optional[float] = None
+    trace_id: Optional[str] = None
+    instrument: Optional[str] = None
+    extras: Optional[Mapping[str, Any]] = None
+    curve: Tuple[CurvePointRecord, ...] = field(default=(), compare=False)
+    id: Optional[int] = None
+    last_confirmed_at: Optional[str] = None
+
+    def to_row(self) -> tuple:
+        """Values in ``INTRADAY_COLUMNS`` order, ready for ``execute``/``executemany``."""
+        return (to_iso(self.captured_at), *_INTRADAY_VALUES(self), dump_extras(self.extras))
+
+    def to_api(self) -> Dict[str, Any]:
+        """The ``IntradaySnapshot`` JSON shape served by the dashboard API."""
+        values = dict(zip(INTRADAY_API_FIELDS, _INTRADAY_API_VALUES(self)))
+        values["captured_at"] = to_iso(self.captured_at)
+        return values
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "IntradaySnapshotRecord":
+        keys = frozenset(row.keys())
+        values = {name: _row_value(row, keys, name) for name in INTRADAY_COLUMNS}
+        values["extras"] = load_extras(values["extras"])
+        return cls(**values, id=_row_value(row, keys, "id"), last_confirmed_at=_row_value(row, keys, "last_confirmed_at"))
+
+
+@dataclass(frozen=True, slots=True)
+class DailyMarketRecord:
+    """Day-level market record shared by the collectors bridge, storage and API."""
+
+    exchange: str
+    source_detail: str
+    contract: str
+    trade_date: str
+    open: Optional[float] = None
+    high: Optional[float] = None
+    low: Optional[float] = None
+    close: Optional[float] = None
+    settlement: Optional[float] = None
+    prev_settlement: Optional[float] = None
+    change: Optional[float] = None
+    change_pct: Optional[float] = None
+    volume: Optional[float] = None
+    open_interest: Optional[float] = None
+    elapsed_seconds: Optional[float] = None
+    instrument: Optional[str] = None
+    extras: Optional[Mapping[str, Any]] = None
+    id: Optional[int] = None
+
+    def to_row(self) -> tuple:
+        """Values in ``DAILY_COLUMNS`` order (without the created/updated timestamps)."""
+        return (to_iso(self.trade_date), *_DAILY_VALUES(self), dump_extras(self.extras))
+
+    def to_api(self) -> Dict[str, Any]:
+        """The ``DailyRecord`` JSON shape served by the dashboard API."""
+        return dict(zip(DAILY_API_FIELDS, _DAILY_API_VALUES(self)))
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "DailyMarketRecord":
+        keys = frozenset(row.keys())
+        values = {name: _row_value(row, keys, name) for name in DAILY_COLUMNS}
+        values["extras"] = load_extras(values["extras"])
+        return cls(**values, id=_row_value(row, keys, "id"))
+
+
+__all__ = [
+    "INTRADAY_COLUMNS",
+    "DAILY_COLUMNS",
+    "CURVE_COLUMNS",
+    "CurvePointRecord",
+    "IntradaySnapshotRecord",
+    "DailyMarketRecord",
+]
@@ -1,5 +1,5 @@
 from __future__ import annotations
 
-from .scheduler import main, run_daily_cycle, run_forever, run_intraday_cycle
+from .scheduler import main, run_daily_cycle, run_forever, run_intraday_cycle, run_synthetic_load
 
-__all__ = ["main", "run_intraday_cycle", "run_daily_cycle", "run_forever"]
+__all__ = ["main", "run_intraday_cycle", "run_daily_cycle", "run_forever", "run_synthetic_load"]
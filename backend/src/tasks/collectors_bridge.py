@@ -1,26 +1,270 @@
 from __future__ import annotations
 
 import logging
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+import numpy as np
 
 from backend.src.collectors.SHFE_data_collection import (
     get_historical_nickel as get_shfe_historical,
+    get_historical_nickel_columns as get_shfe_historical_columns,
     get_realtime_nickel as get_shfe_realtime,
+    history_contract_name as shfe_history_contract,
 )
 from backend.src.collectors.lme_data_collection import (
     get_historical_lme_nickel,
+    get_historical_lme_nickel_columns,
     get_realtime_lme_nickel,
+    history_contract_name as lme_history_contract,
 )
-from backend.src.storage import DailyMarketPayload, IntradaySnapshotPayload
+from backend.src.config import Instrument, get_settings
+from backend.src.metrics import REGISTRY
+from backend.src.storage import DAILY_COLUMNS, CurvePointRecord, DailyMarketRecord, IntradaySnapshotRecord
+from backend.src.tracing import TRACER, current_trace_id
+
+from .fetch_executor import FetchExecutor, FetchFailedError, FetchTimeoutError
+from .source_health import SOURCE_HEALTH
 
 LOGGER = logging.getLogger("nickel.collectors_bridge")
 
+COLLECTOR_PHASE_DURATION = REGISTRY.histogram(
+    "nickel_collector_phase_seconds",
+    "Collector phase durations: upstream request, DataFrame parsing and payload normalisation.",
+    ("instrument", "kind", "phase"),
+)
+
+PayloadT = TypeVar("PayloadT")
+
+# Collector record keys that map onto a record field; anything else is kept in ``extras``.
+INTRADAY_RECORD_KEYS = frozenset(
+    {
+        "date",
+        "contract",
+        "source",
+        "latest_price",
+        "open",
+        "high",
+        "low",
+        "close",
+        "settlement",
+        "prev_settlement",
+        "volume",
+        "open_interest",
+        "bid",
+        "ask",
+        "change",
+        "change_pct",
+        "tick_time",
+        "elapsed_seconds",
+        "curve",
+    }
+)
+DAILY_RECORD_KEYS = frozenset(
+    {
+        "date",
+        "contract",
+        "source",
+        "open",
+        "high",
+        "low",
+        "close",
+        "settlement",
+        "prev_settlement",
+        "change",
+        "change_pct",
+        "volume",
+        "open_interest",
+        "elapsed_seconds",
+    }
+)
+
+# Numeric daily fields carried as float64 columns by DailyColumns (NaN = missing).
+DAILY_VALUE_FIELDS = (
+    "open",
+    "high",
+    "low",
+    "close",
+    "settlement",
+    "prev_settlement",
+    "change",
+    "change_pct",
+    "volume",
+    "open_interest",
+)
+
+# Modules a fetch worker imports up front so the first call does not pay for akshare/pandas.
+FETCH_WORKER_PRELOAD = (
+    # First, so collector records (import-time ones included) get the scheduler's format and file.
+    "backend.src.logging:configure_fetch_worker_logging",
+    "backend.src.collectors.SHFE_data_collection",
+    "backend.src.collectors.lme_data_collection",
+    # Workers are fresh processes, so NICKEL_AKSHARE_MODE (record / replay) is applied in each one.
+    "backend.src.collectors.akshare_replay:install_from_settings",
+)
+
+_FETCH_EXECUTOR: Optional[FetchExecutor] = None
+
 
 class CollectorError(RuntimeError):
     """Raised when a collector fails."""
 
 
+class SourceUnavailableError(CollectorError):
+    """Raised without touching the network while a source's circuit breaker is open."""
+
+    def __init__(self, source: str, retry_in: float) -> None:
+        super().__init__(f"{source} circuit open, next probe in {retry_in:.0f}s")
+        self.source = source
+        self.retry_in = retry_in
+
+
+@dataclass(frozen=True)
+class SourceAdapter:
+    """Collector functions behind one upstream; each takes the instrument symbol as its last argument."""
+
+    realtime: Callable[..., Optional[dict]]
+    history: Callable[..., Optional[dict]]
+    history_columns: Callable[..., Optional[dict]]
+    history_contract: Callable[[str], str]
+
+
+SOURCE_ADAPTERS: Dict[str, SourceAdapter] = {
+    "sina_futures": SourceAdapter(
+        get_shfe_realtime,
+        get_shfe_historical,
+        get_shfe_historical_columns,
+        shfe_history_contract,
+    ),
+    "lme_foreign": SourceAdapter(
+        get_realtime_lme_nickel,
+        get_historical_lme_nickel,
+        get_historical_lme_nickel_columns,
+        lme_history_contract,
+    ),
+}
+
+
+@dataclass
+class DailyColumns:
+    """Many daily rows of one instrument as typed NumPy columns (the bulk backfill path)."""
+
+    exchange: str
+    contract: str
+    source_detail: str
+    elapsed_seconds: Optional[float]
+    trade_dates: List[str]
+    values: Dict[str, np.ndarray]
+    instrument: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self.trade_dates)
+
+    def rows(self) -> List[tuple]:
+        """Tuples in storage ``DAILY_COLUMNS`` order for ``save_daily_market_rows`` (NaN -> None)."""
+        count = len(self)
+        if not count:
+            return []
+        matrix = np.column_stack([self.values[field] for field in DAILY_VALUE_FIELDS])
+        cells = matrix.astype(object)
+        cells[np.isnan(matrix)] = None
+        by_field: Dict[str, Any] = dict(zip(DAILY_VALUE_FIELDS, cells.T))
+        by_field["trade_date"] = self.trade_dates
+        constants = {
+            "exchange": self.exchange,
+            "instrument": self.instrument,
+            "source_detail": self.source_detail,
+            "contract": self.contract,
+            "elapsed_seconds": self.elapsed_seconds,
+            # Every field is already a column; a per-row copy of the raw record adds nothing here.
+            "extras": None,
+        }
+        columns = [by_field[name] if name in by_field else [constants[name]] * count for name in DAILY_COLUMNS]
+        return list(zip(*columns))
+
+
+def source_name(key: str, kind: str) -> str:
+    """Upstream source a collector call hits for instrument ``key``: realtime quotes or the history endpoint."""
+    return f"{key}_{'realtime' if kind == 'realtime' else 'history'}"
+
+
+def _adapter(instrument: Instrument) -> SourceAdapter:
+    try:
+        return SOURCE_ADAPTERS[instrument.adapter]
+    except KeyError as exc:
+        raise CollectorError(f"{instrument.key}: unknown source adapter '{instrument.adapter}'") from exc
+
+
+def daily_contract(instrument: Instrument) -> str:
+    """Contract label the instrument's daily rows are stored under (e.g. ``NI_main``)."""
+    return _adapter(instrument).history_contract(instrument.symbol)
+
+
+def _fetch_executor() -> Optional[FetchExecutor]:
+    """Lazily start the worker pool; ``NICKEL_FETCH_WORKERS=0`` keeps fetches in-process."""
+    global _FETCH_EXECUTOR
+    workers = int(get_settings().fetch_workers)
+    if workers <= 0:
+        return None
+    if _FETCH_EXECUTOR is None:
+        settings = get_settings()
+        _FETCH_EXECUTOR = FetchExecutor(
+            workers,
+            preload=FETCH_WORKER_PRELOAD,
+            max_calls=int(settings.fetch_worker_recycle_calls),
+            max_rss_mb=float(settings.fetch_worker_recycle_rss_mb),
+        )
+    return _FETCH_EXECUTOR
+
+
+def fetch_worker_memory() -> List[int]:
+    """RSS in bytes of each live fetch worker (empty when fetches run in-process)."""
+    return _FETCH_EXECUTOR.resident_bytes() if _FETCH_EXECUTOR is not None else []
+
+
+def shutdown_fetch_executor() -> None:
+    """Kill the fetch worker processes (called when the scheduler exits)."""
+    global _FETCH_EXECUTOR
+    if _FETCH_EXECUTOR is not None:
+        _FETCH_EXECUTOR.shutdown()
+        _FETCH_EXECUTOR = None
+
+
+def _upstream(kind: str, function: Callable[..., Any], *args: Any) -> Any:
+    """Call a collector function in a killable worker under the configured deadline."""
+    executor = _fetch_executor()
+    if executor is None:
+        return function(*args)
+    settings = get_settings()
+    timeout = settings.fetch_timeout_seconds if kind == "realtime" else settings.fetch_history_timeout_seconds
+    try:
+        return executor.call(f"{function.__module__}:{function.__name__}", args, float(timeout))
+    except (FetchTimeoutError, FetchFailedError) as exc:
+        raise CollectorError(str(exc)) from exc
+
+
+def _guarded_call(instrument: Instrument, kind: str, fetch: Callable[[], PayloadT]) -> PayloadT:
+    """Run an upstream call behind the source's circuit breaker and the adapter / shared rate limits."""
+    source = source_name(instrument.key, kind)
+    retry_in = SOURCE_HEALTH.before_call(source, instrument.adapter)
+    if retry_in is not None:
+        raise SourceUnavailableError(source, retry_in)
+    started = time.perf_counter()
+    result = None
+    error: Optional[str] = None
+    try:
+        result = fetch()
+        return result
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+        raise
+    finally:
+        ok = result is not None
+        SOURCE_HEALTH.record(source, ok, time.perf_counter() - started, error or (None if ok else "empty response"))
+
+
 def _now_utc() -> datetime:
     """Return the current UTC timestamp truncated to whole seconds."""
     return datetime.now(timezone.utc).replace(microsecond=0)
@@ -36,41 +280,97 @@ def _coerce_float(value) -> Optional[float]:
         return None
 
 
-def _prepare_intraday_payload(exchange: str, record: dict) -> IntradaySnapshotPayload:
-    """Normalise realtime collector output into the storage payload schema."""
+def _unmapped_fields(record: dict, mapped: frozenset) -> Optional[Dict[str, Any]]:
+    """Collector fields without a column of their own; None when every field is already mapped."""
+    leftover = {key: value for key, value in record.items() if key not in mapped}
+    return leftover or None
+
+
+def _prepare_intraday_record(exchange: str, record: dict, instrument: Optional[str] = None) -> IntradaySnapshotRecord:
+    """Normalise realtime collector output (and its curve, if any) into a snapshot record."""
     if not record:
         raise CollectorError(f"{exchange} realtime returned empty record")
     contract = record.get("contract") or ""
     if not contract:
         raise CollectorError(f"{exchange} realtime record missing contract")
-    payload: IntradaySnapshotPayload = {
-        "exchange": exchange,
-        "source_detail": record.get("source") or f"{exchange}_realtime",
-        "contract": contract,
-        "captured_at": _now_utc(),
-        "quote_date": record.get("date"),
-        "latest_price": _coerce_float(record.get("latest_price")),
-        "open": _coerce_float(record.get("open")),
-        "high": _coerce_float(record.get("high")),
-        "low": _coerce_float(record.get("low")),
-        "close": _coerce_float(record.get("close")),
-        "settlement": _coerce_float(record.get("settlement")),
-        "prev_settlement": _coerce_float(record.get("prev_settlement")),
-        "volume": _coerce_float(record.get("volume")),
-        "open_interest": _coerce_float(record.get("open_interest")),
-        "bid": _coerce_float(record.get("bid")),
-        "ask": _coerce_float(record.get("ask")),
-        "change": _coerce_float(record.get("change")),
-        "change_pct": _coerce_float(record.get("change_pct")),
-        "tick_time": record.get("tick_time"),
-        "elapsed_seconds": _coerce_float(record.get("elapsed_seconds")),
-        "extras": record,
-    }
-    return payload
+    return IntradaySnapshotRecord(
+        exchange=exchange,
+        instrument=instrument,
+        source_detail=record.get("source") or f"{exchange}_realtime",
+        contract=contract,
+        captured_at=_now_utc(),
+        quote_date=record.get("date"),
+        latest_price=_coerce_float(record.get("latest_price")),
+        open=_coerce_float(record.get("open")),
+        high=_coerce_float(record.get("high")),
+        low=_coerce_float(record.get("low")),
+        close=_coerce_float(record.get("close")),
+        settlement=_coerce_float(record.get("settlement")),
+        prev_settlement=_coerce_float(record.get("prev_settlement")),
+        volume=_coerce_float(record.get("volume")),
+        open_interest=_coerce_float(record.get("open_interest")),
+        bid=_coerce_float(record.get("bid")),
+        ask=_coerce_float(record.get("ask")),
+        change=_coerce_float(record.get("change")),
+        change_pct=_coerce_float(record.get("change_pct")),
+        tick_time=record.get("tick_time"),
+        elapsed_seconds=_coerce_float(record.get("elapsed_seconds")),
+        trace_id=current_trace_id(),
+        extras=_unmapped_fields(record, INTRADAY_RECORD_KEYS),
+        # Stored once, in curve_snapshots, rather than inside the tick row.
+        curve=_prepare_curve_points(record.get("curve")),
+    )
+
 
+def _prepare_curve_points(points: Optional[List[dict]]) -> Tuple[CurvePointRecord, ...]:
+    """Normalise the per-contract rows that ride along with a realtime record."""
+    return tuple(
+        CurvePointRecord(
+            contract=point["contract"],
+            latest_price=_coerce_float(point.get("latest_price")),
+            prev_settlement=_coerce_float(point.get("prev_settlement")),
+            bid=_coerce_float(point.get("bid")),
+            ask=_coerce_float(point.get("ask")),
+            volume=_coerce_float(point.get("volume")),
+            open_interest=_coerce_float(point.get("open_interest")),
+            tick_time=point.get("tick_time"),
+        )
+        for point in points or []
+        if point.get("contract")
+    )
 
-def _prepare_daily_payload(exchange: str, record: dict) -> DailyMarketPayload:
-    """Normalise historical collector output into the storage payload schema."""
+
+def _prepare_daily_columns(exchange: str, block: dict, instrument: Optional[str] = None) -> DailyColumns:
+    """Convert a collector's columnar history block into float64 columns in one pass per field."""
+    columns = block.get("columns") or {}
+    trade_dates = [str(value) for value in columns.get("date") or []]
+    contract = block.get("contract") or ""
+    if trade_dates and not contract:
+        raise CollectorError(f"{exchange} history block missing contract")
+    count = len(trade_dates)
+    values: Dict[str, np.ndarray] = {}
+    for field in DAILY_VALUE_FIELDS:
+        raw = columns.get(field)
+        if raw is None:
+            values[field] = np.full(count, np.nan)
+            continue
+        # None (from JSON) becomes NaN under float64, so blanks need no per-value branching.
+        values[field] = np.asarray(raw, dtype=np.float64)
+        if values[field].shape != (count,):
+            raise CollectorError(f"{exchange} history column '{field}' has {values[field].size} values for {count} dates")
+    return DailyColumns(
+        exchange=exchange,
+        contract=contract,
+        source_detail=block.get("source") or f"{exchange}_history",
+        elapsed_seconds=_coerce_float(block.get("elapsed_seconds")),
+        trade_dates=trade_dates,
+        values=values,
+        instrument=instrument,
+    )
+
+
+def _prepare_daily_record(exchange: str, record: dict, instrument: Optional[str] = None) -> DailyMarketRecord:
+    """Normalise historical collector output into a daily market record."""
     if not record:
         raise CollectorError(f"{exchange} daily returned empty record")
     trade_date = record.get("date")
@@ -79,69 +379,104 @@ def _prepare_daily_payload(exchange: str, record: dict) -> DailyMarketPayload:
     contract = record.get("contract") or ""
     if not contract:
         raise CollectorError(f"{exchange} daily record missing contract")
-    payload: DailyMarketPayload = {
-        "exchange": exchange,
-        "source_detail": record.get("source") or f"{exchange}_history",
-        "contract": contract,
-        "trade_date": trade_date,
-        "open": _coerce_float(record.get("open")),
-        "high": _coerce_float(record.get("high")),
-        "low": _coerce_float(record.get("low")),
-        "close": _coerce_float(record.get("close")),
-        "settlement": _coerce_float(record.get("settlement")),
-        "prev_settlement": _coerce_float(record.get("prev_settlement")),
-        "change": _coerce_float(record.get("change")),
-        "change_pct": _coerce_float(record.get("change_pct")),
-        "volume": _coerce_float(record.get("volume")),
-        "open_interest": _coerce_float(record.get("open_interest")),
-        "elapsed_seconds": _coerce_float(record.get("elapsed_seconds")),
-        "extras": record,
-    }
-    return payload
+    return DailyMarketRecord(
+        exchange=exchange,
+        instrument=instrument,
+        source_detail=record.get("source") or f"{exchange}_history",
+        contract=contract,
+        trade_date=trade_date,
+        open=_coerce_float(record.get("open")),
+        high=_coerce_float(record.get("high")),
+        low=_coerce_float(record.get("low")),
+        close=_coerce_float(record.get("close")),
+        settlement=_coerce_float(record.get("settlement")),
+        prev_settlement=_coerce_float(record.get("prev_settlement")),
+        change=_coerce_float(record.get("change")),
+        change_pct=_coerce_float(record.get("change_pct")),
+        volume=_coerce_float(record.get("volume")),
+        open_interest=_coerce_float(record.get("open_interest")),
+        elapsed_seconds=_coerce_float(record.get("elapsed_seconds")),
+        extras=_unmapped_fields(record, DAILY_RECORD_KEYS),
+    )
 
 
-def collect_lme_realtime() -> IntradaySnapshotPayload:
-    """Fetch LME realtime data and convert it into a storage-ready payload."""
-    record = get_realtime_lme_nickel()
-    if record is None:
-        raise CollectorError("LME realtime returned None")
-    return _prepare_intraday_payload("lme", record)
+def _timed_fetch(instrument: Instrument, kind: str, fetch: Callable[..., Optional[dict]], *args: Any) -> Optional[dict]:
+    """Run a collector call, splitting its time into upstream (elapsed_seconds) and parse phases."""
+    started = time.perf_counter()
+    with TRACER.span(fetch.__name__, instrument=instrument.key, kind=kind):
+        record = _guarded_call(instrument, kind, lambda: _upstream(kind, fetch, *args))
+    total = time.perf_counter() - started
+    upstream = _coerce_float(record.get("elapsed_seconds")) if record else None
+    labels = {"instrument": instrument.key, "kind": kind}
+    if upstream is not None:
+        COLLECTOR_PHASE_DURATION.observe(upstream, phase="upstream", **labels)
+        COLLECTOR_PHASE_DURATION.observe(max(0.0, total - upstream), phase="parse", **labels)
+    else:
+        COLLECTOR_PHASE_DURATION.observe(total, phase="fetch", **labels)
+    return record
 
 
-def collect_shfe_realtime() -> IntradaySnapshotPayload:
-    """Fetch SHFE realtime data and convert it into a storage-ready payload."""
-    record = get_shfe_realtime()
-    if record is None:
-        raise CollectorError("SHFE realtime returned None")
-    return _prepare_intraday_payload("shfe", record)
+def _timed_prepare(
+    instrument: Instrument,
+    kind: str,
+    record: dict,
+    prepare: Callable[..., PayloadT],
+) -> PayloadT:
+    with TRACER.span(prepare.__name__, instrument=instrument.key), COLLECTOR_PHASE_DURATION.time(
+        instrument=instrument.key, kind=kind, phase="normalize"
+    ):
+        return prepare(instrument.exchange, record, instrument=instrument.key)
 
 
-def collect_lme_daily(target_date: Optional[str] = None) -> DailyMarketPayload:
-    """Fetch LME daily data for the provided (or inferred) date and normalise it."""
-    if target_date is None:
-        target_date = (_now_utc() - timedelta(days=1)).date().isoformat()
-    record = get_historical_lme_nickel(target_date)
+def collect_realtime(instrument: Instrument) -> IntradaySnapshotRecord:
+    """Fetch realtime data for ``instrument`` and convert it into a storage-ready record.
+
+    Adapters whose response lists every contract month (Sina futures) also fill ``curve``.
+    """
+    record = _timed_fetch(instrument, "realtime", _adapter(instrument).realtime, instrument.symbol)
     if record is None:
-        raise CollectorError(f"LME history returned None for {target_date}")
-    record.setdefault("date", target_date)
-    return _prepare_daily_payload("lme", record)
+        raise CollectorError(f"{instrument.key} realtime returned None")
+    return _timed_prepare(instrument, "realtime", record, _prepare_intraday_record)
 
 
-def collect_shfe_daily(target_date: Optional[str] = None) -> DailyMarketPayload:
-    """Fetch SHFE daily data for the provided (or inferred) date and normalise it."""
+def collect_daily(instrument: Instrument, target_date: Optional[str] = None) -> DailyMarketRecord:
+    """Fetch daily data for ``instrument`` on the provided (or inferred) date and normalise it."""
     if target_date is None:
         target_date = (_now_utc() - timedelta(days=1)).date().isoformat()
-    record = get_shfe_historical(target_date)
+    record = _timed_fetch(instrument, "daily", _adapter(instrument).history, target_date, instrument.symbol)
     if record is None:
-        raise CollectorError(f"SHFE history returned None for {target_date}")
+        raise CollectorError(f"{instrument.key} history returned None for {target_date}")
     record.setdefault("date", target_date)
-    return _prepare_daily_payload("shfe", record)
+    return _timed_prepare(instrument, "daily", record, _prepare_daily_record)
+
+
+def collect_daily_range(instrument: Instrument, dates: Iterable[str]) -> DailyColumns:
+    """Fetch the instrument's history once and return every requested date that has data as columns."""
+    dates = sorted(dates)
+    fetch_columns = _adapter(instrument).history_columns
+    if not dates:
+        return _prepare_daily_columns(instrument.exchange, {}, instrument=instrument.key)
+    started = time.perf_counter()
+    block = _guarded_call(instrument, "backfill", lambda: _upstream("backfill", fetch_columns, dates, instrument.symbol))
+    labels = {"instrument": instrument.key, "kind": "backfill"}
+    COLLECTOR_PHASE_DURATION.observe(time.perf_counter() - started, phase="fetch", **labels)
+    if block is None:
+        raise CollectorError(f"{instrument.key} history returned None for backfill")
+    with COLLECTOR_PHASE_DURATION.time(phase="normalize", **labels):
+        return _prepare_daily_columns(instrument.exchange, block, instrument=instrument.key)
 
 
 __all__ = [
     "CollectorError",
-    "collect_lme_realtime",
-    "collect_shfe_realtime",
-    "collect_lme_daily",
-    "collect_shfe_daily",
+    "SourceUnavailableError",
+    "SourceAdapter",
+    "SOURCE_ADAPTERS",
+    "DailyColumns",
+    "source_name",
+    "daily_contract",
+    "fetch_worker_memory",
+    "shutdown_fetch_executor",
+    "collect_realtime",
+    "collect_daily",
+    "collect_daily_range",
 ]
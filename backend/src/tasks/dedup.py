@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from operator import attrgetter
+from typing import Dict, Optional, Tuple
+
+from backend.src.metrics import REGISTRY
+from backend.src.storage import IntradaySnapshotRecord, confirm_intraday_snapshot, save_intraday_snapshot
+
+LOGGER = logging.getLogger("nickel.scheduler.dedup")
+
+# Market fields whose change makes a tick worth a new row; captured_at/elapsed_seconds are deliberately excluded.
+FINGERPRINT_FIELDS = (
+    "quote_date",
+    "latest_price",
+    "bid",
+    "ask",
+    "volume",
+    "open_interest",
+    "tick_time",
+)
+_FINGERPRINT_VALUES = attrgetter(*FINGERPRINT_FIELDS)
+
+SNAPSHOT_OUTCOMES = REGISTRY.counter(
+    "nickel_intraday_snapshots_total",
+    "Intraday ticks by outcome: inserted as a new row or confirmed against an unchanged one.",
+    ("exchange", "outcome"),
+)
+DEDUP_RATIO = REGISTRY.gauge(
+    "nickel_intraday_dedup_ratio",
+    "Share of intraday ticks since start that were unchanged and only re-confirmed.",
+    ("exchange",),
+)
+
+
+def fingerprint(record: IntradaySnapshotRecord) -> str:
+    values = _FINGERPRINT_VALUES(record)
+    return hashlib.blake2b(json.dumps(values, default=str).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class IntradayDeduplicator:
+    """Insert a snapshot only when its market fields changed; otherwise bump ``last_confirmed_at``.
+
+    Fingerprints live in memory per (exchange, contract), so the first tick after a restart
+    always inserts and readers never see a gap.
+    """
+
+    def __init__(self) -> None:
+        self._latest: Dict[Tuple[str, str], Tuple[str, int]] = {}
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def save(self, record: IntradaySnapshotRecord) -> int:
+        """Persist ``record`` (or confirm the unchanged row) and return the row id it maps to."""
+        exchange = record.exchange
+        key = (exchange, record.contract)
+        digest = fingerprint(record)
+        with self._lock:
+            previous = self._latest.get(key)
+        if previous is not None and previous[0] == digest:
+            if confirm_intraday_snapshot(previous[1], record.captured_at):
+                self._count(exchange, "confirmed")
+                return previous[1]
+        row_id = save_intraday_snapshot(record)
+        with self._lock:
+            self._latest[key] = (digest, row_id)
+        self._count(exchange, "inserted")
+        return row_id
+
+    def _count(self, exchange: str, outcome: str) -> None:
+        SNAPSHOT_OUTCOMES.inc(exchange=exchange, outcome=outcome)
+        with self._lock:
+            counts = self._counts.setdefault(exchange, {"inserted": 0, "confirmed": 0})
+            counts[outcome] += 1
+            ratio = counts["confirmed"] / (counts["inserted"] + counts["confirmed"])
+        DEDUP_RATIO.set(ratio, exchange=exchange)
+
+    def ratio(self, exchange: Optional[str] = None) -> float:
+        """Fraction of ticks that were deduplicated, for one exchange or overall."""
+        with self._lock:
+            if exchange is None:
+                selected = list(self._counts.values())
+            else:
+                selected = [self._counts[exchange]] if exchange in self._counts else []
+            inserted = sum(counts["inserted"] for counts in selected)
+            confirmed = sum(counts["confirmed"] for counts in selected)
+        total = inserted + confirmed
+        return confirmed / total if total else 0.0
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {exchange: dict(counts) for exchange, counts in self._counts.items()}
+
+
+INTRADAY_DEDUP = IntradayDeduplicator()
+
+
+def save_intraday_deduplicated(record: IntradaySnapshotRecord) -> int:
+    """Drop-in replacement for ``save_intraday_snapshot`` used by the scheduler."""
+    return INTRADAY_DEDUP.save(record)
+
+
+__all__ = [
+    "FINGERPRINT_FIELDS",
+    "IntradayDeduplicator",
+    "INTRADAY_DEDUP",
+    "fingerprint",
+    "save_intraday_deduplicated",
+]
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import atexit
+import datetime as _dt
+import importlib
+import json
+import logging
+import multiprocessing
+import queue
+import threading
+from multiprocessing.connection import Connection
+from typing import Any, Iterable, List, Optional, Sequence, Set, Tuple
+
+from backend.src.metrics import REGISTRY
+
+from .memory import MB, process_rss_bytes
+
+LOGGER = logging.getLogger("nickel.scheduler.fetch")
+
+READY = b"ready"
+# Generous allowance for a fresh worker to import pandas/akshare before its deadline clock starts.
+STARTUP_TIMEOUT_SECONDS = 120.0
+
+FETCH_TIMEOUTS = REGISTRY.counter(
+    "nickel_fetch_timeouts_total", "Upstream calls killed for exceeding their deadline.", ("function",)
+)
+WORKER_RESTARTS = REGISTRY.counter("nickel_fetch_worker_restarts_total", "Fetch worker processes replaced.")
+WORKER_RECYCLES = REGISTRY.counter(
+    "nickel_fetch_worker_recycles_total",
+    "Healthy fetch workers retired by the recycle policy, by reason (calls / rss).",
+    ("reason",),
+)
+
+
+class FetchTimeoutError(TimeoutError):
+    """Raised when an isolated fetch exceeds its wall-clock deadline (the worker is killed)."""
+
+
+class FetchFailedError(RuntimeError):
+    """Raised when the fetch function raised inside the worker or the worker died."""
+
+
+def _to_jsonable(value: Any) -> Any:
+    """json.dumps fallback for numpy / pandas scalars and dates found in collector records."""
+    item = getattr(value, "item", None)
+    if callable(item):
+        return item()
+    if isinstance(value, (_dt.date, _dt.datetime, _dt.time)):
+        return value.isoformat()
+    isoformat = getattr(value, "isoformat", None)
+    if callable(isoformat):
+        return isoformat()
+    return str(value)
+
+
+def _encode(payload: Any) -> bytes:
+    return json.dumps(payload, default=_to_jsonable, separators=(",", ":"), allow_nan=True).encode("utf-8")
+
+
+def _resolve(reference: str):
+    module_name, _, attribute = reference.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def _worker_main(conn: Connection, preload: Sequence[str]) -> None:
+    """Worker loop: requests and results travel as JSON bytes, never pickles.
+
+    ``preload`` entries are modules to import, or ``module:function`` initialisers to call once.
+    """
+    for reference in preload:
+        try:
+            if ":" in reference:
+                _resolve(reference)()
+            else:
+                importlib.import_module(reference)
+        except Exception:  # pragma: no cover - surfaced again on the first call
+            pass
+    conn.send_bytes(READY)
+    while True:
+        try:
+            raw = conn.recv_bytes()
+        except (EOFError, OSError):
+            return
+        request = json.loads(raw)
+        try:
+            value = _resolve(request["function"])(*request.get("args", []))
+            conn.send_bytes(_encode({"ok": True, "value": value}))
+        except Exception as exc:
+            conn.send_bytes(_encode({"ok": False, "error": f"{type(exc).__name__}: {exc}"}))
+
+
+class _Worker:
+    def __init__(self, context, preload: Sequence[str]) -> None:
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, tuple(preload)),
+            name="nickel-fetch-worker",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.ready = False
+        self.calls = 0
+
+    def ensure_ready(self) -> None:
+        if self.ready:
+            return
+        if not self.conn.poll(STARTUP_TIMEOUT_SECONDS) or self.conn.recv_bytes() != READY:
+            raise FetchFailedError("fetch worker failed to start")
+        self.ready = True
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(5)
+        self.conn.close()
+
+
+class FetchExecutor:
+    """Small pool of worker processes that run upstream calls under hard wall-clock deadlines.
+
+    A call that overruns its deadline gets its worker killed and replaced, so a hung socket
+    inside AkShare costs one deadline instead of stalling the scheduler loop. Healthy workers are
+    also replaced after ``max_calls`` calls or once their RSS reaches ``max_rss_mb`` (0 = never),
+    which bounds whatever pandas / AkShare keep alive between calls.
+    """
+
+    def __init__(self, workers: int, preload: Iterable[str] = (), max_calls: int = 0, max_rss_mb: float = 0.0) -> None:
+        self.size = max(1, workers)
+        self.preload = tuple(preload)
+        self.max_calls = max_calls
+        self.max_rss_mb = max_rss_mb
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._workers: Set[_Worker] = set()
+        self._workers_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._started = False
+        self._closed = False
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._started:
+                return
+            for _ in range(self.size):
+                self._idle.put(self._spawn())
+            self._started = True
+            atexit.register(self.shutdown)
+
+    def _spawn(self) -> _Worker:
+        worker = _Worker(self._context, self.preload)
+        with self._workers_lock:
+            self._workers.add(worker)
+        return worker
+
+    def _retire(self, worker: _Worker) -> None:
+        worker.kill()
+        with self._workers_lock:
+            self._workers.discard(worker)
+
+    def _recycle_reason(self, worker: _Worker) -> Optional[str]:
+        if self.max_calls > 0 and worker.calls >= self.max_calls:
+            return "calls"
+        if self.max_rss_mb > 0:
+            rss = process_rss_bytes(worker.process.pid)
+            if rss is not None and rss / MB >= self.max_rss_mb:
+                return "rss"
+        return None
+
+    def resident_bytes(self) -> List[int]:
+        """RSS of every live worker (empty where ``/proc`` is unavailable)."""
+        with self._workers_lock:
+            pids = [worker.process.pid for worker in self._workers]
+        return [rss for rss in (process_rss_bytes(pid) for pid in pids) if rss is not None]
+
+    def call(self, function: str, args: Tuple[Any, ...] = (), timeout: float = 30.0) -> Any:
+        """Run ``module:function`` with JSON-serialisable ``args`` in a worker and return its JSON result."""
+        if self._closed:
+            raise FetchFailedError("fetch executor is shut down")
+        self._start()
+        worker = self._idle.get()
+        healthy = False
+        try:
+            worker.ensure_ready()
+            worker.conn.send_bytes(_encode({"function": function, "args": list(args)}))
+            if not worker.conn.poll(timeout):
+                FETCH_TIMEOUTS.inc(function=function)
+                LOGGER.warning("%s exceeded %.0fs deadline, killing worker", function, timeout)
+                raise FetchTimeoutError(f"{function} exceeded {timeout:.0f}s deadline")
+            response = json.loads(worker.conn.recv_bytes())
+            worker.calls += 1
+            healthy = True
+        except FetchTimeoutError:
+            # TimeoutError is an OSError subclass; keep it from being reported as a dead worker.
+            raise
+        except (EOFError, OSError) as exc:
+            raise FetchFailedError(f"fetch worker died during {function}: {exc}") from exc
+        finally:
+            self._release(worker, healthy)
+        if not response.get("ok"):
+            raise FetchFailedError(response.get("error") or f"{function} failed")
+        return response.get("value")
+
+    def _release(self, worker: _Worker, healthy: bool) -> None:
+        if healthy and not self._closed:
+            reason = self._recycle_reason(worker)
+            if reason is None:
+                self._idle.put(worker)
+                return
+            WORKER_RECYCLES.inc(reason=reason)
+            LOGGER.info("Recycling fetch worker %s after %s calls (%s limit)", worker.process.pid, worker.calls, reason)
+        elif not self._closed:
+            WORKER_RESTARTS.inc()
+        self._retire(worker)
+        if not self._closed:
+            self._idle.put(self._spawn())
+
+    def shutdown(self) -> None:
+        """Kill every idle worker; in-flight calls release theirs as they finish."""
+        self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._retire(worker)
+
+
+__all__ = [
+    "FetchExecutor",
+    "FetchTimeoutError",
+    "FetchFailedError",
+]
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import threading
+from datetime import datetime
+from typing import List, Optional
+
+from backend.src.storage import JOB_STATUSES, JobRunPayload, StorageError, save_job_runs
+
+LOGGER = logging.getLogger("nickel.scheduler.ledger")
+
+_STOP = object()
+
+
+class JobLedger:
+    """Write ``job_runs`` rows from a background thread so collectors never wait on the ledger."""
+
+    def __init__(self, capacity: int = 1000, batch_size: int = 50) -> None:
+        self._queue: "queue.Queue[object]" = queue.Queue(maxsize=capacity)
+        self._batch_size = batch_size
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="job-ledger", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+
+    def record(
+        self,
+        job: str,
+        trigger: str,
+        scheduled_at: Optional[datetime],
+        started_at: datetime,
+        finished_at: datetime,
+        attempts: int,
+        rows_written: int,
+        status: str,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Queue one job execution; drops (and counts) the entry if the writer has fallen behind."""
+        if status not in JOB_STATUSES:
+            LOGGER.error("Job %s recorded unknown status %r; add it to storage.JOB_STATUSES", job, status)
+        payload: JobRunPayload = {
+            "job": job,
+            "trigger": trigger,
+            "scheduled_at": scheduled_at,
+            "started_at": started_at,
+            "finished_at": finished_at,
+            "duration_seconds": round((finished_at - started_at).total_seconds(), 3),
+            "attempts": attempts,
+            "rows_written": rows_written,
+            "status": status,
+            "error_class": type(error).__name__ if error is not None else None,
+            "error_message": str(error)[:500] if error is not None else None,
+        }
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(payload)
+        except queue.Full:
+            self.dropped += 1
+            LOGGER.warning("Job ledger queue full, dropped run of %s", job, extra={"job": job})
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            stopping = item is _STOP
+            batch: List[JobRunPayload] = [] if stopping else [item]  # type: ignore[list-item]
+            while len(batch) < self._batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    continue
+                batch.append(item)  # type: ignore[arg-type]
+            if batch:
+                try:
+                    save_job_runs(batch)
+                except StorageError as exc:
+                    LOGGER.error("Failed to persist %s job runs: %s", len(batch), exc)
+            if stopping and self._queue.empty():
+                return
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush pending entries and stop the writer thread."""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout)
+
+
+JOB_LEDGER = JobLedger()
+
+
+__all__ = ["JobLedger", "JOB_LEDGER"]
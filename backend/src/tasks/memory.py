@@ -0,0 +1,146 @@
+"""
+Memory footprint sampling and the recycle policy of the long-running scheduler.
+
+``MemoryMonitor`` samples the resident set size of the scheduler and its fetch workers every
+``sample_seconds`` (checked after each cycle) and, when ``tracemalloc_frames`` > 0, the Python
+allocations that grew most since the previous sample. Samples go to the scheduler log and the
+``nickel_memory_*`` gauges. RSS is read from ``/proc`` and is unavailable elsewhere (the
+tracemalloc side still works there).
+
+Memory that only a restart returns (pandas / AkShare caches, allocator fragmentation) is bounded
+by recycling: fetch workers are replaced after N calls or M MB (see ``FetchExecutor``), and the
+scheduler itself exits with ``RECYCLE_EXIT_CODE`` after N cycles or M MB so ``run_all.py``
+starts a fresh one; missed daily slots are caught up on restart.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from backend.src.exit_codes import RECYCLE_EXIT_CODE
+from backend.src.metrics import REGISTRY
+
+LOGGER = logging.getLogger("nickel.scheduler.memory")
+
+MB = 1024 * 1024
+
+RESIDENT_BYTES = REGISTRY.gauge(
+    "nickel_memory_resident_bytes",
+    "Resident set size of the scheduler and of all its fetch workers together.",
+    ("process",),
+)
+TRACED_BYTES = REGISTRY.gauge(
+    "nickel_memory_traced_bytes",
+    "Python heap traced by tracemalloc in the scheduler (only while NICKEL_MEMORY_TRACEMALLOC_FRAMES > 0).",
+)
+
+try:
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):  # pragma: no cover - non-POSIX
+    _PAGE_SIZE = 4096
+
+
+def process_rss_bytes(pid: Optional[int] = None) -> Optional[int]:
+    """Resident set size of ``pid`` (default: this process), or None where ``/proc`` is unavailable."""
+    try:
+        fields = Path(f"/proc/{pid or 'self'}/statm").read_text().split()
+        return int(fields[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def _format_stat(stat: tracemalloc.StatisticDiff) -> str:
+    frame = stat.traceback[0]
+    return f"{frame.filename}:{frame.lineno} {stat.size_diff / 1024:+.1f} KiB ({stat.size / 1024:.1f} KiB, {stat.count} blocks)"
+
+
+class MemoryMonitor:
+    """Periodic RSS / tracemalloc sampler that also decides when the scheduler should recycle itself."""
+
+    def __init__(
+        self,
+        sample_seconds: float = 0.0,
+        tracemalloc_frames: int = 0,
+        top: int = 10,
+        recycle_cycles: int = 0,
+        recycle_rss_mb: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.sample_seconds = sample_seconds
+        self.tracemalloc_frames = tracemalloc_frames
+        self.top = top
+        self.recycle_cycles = recycle_cycles
+        self.recycle_rss_mb = recycle_rss_mb
+        self.cycles = 0
+        self._clock = clock
+        self._next_sample = clock()
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+
+    def configure(self, **settings: Any) -> None:
+        for name, value in settings.items():
+            setattr(self, name, value)
+        if self.tracemalloc_frames > 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(self.tracemalloc_frames)
+            LOGGER.info("tracemalloc started (%s frames per allocation)", self.tracemalloc_frames)
+        self._next_sample = self._clock()
+
+    def after_cycle(self, workers: Callable[[], List[int]] = list) -> None:
+        """Count a finished cycle and take a sample when one is due; ``workers`` lists fetch worker RSS."""
+        self.cycles += 1
+        if self.sample_seconds > 0 and self._clock() >= self._next_sample:
+            self._next_sample = self._clock() + self.sample_seconds
+            self.sample(workers())
+
+    def sample(self, workers: Optional[List[int]] = None) -> Dict[str, Any]:
+        """Log and export one sample; the top allocations are diffed against the previous sample."""
+        rss = process_rss_bytes()
+        sample: Dict[str, Any] = {"cycles": self.cycles, "rss_mb": round(rss / MB, 1) if rss is not None else None}
+        if rss is not None:
+            RESIDENT_BYTES.set(rss, process="scheduler")
+        if workers:
+            sample["fetch_workers_rss_mb"] = round(sum(workers) / MB, 1)
+            RESIDENT_BYTES.set(sum(workers), process="fetch_workers")
+        top: List[str] = []
+        if tracemalloc.is_tracing():
+            traced, peak = tracemalloc.get_traced_memory()
+            TRACED_BYTES.set(traced)
+            sample["traced_mb"] = round(traced / MB, 1)
+            sample["traced_peak_mb"] = round(peak / MB, 1)
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen importlib._bootstrap>"))
+            )
+            if self._snapshot is not None and self.top > 0:
+                top = [_format_stat(stat) for stat in snapshot.compare_to(self._snapshot, "lineno")[: self.top]]
+            self._snapshot = snapshot
+        LOGGER.info(
+            "Memory sample: %s",
+            ", ".join(f"{key}={value}" for key, value in sample.items()),
+            extra={"job": "memory", "event": "sample", **sample},
+        )
+        for line in top:
+            LOGGER.info("Top allocation growth: %s", line, extra={"job": "memory", "event": "allocation"})
+        sample["top_allocations"] = top
+        return sample
+
+    def recycle_reason(self) -> Optional[str]:
+        """Why the scheduler should restart now, or None while it is within its cycle and RSS budget."""
+        if self.recycle_cycles > 0 and self.cycles >= self.recycle_cycles:
+            return f"cycle limit of {self.recycle_cycles} reached"
+        if self.recycle_rss_mb > 0:
+            rss = process_rss_bytes()
+            if rss is not None and rss / MB >= self.recycle_rss_mb:
+                return f"RSS {rss / MB:.0f} MB reached the {self.recycle_rss_mb:.0f} MB limit"
+        return None
+
+
+__all__ = [
+    "MB",
+    "MemoryMonitor",
+    "RECYCLE_EXIT_CODE",
+    "process_rss_bytes",
+]
@@ -2,63 +2,100 @@ from __future__ import annotations
 
 import argparse
 import logging
-import logging.handlers
+import random
+import statistics
 import sys
 import time
-from datetime import datetime, timedelta, timezone, tzinfo
-from pathlib import Path
-from typing import Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 
+from backend.src.collectors.akshare_replay import install_from_settings as install_akshare_source
 from backend.src.config import (
-    get_daily_run_time,
+    Instrument,
+    SessionCalendar,
+    get_collector_workers,
+    get_instruments,
+    get_intraday_heartbeat_seconds,
     get_intraday_interval_seconds,
     get_max_retries,
+    get_metrics_dir,
+    get_retention_hours,
+    get_session_calendar,
+    get_settings,
 )
+from backend.src.dashboard import publish_dashboard_snapshot
+from backend.src.logging import configure_scheduler_logging
+from backend.src.metrics import REGISTRY, write_textfile
+from backend.src.profiling import ProfileBudget
+from backend.src.tracing import TRACER, configure_tracing
 from backend.src.storage import (
+    IntradaySnapshotRecord,
     StorageError,
     cleanup_intraday,
+    get_job_checkpoint,
+    has_daily_market_data,
     init_db,
+    list_stored_trade_dates,
+    save_curve_snapshot,
     save_daily_market_data,
-    save_intraday_snapshot,
+    save_daily_market_rows,
+    save_job_checkpoint,
 )
 
 from .collectors_bridge import (
     CollectorError,
-    collect_lme_daily,
-    collect_lme_realtime,
-    collect_shfe_daily,
-    collect_shfe_realtime,
+    DailyColumns,
+    SourceUnavailableError,
+    collect_daily,
+    collect_daily_range,
+    collect_realtime,
+    daily_contract,
+    fetch_worker_memory,
+    shutdown_fetch_executor,
+    source_name,
 )
+from .dedup import INTRADAY_DEDUP, save_intraday_deduplicated
+from .job_ledger import JOB_LEDGER
+from .memory import RECYCLE_EXIT_CODE, MemoryMonitor
+from .source_health import SOURCE_HEALTH
+from .synthetic import SyntheticMarket
 
-LOG_DIR = "logs"
 LOGGER = logging.getLogger("nickel.scheduler")
 
-SHANGHAI_TZ = timezone(timedelta(hours=8), name="Asia/Shanghai")
-EXCHANGE_TIMEZONES = {
-    "shfe": SHANGHAI_TZ,
-    "lme": SHANGHAI_TZ,
-}
+METRICS_TEXTFILE = "scheduler.prom"
+JOB_ATTEMPTS = REGISTRY.counter(
+    "nickel_collector_attempts_total", "Collector attempts by job and outcome.", ("job", "result")
+)
+JOB_RETRIES = REGISTRY.counter("nickel_collector_retries_total", "Collector retries scheduled after a failure.", ("job",))
+JOB_DURATION = REGISTRY.histogram(
+    "nickel_job_duration_seconds", "Wall time of a collector job including retries and backoff.", ("job",)
+)
+STORAGE_WRITE_DURATION = REGISTRY.histogram(
+    "nickel_storage_write_seconds", "Duration of storage writes issued by the scheduler.", ("operation",)
+)
+CYCLE_DURATION = REGISTRY.histogram("nickel_scheduler_cycle_seconds", "Wall time of scheduler cycles.", ("cycle",))
+SESSION_OPEN = REGISTRY.gauge(
+    "nickel_exchange_session_open", "1 while the exchange is inside a trading session, else 0.", ("exchange",)
+)
+METRICS_EXPORTED_AT = REGISTRY.gauge(
+    "nickel_scheduler_metrics_timestamp_seconds", "Unix time at which the scheduler last exported its metrics."
+)
+
+# Armed by --profile N; until then profile() is a shared no-op context.
+CYCLE_PROFILER = ProfileBudget()
+# Configured from NICKEL_MEMORY_* / NICKEL_SCHEDULER_RECYCLE_* in main(); samples after each run_forever cycle.
+MEMORY_MONITOR = MemoryMonitor()
+
+ResultT = TypeVar("ResultT")
+RecordT = TypeVar("RecordT")
 
 
 def _configure_logging() -> None:
-    """Set up time-rotating file logging plus console output for the scheduler."""
-    if LOGGER.handlers:
-        return
-    Path(LOG_DIR).mkdir(parents=True, exist_ok=True)
-    handler = logging.handlers.TimedRotatingFileHandler(
-        f"{LOG_DIR}/scheduler.log",
-        when="midnight",
-        backupCount=7,
-        encoding="utf-8",
-    )
-    formatter = logging.Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s")
-    handler.setFormatter(formatter)
-    LOGGER.addHandler(handler)
-    console_handler = logging.StreamHandler()  # defaults to stderr, avoids closed-stdout issues
-    console_handler.setFormatter(formatter)
-    LOGGER.addHandler(console_handler)
-    LOGGER.setLevel(logging.INFO)
-    LOGGER.propagate = False
+    """Set up time-rotating file logging plus console output for the scheduler and collectors."""
+    configure_scheduler_logging()
 
 
 def _current_time() -> datetime:
@@ -75,127 +112,557 @@ def _compute_next_daily(now: datetime, hour: int, minute: int, tz: tzinfo = time
     return candidate_local.astimezone(timezone.utc)
 
 
+def _log_context(name: str, attempt: int, started: float, **fields) -> dict:
+    """Build the structured logging fields shared by every collector attempt line."""
+    return {
+        "job": name,
+        "exchange": name.split("_", 1)[0],
+        "attempt": attempt,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+        **fields,
+    }
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter so retries do not line up with upstream throttling windows."""
+    return min(30.0, 2.0 ** attempt) * random.uniform(0.5, 1.0)
+
+
+def _fan_out(tasks: Dict[str, Callable[[], ResultT]], prefix: str = "collector") -> Dict[str, ResultT]:
+    """Run independent per-instrument tasks on a bounded thread pool (NICKEL_COLLECTOR_WORKERS).
+
+    Cycle time grows with the slowest instrument instead of the sum; the per-adapter and shared
+    token buckets keep the extra concurrency within the upstream rate limits.
+    """
+    if len(tasks) <= 1:
+        return {key: task() for key, task in tasks.items()}
+    workers = min(get_collector_workers(), len(tasks))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=prefix) as executor:
+        futures = {key: executor.submit(task) for key, task in tasks.items()}
+        return {key: future.result() for key, future in futures.items()}
+
+
+@dataclass(frozen=True)
+class RealtimeSource:
+    """Where intraday cycles get their ticks: the live collectors bridge, or a synthetic market in load tests.
+
+    ``clock`` anchors intraday retention, so a sped-up synthetic clock also ages rows out at speed.
+    """
+
+    instruments: Callable[[], List[Instrument]] = get_instruments
+    collect: Callable[[Instrument], IntradaySnapshotRecord] = collect_realtime
+    clock: Callable[[], datetime] = _current_time
+
+
+LIVE_SOURCE = RealtimeSource()
+
+
+def synthetic_source(market: SyntheticMarket) -> RealtimeSource:
+    """Plug a synthetic market into the intraday cycle in place of the collectors bridge."""
+    return RealtimeSource(lambda: market.instruments, market.collect_realtime, market.now)
+
+
+def _select_instruments(keys: Optional[List[str]] = None, source: RealtimeSource = LIVE_SOURCE) -> List[Instrument]:
+    """Enabled instruments of ``source``, optionally restricted to ``keys``."""
+    instruments = source.instruments()
+    if keys is None:
+        return instruments
+    wanted = {key.lower() for key in keys}
+    unknown = wanted - {instrument.key for instrument in instruments}
+    if unknown:
+        LOGGER.warning("Ignoring unknown or disabled instruments: %s", ", ".join(sorted(unknown)))
+    return [instrument for instrument in instruments if instrument.key in wanted]
+
+
+def _export_metrics() -> None:
+    """Publish the scheduler registry (re-exported on /metrics) and source health (served by /ops/sources)."""
+    SOURCE_HEALTH.persist()
+    TRACER.flush()
+    METRICS_EXPORTED_AT.set(time.time())
+    try:
+        write_textfile(get_metrics_dir() / METRICS_TEXTFILE)
+    except OSError as exc:
+        LOGGER.warning("Failed to export scheduler metrics: %s", exc)
+
+
 def _run_with_retries(
     name: str,
-    func: Callable[[], Optional[dict]],
-    save_call: Callable[[dict], int],
+    func: Callable[[], Optional[RecordT]],
+    save_call: Callable[[RecordT], int],
     max_retries: int,
+    trigger: str = "schedule",
+    scheduled_at: Optional[datetime] = None,
 ) -> bool:
-    """Execute a collector with retry/backoff and persist the returned payload."""
+    """Execute a collector with retry/backoff, persist the payload and record the run in the job ledger."""
     attempt = 0
-    while True:
-        try:
-            record = func()
-            if record is None:
-                LOGGER.warning("%s collector returned no data", name)
-                return False
-            save_call(record)
-            LOGGER.info("%s collector succeeded", name)
-            return True
-        except (CollectorError, StorageError) as exc:
-            attempt += 1
-            LOGGER.error("%s collector failed: %s", name, exc, exc_info=True)
-            if attempt > max_retries:
-                LOGGER.error("%s collector exceeded max retries (%s)", name, max_retries)
-                return False
-            sleep_seconds = min(5, 1 + attempt)
-            LOGGER.info("%s retrying in %s seconds (attempt %s)", name, sleep_seconds, attempt)
-            time.sleep(sleep_seconds)
-        except Exception as exc:  # pragma: no cover - unexpected failures
-            attempt += 1
-            LOGGER.exception("%s collector unexpected error: %s", name, exc)
-            if attempt > max_retries:
-                return False
-            time.sleep(1.0)
-
-
-def run_intraday_cycle(max_retries: int) -> None:
-    """Fetch and persist realtime data for all exchanges once."""
-    LOGGER.info("Starting intraday cycle")
-    tasks = [
-        ("lme_intraday", collect_lme_realtime),
-        ("shfe_intraday", collect_shfe_realtime),
-    ]
-    successes = 0
-    for name, func in tasks:
-        if _run_with_retries(name, func, save_intraday_snapshot, max_retries):
-            successes += 1
-    if successes:
-        deleted = cleanup_intraday()
-        LOGGER.info("Intraday cleanup removed %s rows", deleted)
-    LOGGER.info("Intraday cycle complete (success=%s)", successes)
-
-
-def run_shfe_daily_cycle(max_retries: int) -> None:
-    """Collect and store the SHFE daily summary."""
-    LOGGER.info("Starting SHFE daily cycle")
-    _run_with_retries("shfe_daily", collect_shfe_daily, save_daily_market_data, max_retries)
-    LOGGER.info("SHFE daily cycle complete")
+    operation = getattr(save_call, "__name__", "save")
+    started_at = _current_time()
+    status = "failure"
+    rows_written = 0
+    last_error: Optional[BaseException] = None
+    try:
+        # One trace per job run: its ID is stamped on the stored row and links fetch, normalise and save spans.
+        with TRACER.trace(name, trigger=trigger), JOB_DURATION.time(job=name):
+            while True:
+                started = time.perf_counter()
+                try:
+                    record = func()
+                    if record is None:
+                        attempt += 1
+                        status = "empty"
+                        JOB_ATTEMPTS.inc(job=name, result="empty")
+                        LOGGER.warning("%s collector returned no data", name, extra=_log_context(name, attempt, started))
+                        return False
+                    with TRACER.span(operation), STORAGE_WRITE_DURATION.time(operation=operation):
+                        save_call(record)
+                    attempt += 1
+                    rows_written = 1
+                    status = "success"
+                    JOB_ATTEMPTS.inc(job=name, result="success")
+                    LOGGER.info(
+                        "%s collector succeeded",
+                        name,
+                        extra=_log_context(name, attempt, started, contract=record.contract, event="success"),
+                    )
+                    return True
+                except SourceUnavailableError as exc:
+                    # The breaker already decided when to probe again; retrying now would only be refused.
+                    attempt += 1
+                    last_error = exc
+                    status = "circuit_open"
+                    JOB_ATTEMPTS.inc(job=name, result="circuit_open")
+                    LOGGER.warning("%s skipped: %s", name, exc, extra=_log_context(name, attempt, started))
+                    return False
+                except (CollectorError, StorageError) as exc:
+                    attempt += 1
+                    last_error = exc
+                    JOB_ATTEMPTS.inc(job=name, result="failure")
+                    LOGGER.error("%s collector failed: %s", name, exc, exc_info=True, extra=_log_context(name, attempt, started))
+                    if attempt > max_retries:
+                        LOGGER.error("%s collector exceeded max retries (%s)", name, max_retries, extra=_log_context(name, attempt, started))
+                        return False
+                    sleep_seconds = _retry_delay(attempt)
+                    JOB_RETRIES.inc(job=name)
+                    LOGGER.info("%s retrying in %.1f seconds (attempt %s)", name, sleep_seconds, attempt, extra=_log_context(name, attempt, started))
+                    time.sleep(sleep_seconds)
+                except Exception as exc:  # pragma: no cover - unexpected failures
+                    attempt += 1
+                    last_error = exc
+                    status = "error"
+                    JOB_ATTEMPTS.inc(job=name, result="error")
+                    LOGGER.exception("%s collector unexpected error: %s", name, exc, extra=_log_context(name, attempt, started))
+                    if attempt > max_retries:
+                        return False
+                    JOB_RETRIES.inc(job=name)
+                    time.sleep(_retry_delay(attempt))
+    finally:
+        JOB_LEDGER.record(
+            name,
+            trigger,
+            scheduled_at,
+            started_at,
+            _current_time(),
+            attempt,
+            rows_written,
+            status,
+            None if status == "success" else last_error,
+        )
+
+
+def save_intraday_with_curve(record: IntradaySnapshotRecord) -> int:
+    """Persist the tick (deduplicated) and, when present, the full contract curve of this cycle."""
+    with TRACER.span("save_intraday_deduplicated"):
+        row_id = save_intraday_deduplicated(record)
+    if record.curve:
+        with TRACER.span("save_curve_snapshot", points=len(record.curve)):
+            save_curve_snapshot(record.exchange, record.captured_at, record.curve)
+    return row_id
+
+
+def run_intraday_cycle(
+    max_retries: int,
+    trigger: str = "schedule",
+    scheduled_at: Optional[datetime] = None,
+    instruments: Optional[List[str]] = None,
+    source: RealtimeSource = LIVE_SOURCE,
+) -> int:
+    """Fetch and persist realtime data once for the given instruments (default: all enabled).
+
+    Returns the number of instruments whose tick was stored.
+    """
+    LOGGER.info("Starting intraday cycle", extra={"job": "intraday", "event": "cycle"})
+    selected = _select_instruments(instruments, source)
+    with CYCLE_PROFILER.profile("intraday"), CYCLE_DURATION.time(cycle="intraday"):
+        results = _fan_out(
+            {
+                instrument.key: partial(
+                    _run_with_retries,
+                    f"{instrument.key}_intraday",
+                    partial(source.collect, instrument),
+                    save_intraday_with_curve,
+                    max_retries,
+                    trigger,
+                    scheduled_at,
+                )
+                for instrument in selected
+            }
+        )
+        successes = sum(1 for succeeded in results.values() if succeeded)
+        if successes:
+            with STORAGE_WRITE_DURATION.time(operation="cleanup_intraday"):
+                deleted = cleanup_intraday(source.clock() - timedelta(hours=get_retention_hours()))
+            LOGGER.info("Intraday cleanup removed %s rows", deleted, extra={"job": "intraday", "event": "cycle"})
+            # Precompute /api/v1/dashboard/snapshot so the API serves it as cached bytes.
+            with STORAGE_WRITE_DURATION.time(operation="dashboard_snapshot"):
+                publish_dashboard_snapshot()
+    LOGGER.info(
+        "Intraday cycle complete (success=%s/%s, dedup_ratio=%.1f%%)",
+        successes,
+        len(selected),
+        INTRADAY_DEDUP.ratio() * 100,
+        extra={"job": "intraday", "event": "cycle"},
+    )
+    _export_metrics()
+    return successes
+
+
+def _latency_summary(samples: List[float]) -> Dict[str, float]:
+    """p50/p95/max of ``samples`` (seconds) in milliseconds."""
+    if not samples:
+        return {"p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return {
+        "p50_ms": round(statistics.median(ordered) * 1000, 2),
+        "p95_ms": round(p95 * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2),
+    }
 
 
-def run_lme_daily_cycle(max_retries: int) -> None:
-    """Collect and store the LME daily summary."""
-    LOGGER.info("Starting LME daily cycle")
-    _run_with_retries("lme_daily", collect_lme_daily, save_daily_market_data, max_retries)
-    LOGGER.info("LME daily cycle complete")
+def run_synthetic_load(
+    market: SyntheticMarket,
+    duration: float,
+    max_retries: int = 0,
+    interval: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Drive intraday cycles from ``market`` for ``duration`` wall seconds and return a throughput report.
+
+    Each instrument is polled every ``interval`` simulated seconds (default NICKEL_INTRADAY_INTERVAL_SECONDS),
+    i.e. every ``interval / speedup`` wall seconds; cycles that cannot keep that pace run back to back and
+    are counted as late, so ``achieved_speedup`` shows where storage tops out.
+    """
+    interval = interval or get_intraday_interval_seconds()
+    source = synthetic_source(market)
+    exchanges = {instrument.exchange for instrument in market.instruments}
+    period = interval / market.clock.speedup
+
+    def _dedup_totals() -> Dict[str, int]:
+        stats = INTRADAY_DEDUP.stats()
+        return {
+            outcome: sum(stats.get(exchange, {}).get(outcome, 0) for exchange in exchanges)
+            for outcome in ("inserted", "confirmed")
+        }
+
+    before = _dedup_totals()
+    ticks_before = market.ticks
+    simulated_from = market.now()
+    cycle_seconds: List[float] = []
+    stored = late = 0
+    started = time.perf_counter()
+    next_cycle = started
+    while True:
+        now = time.perf_counter()
+        if now - started >= duration:
+            break
+        if next_cycle > now:
+            time.sleep(min(next_cycle - now, duration - (now - started)))
+            continue
+        if now - next_cycle > period:
+            late += 1
+        cycle_started = time.perf_counter()
+        stored += run_intraday_cycle(max_retries, trigger="synthetic", scheduled_at=market.now(), source=source)
+        cycle_seconds.append(time.perf_counter() - cycle_started)
+        next_cycle = max(next_cycle + period, cycle_started)
+    elapsed = time.perf_counter() - started
+    after = _dedup_totals()
+    ticks = market.ticks - ticks_before
+    production_rate = len(market.instruments) / interval
+    report = {
+        "instruments": len(market.instruments),
+        "interval_seconds": interval,
+        "speedup": market.clock.speedup,
+        "wall_seconds": round(elapsed, 3),
+        "simulated_from": simulated_from.isoformat(),
+        "simulated_to": market.now().isoformat(),
+        "cycles": len(cycle_seconds),
+        "late_cycles": late,
+        "ticks": ticks,
+        "stored": stored,
+        "failed": ticks - stored,
+        "inserted": after["inserted"] - before["inserted"],
+        "confirmed": after["confirmed"] - before["confirmed"],
+        "ticks_per_second": round(ticks / elapsed, 2) if elapsed else 0.0,
+        "target_ticks_per_second": round(production_rate * market.clock.speedup, 2),
+        "achieved_speedup": round(ticks / elapsed / production_rate, 1) if elapsed else 0.0,
+        "cycle_ms": _latency_summary(cycle_seconds),
+    }
+    LOGGER.info(
+        "Synthetic load: %s ticks in %.1fs (%.1f/s, x%.0f production, %s late cycles)",
+        ticks,
+        elapsed,
+        report["ticks_per_second"],
+        report["achieved_speedup"],
+        late,
+    )
+    return report
+
+
+def _next_intraday_poll(
+    calendar: SessionCalendar,
+    instrument: Instrument,
+    now: datetime,
+    interval: int,
+    heartbeat: int,
+) -> datetime:
+    """Poll at ``interval`` inside sessions (stretched while the source is degraded or its circuit is open);
+    outside, wait for the heartbeat or the next open, whichever is sooner."""
+    is_open = calendar.is_open(instrument.session, now)
+    SESSION_OPEN.set(1 if is_open else 0, exchange=instrument.session)
+    source = source_name(instrument.key, "realtime")
+    if is_open:
+        delay = max(interval * SOURCE_HEALTH.poll_multiplier(source), SOURCE_HEALTH.retry_in(source))
+        return now + timedelta(seconds=delay)
+    heartbeat_at = now + timedelta(seconds=heartbeat)
+    opening = calendar.next_open(instrument.session, now)
+    return min(heartbeat_at, opening) if opening is not None else heartbeat_at
+
+
+def _daily_trade_date(reference: datetime) -> str:
+    """Trade date a daily slot collects: the UTC day before the slot, matching the bridge default."""
+    return (reference.astimezone(timezone.utc) - timedelta(days=1)).date().isoformat()
+
+
+def _run_daily_job(
+    instrument: Instrument,
+    max_retries: int,
+    trigger: str,
+    scheduled_at: Optional[datetime],
+    force: bool = False,
+) -> bool:
+    """Run an instrument's daily collector unless its trade date is already checkpointed or stored."""
+    name = f"{instrument.key}_daily"
+    trade_date = _daily_trade_date(scheduled_at or _current_time())
+    context = {"job": name, "exchange": instrument.exchange}
+    if not get_session_calendar().is_trading_day(instrument.session, trade_date):
+        LOGGER.info("%s skipped for %s (not a trading day)", name, trade_date, extra=context)
+        now = _current_time()
+        JOB_LEDGER.record(name, trigger, scheduled_at, now, now, 0, 0, "skipped")
+        return True
+    if not force:
+        try:
+            checkpoint = get_job_checkpoint(name, trade_date)
+            stored = checkpoint is None and has_daily_market_data(
+                instrument.exchange, trade_date, daily_contract(instrument)
+            )
+            if stored:
+                save_job_checkpoint(name, trade_date, source="stored")
+        except (StorageError, CollectorError) as exc:
+            LOGGER.error("%s checkpoint lookup failed, fetching anyway: %s", name, exc, extra=context)
+        else:
+            if checkpoint is not None or stored:
+                reason = "checkpointed" if checkpoint is not None else "already stored"
+                LOGGER.info("%s skipped for %s (%s)", name, trade_date, reason, extra=context)
+                now = _current_time()
+                JOB_LEDGER.record(name, trigger, scheduled_at, now, now, 0, 0, "skipped")
+                return True
+
+    succeeded = _run_with_retries(
+        name,
+        partial(collect_daily, instrument, trade_date),
+        save_daily_market_data,
+        max_retries,
+        trigger,
+        scheduled_at,
+    )
+    if succeeded:
+        try:
+            save_job_checkpoint(name, trade_date)
+        except StorageError as exc:
+            LOGGER.error("%s failed to checkpoint %s: %s", name, trade_date, exc, extra=context)
+    return succeeded
 
 
-def run_daily_cycle(max_retries: int) -> None:
-    """Run both daily collectors back to back."""
-    LOGGER.info("Running both daily cycles once")
-    run_shfe_daily_cycle(max_retries)
-    run_lme_daily_cycle(max_retries)
-    LOGGER.info("Both daily cycles executed")
+def run_daily_cycle(
+    max_retries: int,
+    trigger: str = "schedule",
+    force: bool = False,
+    instruments: Optional[List[str]] = None,
+    scheduled_at: Optional[Dict[str, datetime]] = None,
+) -> None:
+    """Collect and store the daily summary of the given instruments (default: all) in parallel.
+
+    ``scheduled_at`` maps instrument keys to the slot being served; missing keys use "now".
+    """
+    selected = _select_instruments(instruments)
+    slots = scheduled_at or {}
+    LOGGER.info("Starting daily cycle for %s", ", ".join(instrument.key for instrument in selected))
+    with CYCLE_PROFILER.profile("daily"), CYCLE_DURATION.time(cycle="daily"):
+        _fan_out(
+            {
+                instrument.key: partial(
+                    _run_daily_job, instrument, max_retries, trigger, slots.get(instrument.key), force
+                )
+                for instrument in selected
+            }
+        )
+    LOGGER.info("Daily cycle complete")
+    _export_metrics()
+
+
+def _previous_daily(now: datetime, hour: int, minute: int, tz: tzinfo = timezone.utc) -> datetime:
+    """Return the most recent daily slot at or before ``now``."""
+    return _compute_next_daily(now, hour, minute, tz) - timedelta(days=1)
+
+
+def _catch_up_daily(daily_schedules: dict, now: datetime, max_retries: int) -> None:
+    """Run daily jobs whose latest slot passed while the scheduler was down (checkpoints skip the rest)."""
+    missed: Dict[str, datetime] = {}
+    for key, schedule in daily_schedules.items():
+        instrument = schedule["instrument"]
+        slot = _previous_daily(now, instrument.daily_hour, instrument.daily_minute, instrument.daily_tz)
+        try:
+            done = get_job_checkpoint(f"{key}_daily", _daily_trade_date(slot)) is not None
+        except StorageError as exc:
+            LOGGER.error("Checkpoint lookup failed for %s catch-up: %s", key, exc)
+            done = False
+        if not done:
+            LOGGER.info("Catching up %s daily slot %s missed before startup", key, slot.isoformat())
+            missed[key] = slot
+    if missed:
+        run_daily_cycle(max_retries, trigger="catch_up", instruments=list(missed), scheduled_at=missed)
+
+
+def _backfill_instrument(instrument: Instrument, dates: List[str], max_retries: int) -> Optional[DailyColumns]:
+    """Fetch one instrument's history once (with retries) and return columns for the missing dates."""
+    name = f"{instrument.key}_backfill"
+    started_at = _current_time()
+    attempt = 0
+    while True:
+        attempt += 1
+        started = time.perf_counter()
+        try:
+            block = collect_daily_range(instrument, dates)
+        except SourceUnavailableError as exc:
+            # Same ledger outcome as the other jobs: the breaker refused the call, nothing was fetched.
+            LOGGER.warning("%s skipped: %s", name, exc, extra=_log_context(name, attempt, started))
+            JOB_LEDGER.record(name, "backfill", None, started_at, _current_time(), attempt, 0, "circuit_open", exc)
+            return None
+        except CollectorError as exc:
+            LOGGER.error("%s failed: %s", name, exc, extra=_log_context(name, attempt, started))
+            if attempt > max_retries:
+                JOB_LEDGER.record(name, "backfill", None, started_at, _current_time(), attempt, 0, "failure", exc)
+                return None
+            time.sleep(_retry_delay(attempt))
+            continue
+        LOGGER.info(
+            "%s fetched %s/%s missing days",
+            name,
+            len(block),
+            len(dates),
+            extra=_log_context(name, attempt, started, event="success"),
+        )
+        status = "success" if len(block) else "empty"
+        JOB_LEDGER.record(name, "backfill", None, started_at, _current_time(), attempt, len(block), status)
+        return block
+
+
+def run_backfill(start: date, end: date, max_retries: int, instruments: Optional[List[str]] = None) -> int:
+    """Fill missing daily rows between ``start`` and ``end``; returns the number of rows upserted."""
+    calendar = get_session_calendar()
+    pending: Dict[str, Callable[[], Optional[DailyColumns]]] = {}
+    for instrument in _select_instruments(instruments):
+        try:
+            contract = daily_contract(instrument)
+        except CollectorError as exc:
+            LOGGER.error("Backfill %s skipped: %s", instrument.key, exc)
+            continue
+        stored = list_stored_trade_dates([instrument.exchange], start.isoformat(), end.isoformat(), contract)
+        candidates = calendar.trading_days(instrument.session, start, end)
+        missing = [day for day in candidates if day not in stored[instrument.exchange]]
+        LOGGER.info("Backfill %s: %s of %s trading days missing", instrument.key, len(missing), len(candidates))
+        if missing:
+            pending[instrument.key] = partial(_backfill_instrument, instrument, missing, max_retries)
+    if not pending:
+        LOGGER.info("Backfill found no gaps between %s and %s", start, end)
+        return 0
+
+    with CYCLE_PROFILER.profile("backfill"):
+        results = _fan_out(pending, prefix="backfill")
+        rows = [row for block in results.values() if block is not None for row in block.rows()]
+
+        with STORAGE_WRITE_DURATION.time(operation="save_daily_market_rows"):
+            written = save_daily_market_rows(rows)
+    LOGGER.info("Backfill upserted %s daily rows between %s and %s", written, start, end)
+    _export_metrics()
+    return written
 
 
 def run_forever() -> None:
-    """Main scheduling loop orchestrating intraday and daily runs."""
+    """Main scheduling loop orchestrating intraday and daily runs for every enabled instrument."""
     interval = get_intraday_interval_seconds()
+    heartbeat = get_intraday_heartbeat_seconds()
+    calendar = get_session_calendar()
     max_retries = get_max_retries()
-    shfe_hour, shfe_minute = get_daily_run_time("shfe")
-    lme_hour, lme_minute = get_daily_run_time("lme")
+    instruments = get_instruments()
     LOGGER.info(
-        "Scheduler starting (interval=%ss, shfe_daily=%02d:%02d Asia/Shanghai, lme_daily=%02d:%02d Asia/Shanghai, max_retries=%s)",
+        "Scheduler starting (interval=%ss, heartbeat=%ss, workers=%s, max_retries=%s, instruments=%s)",
         interval,
-        shfe_hour,
-        shfe_minute,
-        lme_hour,
-        lme_minute,
+        heartbeat,
+        get_collector_workers(),
         max_retries,
+        ", ".join(
+            f"{instrument.key}[{instrument.symbol} daily {instrument.daily_hour:02d}:{instrument.daily_minute:02d}]"
+            for instrument in instruments
+        ),
     )
-    next_intraday = _current_time()
     now = _current_time()
-    shfe_tz = EXCHANGE_TIMEZONES["shfe"]
-    lme_tz = EXCHANGE_TIMEZONES["lme"]
+    next_intraday = {instrument.key: now for instrument in instruments}
+    by_key = {instrument.key: instrument for instrument in instruments}
     daily_schedules = {
-        "shfe": {
-            "next": _compute_next_daily(now, shfe_hour, shfe_minute, shfe_tz),
-            "hour": shfe_hour,
-            "minute": shfe_minute,
-            "runner": run_shfe_daily_cycle,
-            "tz": shfe_tz,
-        },
-        "lme": {
-            "next": _compute_next_daily(now, lme_hour, lme_minute, lme_tz),
-            "hour": lme_hour,
-            "minute": lme_minute,
-            "runner": run_lme_daily_cycle,
-            "tz": lme_tz,
-        },
+        instrument.key: {
+            "instrument": instrument,
+            "next": _compute_next_daily(now, instrument.daily_hour, instrument.daily_minute, instrument.daily_tz),
+        }
+        for instrument in instruments
     }
+    _catch_up_daily(daily_schedules, now, max_retries)
 
     try:
         while True:
             now = _current_time()
-            if now >= next_intraday:
-                run_intraday_cycle(max_retries)
-                next_intraday = now + timedelta(seconds=interval)
-            for name, schedule in daily_schedules.items():
-                if now >= schedule["next"]:
-                    schedule["runner"](max_retries)
-                    schedule["next"] = _compute_next_daily(now, schedule["hour"], schedule["minute"], schedule["tz"])
-
-            sleep_until_intraday = (next_intraday - now).total_seconds()
+            due = [key for key, at in next_intraday.items() if now >= at]
+            if due:
+                run_intraday_cycle(max_retries, scheduled_at=min(next_intraday[key] for key in due), instruments=due)
+                for key in due:
+                    next_intraday[key] = _next_intraday_poll(calendar, by_key[key], now, interval, heartbeat)
+                MEMORY_MONITOR.after_cycle(fetch_worker_memory)
+            due_daily = {key: schedule["next"] for key, schedule in daily_schedules.items() if now >= schedule["next"]}
+            if due_daily:
+                run_daily_cycle(max_retries, instruments=list(due_daily), scheduled_at=due_daily)
+                for key in due_daily:
+                    instrument = daily_schedules[key]["instrument"]
+                    daily_schedules[key]["next"] = _compute_next_daily(
+                        now, instrument.daily_hour, instrument.daily_minute, instrument.daily_tz
+                    )
+                MEMORY_MONITOR.after_cycle(fetch_worker_memory)
+            if due or due_daily:
+                reason = MEMORY_MONITOR.recycle_reason()
+                if reason is not None:
+                    # Between cycles nothing is in flight; main() still flushes the ledger on the way out.
+                    LOGGER.warning("Recycling scheduler process: %s", reason)
+                    raise SystemExit(RECYCLE_EXIT_CODE)
+
+            sleep_until_intraday = min(at - now for at in next_intraday.values()).total_seconds()
             sleep_until_dailies = [max(1.0, (schedule["next"] - now).total_seconds()) for schedule in daily_schedules.values()]
             sleep_seconds = max(1.0, min([sleep_until_intraday, *sleep_until_dailies]))
             time.sleep(sleep_seconds)
@@ -211,8 +678,46 @@ def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
         choices=["intraday", "daily", "both"],
         help="Run selected tasks once and exit.",
     )
+    parser.add_argument(
+        "--backfill",
+        action="store_true",
+        help="Fill missing daily rows between --from and --to, then exit.",
+    )
+    parser.add_argument("--from", dest="from_date", type=date.fromisoformat, help="Backfill start date (YYYY-MM-DD).")
+    parser.add_argument(
+        "--to",
+        dest="to_date",
+        type=date.fromisoformat,
+        help="Backfill end date (YYYY-MM-DD, default: yesterday).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-fetch daily data even if the trade date is already checkpointed or stored.",
+    )
+    parser.add_argument(
+        "--instrument",
+        dest="instruments",
+        action="append",
+        help="Restrict --once / --backfill to this instrument key (repeatable, default: all enabled).",
+    )
+    parser.add_argument(
+        "--profile",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Write sampled collapsed stacks of the next N intraday/daily/backfill cycles to NICKEL_PROFILE_DIR.",
+    )
     parser.add_argument("--log-level", default=None, help="Override log level (INFO/DEBUG/...).")
-    return parser.parse_args(argv)
+    args = parser.parse_args(argv)
+    if args.backfill:
+        if args.from_date is None:
+            parser.error("--backfill requires --from")
+        if args.to_date is None:
+            args.to_date = (_current_time() - timedelta(days=1)).date()
+        if args.from_date > args.to_date:
+            parser.error("--from must not be later than --to")
+    return args
 
 
 def main(argv: Optional[list[str]] = None) -> None:
@@ -223,16 +728,36 @@ def main(argv: Optional[list[str]] = None) -> None:
         LOGGER.setLevel(getattr(logging, args.log_level.upper(), logging.INFO))
     init_db()
     LOGGER.info("Database initialised")
+    install_akshare_source()
+    configure_tracing("scheduler")
     max_retries = get_max_retries()
+    settings = get_settings()
+    if args.profile:
+        CYCLE_PROFILER.arm(args.profile, settings.profile_dir, float(settings.profile_interval_ms) / 1000)
+        LOGGER.info("Profiling the next %s cycles into %s", args.profile, settings.profile_dir)
+    MEMORY_MONITOR.configure(
+        sample_seconds=float(settings.memory_sample_seconds),
+        tracemalloc_frames=int(settings.memory_tracemalloc_frames),
+        top=int(settings.memory_top_allocations),
+        recycle_cycles=int(settings.scheduler_recycle_cycles),
+        recycle_rss_mb=float(settings.scheduler_recycle_rss_mb),
+    )
 
-    if args.once:
-        if args.once in ("intraday", "both"):
-            run_intraday_cycle(max_retries)
-        if args.once in ("daily", "both"):
-            run_daily_cycle(max_retries)
-        return
-
-    run_forever()
+    try:
+        if args.backfill:
+            run_backfill(args.from_date, args.to_date, max_retries, args.instruments)
+            return
+        if args.once:
+            if args.once in ("intraday", "both"):
+                run_intraday_cycle(max_retries, trigger="once", instruments=args.instruments)
+            if args.once in ("daily", "both"):
+                run_daily_cycle(max_retries, trigger="once", force=args.force, instruments=args.instruments)
+            return
+
+        run_forever()
+    finally:
+        shutdown_fetch_executor()
+        JOB_LEDGER.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+from backend.src.config import get_settings
+from backend.src.metrics import REGISTRY
+from backend.src.storage import SourceHealthPayload, StorageError, save_source_health
+
+LOGGER = logging.getLogger("nickel.scheduler.sources")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+# Smoothing factor of the latency / error-rate moving averages.
+EWMA_ALPHA = 0.3
+# Error rate above which a source is treated as degraded and polled more slowly.
+DEGRADED_ERROR_RATE = 0.2
+MAX_POLL_MULTIPLIER = 8.0
+
+SOURCE_STATE = REGISTRY.gauge(
+    "nickel_source_circuit_state", "Circuit breaker state per upstream source (0 closed, 1 half-open, 2 open).", ("source",)
+)
+SOURCE_POLL_MULTIPLIER = REGISTRY.gauge(
+    "nickel_source_poll_multiplier", "Factor applied to the polling interval of a source.", ("source",)
+)
+UPSTREAM_THROTTLE_WAIT = REGISTRY.histogram(
+    "nickel_upstream_throttle_wait_seconds",
+    "Time spent waiting for the per-adapter and shared upstream token buckets.",
+    ("adapter",),
+)
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by every upstream call."""
+
+    def __init__(self, rate_per_second: float, capacity: float) -> None:
+        self.rate = max(rate_per_second, 1e-6)
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Block until a token is available; False if ``timeout`` expires first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return True
+                wait = (1.0 - self._tokens) / self.rate
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+
+@dataclass
+class SourceState:
+    """Breaker and adaptive-rate bookkeeping for one upstream source."""
+
+    name: str
+    state: str = CLOSED
+    consecutive_failures: int = 0
+    cooldown_seconds: float = 0.0
+    opened_at: Optional[float] = None
+    latency_ewma: Optional[float] = None
+    error_rate: float = 0.0
+    poll_multiplier: float = 1.0
+    total_calls: int = 0
+    total_failures: int = 0
+    last_error: Optional[str] = None
+    last_success_at: Optional[datetime] = None
+    last_failure_at: Optional[datetime] = None
+
+    def retry_in(self, now: float) -> float:
+        if self.state != OPEN or self.opened_at is None:
+            return 0.0
+        return max(0.0, self.opened_at + self.cooldown_seconds - now)
+
+
+class SourceHealth:
+    """Circuit breakers, adaptive polling factors and the per-adapter / shared upstream rate limits."""
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        burst: int,
+        failure_threshold: int,
+        cooldown_seconds: float,
+        max_cooldown_seconds: float,
+        slow_call_seconds: float,
+        source_rate_per_minute: Optional[float] = None,
+        source_burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.bucket = TokenBucket(rate_per_minute / 60.0, burst)
+        self.source_rate_per_minute = source_rate_per_minute or rate_per_minute
+        self.source_burst = source_burst or burst
+        self._adapter_buckets: Dict[str, TokenBucket] = {}
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_seconds = cooldown_seconds
+        self.max_cooldown_seconds = max(cooldown_seconds, max_cooldown_seconds)
+        self.slow_call_seconds = slow_call_seconds
+        self._sources: Dict[str, SourceState] = {}
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def _get(self, source: str) -> SourceState:
+        state = self._sources.get(source)
+        if state is None:
+            state = self._sources[source] = SourceState(source)
+        return state
+
+    def _adapter_bucket(self, adapter: str) -> TokenBucket:
+        bucket = self._adapter_buckets.get(adapter)
+        if bucket is None:
+            bucket = self._adapter_buckets[adapter] = TokenBucket(self.source_rate_per_minute / 60.0, self.source_burst)
+        return bucket
+
+    def before_call(self, source: str, adapter: Optional[str] = None) -> Optional[float]:
+        """Admit a call: returns None when allowed, else seconds until the breaker lets a probe through.
+
+        Admitted calls first take a token from their adapter's bucket (so one busy upstream cannot
+        starve the others), then from the shared bucket that caps total AkShare traffic.
+        """
+        with self._lock:
+            state = self._get(source)
+            now = self._clock()
+            if state.state == OPEN:
+                remaining = state.retry_in(now)
+                if remaining > 0:
+                    return remaining
+                state.state = HALF_OPEN
+                LOGGER.info("%s circuit half-open, sending probe", source, extra={"job": source})
+                self._publish(state)
+            elif state.state == HALF_OPEN:
+                # A probe is already in flight; keep everything else out until it reports back.
+                return max(1.0, self.cooldown_seconds / 4)
+            adapter_bucket = self._adapter_bucket(adapter) if adapter else None
+        with UPSTREAM_THROTTLE_WAIT.time(adapter=adapter or "shared"):
+            if adapter_bucket is not None:
+                adapter_bucket.acquire()
+            self.bucket.acquire()
+        return None
+
+    def record(self, source: str, ok: bool, latency: float, error: Optional[str] = None) -> None:
+        """Feed one call outcome into the breaker and the adaptive polling factor."""
+        with self._lock:
+            state = self._get(source)
+            state.total_calls += 1
+            state.latency_ewma = latency if state.latency_ewma is None else (
+                EWMA_ALPHA * latency + (1 - EWMA_ALPHA) * state.latency_ewma
+            )
+            state.error_rate = EWMA_ALPHA * (0.0 if ok else 1.0) + (1 - EWMA_ALPHA) * state.error_rate
+            now = datetime.now(timezone.utc)
+            if ok:
+                state.consecutive_failures = 0
+                state.last_success_at = now
+                if state.state != CLOSED:
+                    LOGGER.info("%s circuit closed after successful probe", source, extra={"job": source})
+                state.state = CLOSED
+                state.cooldown_seconds = 0.0
+                state.opened_at = None
+            else:
+                state.total_failures += 1
+                state.consecutive_failures += 1
+                state.last_error = (error or "unknown error")[:300]
+                state.last_failure_at = now
+                if state.state == HALF_OPEN or state.consecutive_failures >= self.failure_threshold:
+                    self._trip(state)
+            degraded = state.error_rate > DEGRADED_ERROR_RATE or (state.latency_ewma or 0.0) > self.slow_call_seconds
+            if degraded:
+                state.poll_multiplier = min(MAX_POLL_MULTIPLIER, state.poll_multiplier * 2)
+            else:
+                state.poll_multiplier = max(1.0, state.poll_multiplier / 2)
+            self._publish(state)
+
+    def _trip(self, state: SourceState) -> None:
+        if state.state == OPEN:
+            return
+        previous = state.cooldown_seconds
+        state.cooldown_seconds = self.cooldown_seconds if previous <= 0 else min(self.max_cooldown_seconds, previous * 2)
+        state.state = OPEN
+        state.opened_at = self._clock()
+        LOGGER.warning(
+            "%s circuit opened for %.0fs after %s consecutive failures",
+            state.name,
+            state.cooldown_seconds,
+            state.consecutive_failures,
+            extra={"job": state.name},
+        )
+
+    def poll_multiplier(self, source: str) -> float:
+        with self._lock:
+            state = self._sources.get(source)
+            if state is None:
+                return 1.0
+            if state.state == OPEN:
+                return max(state.poll_multiplier, 1.0)
+            return state.poll_multiplier
+
+    def retry_in(self, source: str) -> float:
+        with self._lock:
+            state = self._sources.get(source)
+            return state.retry_in(self._clock()) if state else 0.0
+
+    def _publish(self, state: SourceState) -> None:
+        SOURCE_STATE.set(STATE_VALUES[state.state], source=state.name)
+        SOURCE_POLL_MULTIPLIER.set(state.poll_multiplier, source=state.name)
+
+    def snapshot(self) -> List[SourceHealthPayload]:
+        with self._lock:
+            now = self._clock()
+            return [
+                {
+                    "source": state.name,
+                    "state": state.state,
+                    "consecutive_failures": state.consecutive_failures,
+                    "retry_in_seconds": round(state.retry_in(now), 1),
+                    "cooldown_seconds": state.cooldown_seconds,
+                    "latency_ewma_seconds": round(state.latency_ewma, 3) if state.latency_ewma is not None else None,
+                    "error_rate": round(state.error_rate, 3),
+                    "poll_multiplier": state.poll_multiplier,
+                    "total_calls": state.total_calls,
+                    "total_failures": state.total_failures,
+                    "last_error": state.last_error,
+                    "last_success_at": state.last_success_at,
+                    "last_failure_at": state.last_failure_at,
+                }
+                for state in self._sources.values()
+            ]
+
+    def persist(self) -> None:
+        """Write the current state to storage so the API process can serve it."""
+        rows = self.snapshot()
+        if not rows:
+            return
+        try:
+            save_source_health(rows)
+        except StorageError as exc:
+            LOGGER.error("Failed to persist source health: %s", exc)
+
+
+def _build_source_health() -> SourceHealth:
+    settings = get_settings()
+    return SourceHealth(
+        rate_per_minute=float(settings.upstream_rate_per_minute),
+        burst=int(settings.upstream_burst),
+        failure_threshold=int(settings.breaker_failure_threshold),
+        cooldown_seconds=float(settings.breaker_cooldown_seconds),
+        max_cooldown_seconds=float(settings.breaker_max_cooldown_seconds),
+        slow_call_seconds=float(settings.source_slow_call_seconds),
+        source_rate_per_minute=float(settings.source_rate_per_minute),
+        source_burst=int(settings.source_burst),
+    )
+
+
+SOURCE_HEALTH = _build_source_health()
+
+
+__all__ = [
+    "CLOSED",
+    "OPEN",
+    "HALF_OPEN",
+    "TokenBucket",
+    "SourceHealth",
+    "SOURCE_HEALTH",
+]
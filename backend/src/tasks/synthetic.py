@@ -0,0 +1,248 @@
+"""
+Synthetic nickel market used in place of the collectors bridge for load testing.
+
+Each synthetic instrument follows a session-aware random walk on a simulated
+clock running ``speedup`` times faster than wall time: prices move only while
+its exchange session is open, bid/ask sit a few ticks around the last price,
+volume accumulates through the trading day and open interest drifts. SHFE-style
+instruments also carry a full contract curve so curve storage is exercised.
+
+The scheduler consumes it through ``synthetic_source`` / ``run_synthetic_load``;
+``scripts/load_synthetic.py`` wires both up against a throwaway database:
+    python scripts/load_synthetic.py --instruments 20 --speedup 1000 --json
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from backend.src.config import Instrument, SessionCalendar, get_session_calendar
+from backend.src.storage import CurvePointRecord, IntradaySnapshotRecord
+from backend.src.tracing import current_trace_id
+
+SOURCE_DETAIL = "synthetic"
+
+# session -> (starting price, tick size, symbol); LME-style instruments quote without a curve.
+PROFILES: Dict[str, Tuple[float, float, str]] = {
+    "shfe": (125000.0, 10.0, "NI0"),
+    "lme": (16000.0, 5.0, "NID"),
+}
+
+# Annualised volatility is spread over trading seconds only, so quiet hours do not move the price.
+TRADING_SECONDS_PER_YEAR = 252 * 8 * 3600
+
+
+class SyntheticClock:
+    """Simulated UTC clock that starts at ``start`` and advances ``speedup`` seconds per wall second."""
+
+    def __init__(self, start: Optional[datetime] = None, speedup: float = 1.0) -> None:
+        self.start = start or datetime.now(timezone.utc)
+        self.speedup = max(speedup, 1e-6)
+        self._origin = time.perf_counter()
+
+    def now(self) -> datetime:
+        return self.start + timedelta(seconds=(time.perf_counter() - self._origin) * self.speedup)
+
+
+def default_start(calendar: SessionCalendar, sessions: List[str], now: Optional[datetime] = None) -> datetime:
+    """``now`` when any of ``sessions`` is trading, otherwise the earliest upcoming open."""
+    now = now or datetime.now(timezone.utc)
+    if any(calendar.is_open(session, now) for session in sessions):
+        return now
+    openings = [opening for opening in (calendar.next_open(session, now) for session in sessions) if opening]
+    return min(openings) if openings else now
+
+
+def synthetic_instruments(count: int, sessions: Tuple[str, ...] = ("shfe", "lme")) -> List[Instrument]:
+    """``count`` instruments keyed ``syn001``... that alternate between the given exchange sessions.
+
+    Each one is its own ``exchange`` so the dashboard endpoints can query it separately.
+    """
+    instruments = []
+    for index in range(count):
+        session = sessions[index % len(sessions)]
+        key = f"syn{index + 1:03d}"
+        instruments.append(Instrument(key, key, PROFILES[session][2], "synthetic", session, 2, 0))
+    return instruments
+
+
+@dataclass
+class _QuoteState:
+    """Mutable per-instrument market state; only the cycle collecting that instrument touches it."""
+
+    rng: random.Random
+    tick_size: float
+    price: float
+    prev_settlement: float
+    open: float
+    high: float
+    low: float
+    volume: float
+    open_interest: float
+    last_at: datetime
+    bid: Optional[float] = None
+    ask: Optional[float] = None
+    tick_time: Optional[str] = None
+    trading_day: Optional[date] = None
+    was_open: bool = False
+
+
+class SyntheticMarket:
+    """Stand-in for ``collectors_bridge.collect_realtime`` that generates ticks instead of fetching them.
+
+    ``volatility`` is annualised; ``volume_rate`` is the mean number of lots traded per open
+    session second; ``curve_months`` contract months are generated for SHFE-session instruments.
+    """
+
+    def __init__(
+        self,
+        instruments: List[Instrument],
+        clock: Optional[SyntheticClock] = None,
+        seed: Optional[int] = None,
+        volatility: float = 0.35,
+        volume_rate: float = 2.0,
+        curve_months: int = 12,
+        calendar: Optional[SessionCalendar] = None,
+    ) -> None:
+        self.instruments = list(instruments)
+        self.clock = clock or SyntheticClock()
+        self.calendar = calendar or get_session_calendar()
+        self.volatility = volatility
+        self.volume_rate = volume_rate
+        self.curve_months = curve_months
+        seeds = random.Random(seed)
+        start = self.clock.now()
+        self._states: Dict[str, _QuoteState] = {}
+        for instrument in self.instruments:
+            price, tick_size, _ = PROFILES.get(instrument.session, PROFILES["shfe"])
+            rng = random.Random(seeds.getrandbits(64))
+            price = self._round(price * math.exp(rng.gauss(0.0, 0.05)), tick_size)
+            self._states[instrument.key] = _QuoteState(
+                rng=rng,
+                tick_size=tick_size,
+                price=price,
+                prev_settlement=price,
+                open=price,
+                high=price,
+                low=price,
+                volume=0.0,
+                open_interest=float(rng.randint(80000, 200000)),
+                last_at=start,
+            )
+        self._lock = threading.Lock()
+        self.ticks = 0
+
+    def now(self) -> datetime:
+        return self.clock.now()
+
+    @staticmethod
+    def _round(value: float, tick_size: float) -> float:
+        return round(round(value / tick_size) * tick_size, 2)
+
+    def _advance(self, instrument: Instrument, state: _QuoteState, now: datetime) -> None:
+        is_open = self.calendar.is_open(instrument.session, now)
+        if is_open and not state.was_open:
+            local_day = now.astimezone(self.calendar.local_tz(instrument.session)).date()
+            if local_day != state.trading_day:
+                # New trading day: yesterday's last price becomes the reference, counters restart.
+                state.trading_day = local_day
+                state.prev_settlement = state.price
+                state.open = state.high = state.low = state.price
+                state.volume = 0.0
+        state.was_open = is_open
+        elapsed = max((now - state.last_at).total_seconds(), 0.0)
+        state.last_at = now
+        if not is_open or elapsed <= 0:
+            return
+        rng = state.rng
+        step = self.volatility * math.sqrt(elapsed / TRADING_SECONDS_PER_YEAR) * rng.gauss(0.0, 1.0)
+        state.price = max(state.tick_size, self._round(state.price * math.exp(step), state.tick_size))
+        state.high = max(state.high, state.price)
+        state.low = min(state.low, state.price)
+        expected = self.volume_rate * elapsed
+        state.volume += max(0.0, round(rng.gauss(expected, math.sqrt(expected) or 1.0)))
+        state.open_interest = max(0.0, state.open_interest + round(rng.gauss(0.0, math.sqrt(expected) + 1.0)))
+        # The last trade sits somewhere inside a one-to-three tick book.
+        spread = rng.randint(1, 3)
+        state.bid = state.price - rng.randint(0, spread) * state.tick_size
+        state.ask = state.bid + spread * state.tick_size
+        state.tick_time = now.astimezone(self.calendar.local_tz(instrument.session)).strftime("%H:%M:%S")
+
+    def _curve(self, instrument: Instrument, state: _QuoteState, now: datetime) -> Tuple[CurvePointRecord, ...]:
+        if instrument.session != "shfe" or self.curve_months <= 0:
+            return ()
+        product = instrument.symbol.rstrip("0123456789")
+        local = now.astimezone(self.calendar.local_tz(instrument.session))
+        points = []
+        for month in range(1, self.curve_months + 1):
+            index = local.year * 12 + local.month - 1 + month
+            contract = f"{product}{index // 12 % 100:02d}{index % 12 + 1:02d}"
+            # Mild contango with open interest concentrated in the nearby months.
+            price = self._round(state.price * (1 + 0.002 * month), state.tick_size)
+            share = 0.5 ** (month / 3)
+            points.append(
+                CurvePointRecord(
+                    contract=contract,
+                    latest_price=price,
+                    prev_settlement=self._round(state.prev_settlement * (1 + 0.002 * month), state.tick_size),
+                    bid=price - state.tick_size,
+                    ask=price + state.tick_size,
+                    volume=round(state.volume * share),
+                    open_interest=round(state.open_interest * share),
+                    tick_time=state.tick_time,
+                )
+            )
+        return tuple(points)
+
+    def collect_realtime(self, instrument: Instrument) -> IntradaySnapshotRecord:
+        """Same contract as ``collectors_bridge.collect_realtime``: one storage-ready snapshot.
+
+        Outside sessions the quote stays frozen, so the deduplicator only re-confirms it.
+        """
+        started = time.perf_counter()
+        state = self._states[instrument.key]
+        now = self.clock.now()
+        self._advance(instrument, state, now)
+        change = state.price - state.prev_settlement
+        local = now.astimezone(self.calendar.local_tz(instrument.session))
+        with self._lock:
+            self.ticks += 1
+        return IntradaySnapshotRecord(
+            exchange=instrument.exchange,
+            instrument=instrument.key,
+            source_detail=SOURCE_DETAIL,
+            contract=instrument.symbol,
+            captured_at=now,
+            quote_date=local.date().isoformat(),
+            latest_price=state.price,
+            open=state.open,
+            high=state.high,
+            low=state.low,
+            prev_settlement=state.prev_settlement,
+            volume=state.volume,
+            open_interest=state.open_interest,
+            bid=state.bid,
+            ask=state.ask,
+            change=round(change, 2),
+            change_pct=round(change / state.prev_settlement * 100, 4) if state.prev_settlement else None,
+            tick_time=state.tick_time,
+            elapsed_seconds=round(time.perf_counter() - started, 6),
+            trace_id=current_trace_id(),
+            curve=self._curve(instrument, state, now),
+        )
+
+
+__all__ = [
+    "PROFILES",
+    "SOURCE_DETAIL",
+    "SyntheticClock",
+    "SyntheticMarket",
+    "default_start",
+    "synthetic_instruments",
+]
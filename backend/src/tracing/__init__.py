@@ -0,0 +1,232 @@
+"""
+Lightweight span tracing across collector -> bridge -> storage -> API.
+
+Every scheduler job run opens a trace; its ID is stamped on the intraday row the run stores
+(``intraday_snapshots.trace_id``) and served with it by the dashboard API. Trace IDs are 32 hex
+characters whose first 16 encode the epoch microsecond the trace started, so any process that
+later reads the row knows when capture began without sharing a clock or a collector.
+
+With NICKEL_TRACE_ENABLED each process appends spans to its own file under NICKEL_TRACE_DIR in
+Chrome Trace Event format (JSON array, trailing ``]`` omitted as the format allows, so a killed
+process still leaves a readable file). Open a file in Perfetto (ui.perfetto.dev) or
+chrome://tracing, or merge them with ``scripts/trace_report.py``. Timestamps are epoch
+microseconds, so scheduler and API files line up on one timeline. When disabled, ``span()``
+returns a shared no-op context and only the trace ID itself is generated.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+
+LOGGER = logging.getLogger("nickel.tracing")
+
+DEFAULT_TRACE_DIR = "logs/traces"
+TRACE_SUFFIX = ".trace.json"
+# Category of the async events that span a trace from capture start to its first dashboard read.
+DELIVERY_CATEGORY = "delivery"
+_NO_SPAN: ContextManager[None] = nullcontext()
+_FLUSH_EVENTS = 256
+_FLUSH_SECONDS = 1.0
+_DELIVERED_CAPACITY = 4096
+
+CURRENT_TRACE: ContextVar[Optional[str]] = ContextVar("nickel_trace_id", default=None)
+
+
+def now_us() -> int:
+    """Epoch microseconds, the timestamp unit of trace events."""
+    return time.time_ns() // 1000
+
+
+def new_trace_id() -> str:
+    """``<16 hex epoch microseconds><16 random hex>``, the W3C trace-id length."""
+    return f"{now_us():016x}{secrets.token_hex(8)}"
+
+
+def trace_origin(trace_id: Optional[str]) -> Optional[float]:
+    """Epoch seconds at which ``trace_id`` was started, or None for IDs not made by ``new_trace_id``."""
+    if not trace_id or len(trace_id) != 32:
+        return None
+    try:
+        return int(trace_id[:16], 16) / 1_000_000
+    except ValueError:
+        return None
+
+
+def current_trace_id() -> Optional[str]:
+    return CURRENT_TRACE.get()
+
+
+class Tracer:
+    """Per-process span recorder buffering Chrome Trace Events and appending them to one file."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.path: Optional[Path] = None
+        self.started_at = time.time()
+        self._pid = os.getpid()
+        self._buffer: List[str] = []
+        self._flushed_at = time.monotonic()
+        self._named_threads: set = set()
+        self._delivered: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def configure(self, process: str, directory: Path | str = DEFAULT_TRACE_DIR, enabled: bool = True) -> None:
+        """Start (or stop) exporting spans of this process to ``directory/<process>-<stamp>-<pid>.trace.json``."""
+        self.flush()
+        with self._lock:
+            self.enabled = False
+            self.path = None
+            self._named_threads.clear()
+            if not enabled:
+                return
+            stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+            path = Path(directory) / f"{process}-{stamp}-{self._pid}{TRACE_SUFFIX}"
+            metadata = {"name": "process_name", "ph": "M", "pid": self._pid, "args": {"name": process}}
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with path.open("w", encoding="utf-8") as handle:
+                    handle.write(f"[\n{json.dumps(metadata)},\n")
+            except OSError as exc:
+                LOGGER.warning("Tracing disabled, cannot write %s: %s", path, exc)
+                return
+            self.path = path
+            self.enabled = True
+        LOGGER.info("Exporting trace spans to %s", path)
+
+    @contextmanager
+    def trace(self, name: str, **args: Any) -> Iterator[str]:
+        """Open a new trace (its root span is ``name``) and yield its ID; nested spans join it."""
+        trace_id = new_trace_id()
+        token = CURRENT_TRACE.set(trace_id)
+        try:
+            with self.span(name, **args):
+                yield trace_id
+        finally:
+            CURRENT_TRACE.reset(token)
+
+    def span(self, name: str, **args: Any) -> ContextManager[None]:
+        """Record ``name`` as a complete event of the current trace (no-op while disabled)."""
+        if not self.enabled:
+            return _NO_SPAN
+        return self._span(name, args)
+
+    @contextmanager
+    def _span(self, name: str, args: Dict[str, Any]) -> Iterator[None]:
+        started_us = now_us()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.complete(name, started_us, time.perf_counter() - started, **args)
+
+    def complete(self, name: str, started_us: int, seconds: float, **args: Any) -> None:
+        """Record an already finished span that started at epoch microsecond ``started_us``."""
+        if not self.enabled:
+            return
+        args["trace_id"] = CURRENT_TRACE.get()
+        self._emit({"name": name, "cat": "span", "ph": "X", "ts": started_us, "dur": int(seconds * 1_000_000), "args": args})
+
+    def delivered(self, trace_id: Optional[str], stage: str, **args: Any) -> Optional[float]:
+        """Note that ``trace_id`` reached ``stage``; returns seconds since capture began on the first sighting.
+
+        Later sightings, IDs without an origin and traces started before this process return None,
+        so a restart does not report the age of the whole table as latency.
+        """
+        origin = trace_origin(trace_id)
+        if origin is None or origin < self.started_at:
+            return None
+        with self._lock:
+            if trace_id in self._delivered:
+                return None
+            self._delivered[trace_id] = None
+            if len(self._delivered) > _DELIVERED_CAPACITY:
+                self._delivered.popitem(last=False)
+        served_us = now_us()
+        latency = max(0.0, served_us / 1_000_000 - origin)
+        if self.enabled:
+            event = {"name": f"capture_to_{stage}", "cat": DELIVERY_CATEGORY, "id": trace_id}
+            begin_us = int(origin * 1_000_000)
+            self._emit({**event, "ph": "b", "ts": begin_us, "args": {"trace_id": trace_id, **args}})
+            self._emit({**event, "ph": "e", "ts": max(served_us, begin_us)})
+        return latency
+
+    def _emit(self, event: Dict[str, Any]) -> None:
+        thread = threading.current_thread()
+        tid = thread.ident or 0
+        event["pid"] = self._pid
+        event["tid"] = tid
+        line = json.dumps(event, default=str)
+        with self._lock:
+            if tid not in self._named_threads:
+                self._named_threads.add(tid)
+                self._buffer.append(
+                    json.dumps({"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": thread.name}})
+                )
+            self._buffer.append(line)
+            due = len(self._buffer) >= _FLUSH_EVENTS or time.monotonic() - self._flushed_at >= _FLUSH_SECONDS
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append buffered events to the trace file."""
+        with self._lock:
+            lines, self._buffer = self._buffer, []
+            self._flushed_at = time.monotonic()
+            path = self.path
+            if not lines or path is None:
+                return
+            try:
+                with path.open("a", encoding="utf-8") as handle:
+                    handle.write("".join(f"{line},\n" for line in lines))
+            except OSError as exc:
+                LOGGER.warning("Dropped %s trace events, cannot write %s: %s", len(lines), path, exc)
+
+
+TRACER = Tracer()
+atexit.register(TRACER.flush)
+
+
+def configure_tracing(process: str) -> None:
+    """Apply NICKEL_TRACE_ENABLED / NICKEL_TRACE_DIR to the process-wide tracer."""
+    from backend.src.config import get_settings
+
+    settings = get_settings()
+    TRACER.configure(process, settings.trace_dir, bool(settings.trace_enabled))
+
+
+def load_trace_events(path: Path | str) -> List[Dict[str, Any]]:
+    """Events of a trace file, whether or not its array was closed."""
+    text = Path(path).read_text(encoding="utf-8").strip().rstrip(",")
+    if text.startswith("{"):
+        return json.loads(text).get("traceEvents", [])
+    if not text.endswith("]"):
+        text += "]"
+    return json.loads(text)
+
+
+__all__ = [
+    "CURRENT_TRACE",
+    "DEFAULT_TRACE_DIR",
+    "DELIVERY_CATEGORY",
+    "TRACER",
+    "TRACE_SUFFIX",
+    "Tracer",
+    "configure_tracing",
+    "current_trace_id",
+    "load_trace_events",
+    "new_trace_id",
+    "now_us",
+    "trace_origin",
+]
@@ -14,9 +14,10 @@ import { weeklyReport } from "./data/reports/weekly";
 import { monthlyReport } from "./data/reports/monthly";
 import { yearlyReport } from "./data/reports/yearly";
 import {
-  fetchHealth,
-  fetchLatest,
+  fetchDashboardSnapshot,
   type DashboardEnvelope,
+  type DashboardSnapshot,
+  type ExchangeSnapshot,
   type SnapshotRecord,
 } from "./services/dashboard";
 import type { MetricView } from "./types/reports";
@@ -103,6 +104,13 @@ const mapSnapshotToMetrics = (snapshot: SnapshotRecord, unitLabel: string): Metr
   ];
 };
 
+// LME 行情不带当日高低价时，用日内采样的今日区间补齐。
+const withTodayRange = ({ latest, today_range }: ExchangeSnapshot): SnapshotRecord => ({
+  ...latest,
+  high: latest.high ?? today_range.high,
+  low: latest.low ?? today_range.low,
+});
+
 const cloneMetrics = (metrics?: MetricView[]): MetricView[] =>
   metrics ? metrics.map((metric) => ({ ...metric })) : [];
 
@@ -229,31 +237,33 @@ const App: FC = () => {
       setLastUpdated(activeMarket?.meta.lastUpdated ?? "");
     };
 
-    const fetchLatestSnapshot = async () => {
+    // 返回采集间隔（秒），请求失败时返回 null。
+    const fetchLatestSnapshot = async (): Promise<number | null> => {
       try {
-        const response: DashboardEnvelope<SnapshotRecord> = await fetchLatest(selectedExchange);
+        const response: DashboardEnvelope<DashboardSnapshot> = await fetchDashboardSnapshot();
+        const exchange = response.data.exchanges[selectedExchange];
         if (!cancelled) {
-          applySnapshot(response.data);
+          if (exchange) {
+            applySnapshot(withTodayRange(exchange));
+          } else {
+            loadFallback();
+          }
         }
+        return response.data.intraday_interval_seconds;
       } catch {
         if (!cancelled) {
           loadFallback();
         }
+        return null;
       }
     };
 
     const initialise = async () => {
       clearTimer();
       loadFallback();
-      await fetchLatestSnapshot();
-
-      let intervalMs = 30_000;
-      try {
-        const health = await fetchHealth();
-        intervalMs = Math.max(health.intraday_interval_seconds, 5) * 1000;
-      } catch {
-        // ignore health fetch errors, fall back to default interval
-      }
+      const intervalSeconds = await fetchLatestSnapshot();
+      // 快照请求失败时按 30 秒重试
+      const intervalMs = Math.max(intervalSeconds ?? 30, 5) * 1000;
 
       if (!cancelled) {
         refreshTimerRef.current = setInterval(fetchLatestSnapshot, intervalMs);
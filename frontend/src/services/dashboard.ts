@@ -2,7 +2,7 @@ import axios, { type AxiosRequestConfig } from "axios";
 import type { MarketKey } from "../data/mock";
 
 const DEFAULT_BASE_URL = "http://127.0.0.1:8000";
-const API_BASE_URL =
+export const API_BASE_URL =
   (import.meta as any).env?.VITE_API_BASE_URL?.toString().trim() || DEFAULT_BASE_URL;
 
 const apiClient = axios.create({
@@ -33,6 +33,7 @@ export interface DashboardEnvelope<T> {
 export interface SnapshotRecord {
   id: number;
   exchange: string;
+  instrument?: string | null;
   contract: string;
   captured_at: string;
   quote_date: string | null;
@@ -56,6 +57,7 @@ export interface SnapshotRecord {
 export interface DailyRecord {
   id: number;
   exchange: string;
+  instrument?: string | null;
   contract: string;
   trade_date: string;
   open: number | null;
@@ -71,6 +73,39 @@ export interface DailyRecord {
   elapsed_seconds: number | null;
 }
 
+export interface TodayRange {
+  quote_date: string | null;
+  low: number | null;
+  high: number | null;
+  points: number;
+  first_at: string | null;
+  last_at: string | null;
+}
+
+export interface CalendarSpread {
+  near: string;
+  far: string;
+  spread: number | null;
+}
+
+export interface ExchangeSnapshot {
+  latest: SnapshotRecord;
+  updated_at: string;
+  today_range: TodayRange;
+  /** [captured_at, latest_price]，按时间正序。 */
+  sparkline: [string, number | null][];
+  bid_ask_spread: number | null;
+  calendar_spreads: CalendarSpread[];
+}
+
+export interface DashboardSnapshot {
+  generated_at: string;
+  intraday_interval_seconds: number;
+  retention_hours: number;
+  exchanges: Partial<Record<MarketKey, ExchangeSnapshot | null>>;
+  shfe_lme_ratio: number | null;
+}
+
 type RequestOptions = AxiosRequestConfig & {
   searchParams?: Record<string, string | number | boolean | undefined>;
 };
@@ -111,6 +146,11 @@ export function fetchLatest(exchange: MarketKey): Promise<DashboardEnvelope<Snap
   });
 }
 
+/** 一次获取大屏全部卡片数据：两个交易所的最新快照、今日区间、走势点与价差（调度器预先生成）。 */
+export function fetchDashboardSnapshot(): Promise<DashboardEnvelope<DashboardSnapshot>> {
+  return request<DashboardEnvelope<DashboardSnapshot>>("/api/v1/dashboard/snapshot");
+}
+
 /** 获取指定交易所的最新 N 条快照。 */
 export function fetchIntraday(
   exchange: MarketKey,
@@ -1,3 +1,5 @@
+import { API_BASE_URL } from "./dashboard";
+
 export type YearlySeriesPoint = number | string | null;
 
 export type YearlySeries = {
@@ -34,7 +36,41 @@ export type YearlySlide = {
   charts: YearlyChart[];
 };
 
+export type YearlyManifestEntry = {
+  slide: number;
+  title: string | null;
+  file: string;
+  hash: string;
+  chartCount: number;
+};
+
+export type YearlyManifest = {
+  version: number;
+  source?: string;
+  slides: YearlyManifestEntry[];
+};
+
 const YEARLY_BASE_PATH = "/yearly";
+const YEARLY_API_PATH = `${API_BASE_URL}/api/v1/yearly`;
+
+let manifestRequest: Promise<YearlyManifest | null> | null = null;
+
+/** 读取 build_yearly_data.py 生成的 manifest，后端不可用时返回 null；失败结果不缓存，下次调用会重试。 */
+export function fetchYearlyManifest(): Promise<YearlyManifest | null> {
+  if (!manifestRequest) {
+    const request = fetch(`${YEARLY_API_PATH}/manifest`)
+      .then((response) => (response.ok ? (response.json() as Promise<YearlyManifest>) : null))
+      .catch(() => null)
+      .then((manifest) => {
+        if (manifest === null && manifestRequest === request) {
+          manifestRequest = null;
+        }
+        return manifest;
+      });
+    manifestRequest = request;
+  }
+  return manifestRequest;
+}
 
 const formatSlideId = (id: string | number): string => {
   const numeric = typeof id === "string" ? parseInt(id, 10) : id;
@@ -46,6 +82,18 @@ const formatSlideId = (id: string | number): string => {
 
 export async function fetchYearlySlide(slideId: string | number): Promise<YearlySlide> {
   const formattedId = formatSlideId(slideId);
+  const manifest = await fetchYearlyManifest();
+  const entry = manifest?.slides.find((item) => item.slide === Number(formattedId));
+  if (entry) {
+    try {
+      const artifact = await fetch(`${YEARLY_API_PATH}/artifacts/${entry.file}`);
+      if (artifact.ok) {
+        return (await artifact.json()) as YearlySlide;
+      }
+    } catch {
+      // 后端不可用时回退到随前端分发的静态文件（build_yearly_data.py 同步到 frontend/public/yearly）
+    }
+  }
   const response = await fetch(`${YEARLY_BASE_PATH}/slide-${formattedId}.json`);
   if (!response.ok) {
     throw new Error(`Failed to load yearly slide ${formattedId}`);
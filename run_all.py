@@ -23,6 +23,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from backend.src.logging import StorageLoggingServer, start_storage_logging_server
+from backend.src.exit_codes import RECYCLE_EXIT_CODE
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -72,8 +73,8 @@ def main() -> None:
         print(f"[run_all] failed to start logging queue ({exc}), falling back to per-process logging")
 
     try:
+        scheduler_cmd = [sys.executable, "-m", "backend.src.tasks.scheduler"]
         if not args.no_scheduler:
-            scheduler_cmd = [sys.executable, "-m", "backend.src.tasks.scheduler"]
             processes.append(("scheduler", _launch_process("scheduler", scheduler_cmd, shared_env)))
 
         if not args.no_api:
@@ -100,8 +101,14 @@ def main() -> None:
         # Wait for any process to exit
         while True:
             active = False
-            for label, process in processes:
+            for index, (label, process) in enumerate(processes):
                 retcode = process.poll()
+                if retcode == RECYCLE_EXIT_CODE and label == "scheduler":
+                    # The scheduler hit its NICKEL_SCHEDULER_RECYCLE_* limit and asked for a fresh process.
+                    print(f"[run_all] {label} recycled itself, restarting")
+                    processes[index] = (label, _launch_process(label, scheduler_cmd, shared_env))
+                    active = True
+                    continue
                 if retcode is not None:
                     print(f"[run_all] {label} exited with code {retcode}")
                     # terminate others
@@ -0,0 +1,341 @@
+#!/usr/bin/env python
+"""
+API load test and latency benchmark on a seeded SQLite database.
+
+Seeds a database with synthetic intraday snapshots, curve snapshots and daily
+history (sizes configurable, e.g. 1M intraday rows and 20 years of daily data),
+then drives the dashboard, health and yearly routes with concurrent clients:
+    inprocess -> httpx ASGITransport straight into the FastAPI app
+    uvicorn   -> a local uvicorn process over HTTP
+Each route reports throughput and p50/p95/p99. --json saves the results with
+the git revision and seed sizes; --baseline compares p95 against an earlier run.
+
+Usage:
+    python scripts/bench_api.py --intraday-rows 1000000 --daily-years 20 --json bench_api.json
+Optional flags:
+    --database PATH       种子库路径（默认临时目录；已存在且加 --reuse 时跳过造数）
+    --reuse               复用已有的种子库
+    --intraday-rows N     日内快照行数（默认 200000，SHFE / LME 各半）
+    --daily-years N       日线年数（默认 20）
+    --mode NAME           inprocess / uvicorn / all（默认 all）
+    --concurrency N       并发客户端数（默认 16）
+    --requests N          每个路由的请求数（默认 500）
+    --workers N           uvicorn 进程数（默认 1）
+    --route PATH          只压测该路由（可重复，默认内置路由集）
+    --json PATH           另存机器可读结果
+    --baseline PATH       与之前的 --json 结果对比 p95
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.src.config import get_settings  # noqa: E402
+from backend.src.storage import CURVE_COLUMNS, INTRADAY_COLUMNS  # noqa: E402
+
+DEFAULT_ROUTES = (
+    "/health",
+    "/api/v1/dashboard/latest?exchange=lme",
+    "/api/v1/dashboard/latest?exchange=shfe",
+    "/api/v1/dashboard/intraday?exchange=lme&limit=30",
+    "/api/v1/dashboard/intraday?exchange=shfe&limit=500",
+    "/api/v1/dashboard/curve?exchange=shfe",
+    "/api/v1/dashboard/daily?exchange=shfe",
+    "/api/v1/dashboard/daily?exchange=lme&start_date={last_year}",
+    "/api/v1/yearly/slides",
+    "/api/v1/yearly/charts/3",
+)
+
+# exchange -> (contract, starting price, tick size)
+SEED_MARKETS = {"shfe": ("NI0", 125000.0, 10.0), "lme": ("NID", 16000.0, 5.0)}
+SEED_CHUNK = 50_000
+CURVE_SNAPSHOTS = 50
+CURVE_MONTHS = 12
+
+
+def _walk(rng: np.random.Generator, count: int, start: float, tick: float, scale: float) -> np.ndarray:
+    return np.round((start + np.cumsum(rng.normal(0, scale, count))) / tick) * tick
+
+
+def seed_intraday(conn: sqlite3.Connection, rows: int, rng: np.random.Generator, now: datetime) -> None:
+    """Snapshots 30 seconds apart ending at ``now``, split evenly across the seed exchanges."""
+    columns = (*INTRADAY_COLUMNS, "created_at", "updated_at")
+    sql = f"INSERT INTO intraday_snapshots ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})"
+    created = now.replace(microsecond=0).isoformat()
+    per_exchange = rows // len(SEED_MARKETS)
+    end = np.datetime64(now.replace(tzinfo=None, microsecond=0), "s")
+    for exchange, (contract, start, tick) in SEED_MARKETS.items():
+        stamps = end - np.arange(per_exchange)[::-1].astype("timedelta64[s]") * 30
+        captured = np.char.add(stamps.astype(str), "+00:00").tolist()
+        price = _walk(rng, per_exchange, start, tick, tick * 2)
+        spread = rng.integers(1, 4, per_exchange) * tick
+        volume = rng.integers(0, 50, per_exchange).cumsum().astype(float)
+        interest = 150000 + rng.integers(-20, 21, per_exchange).cumsum().astype(float)
+        values = zip(captured, price.tolist(), (price - spread).tolist(), (price + spread).tolist(), volume.tolist(), interest.tolist())
+        batch: List[tuple] = []
+        for stamp, last, bid, ask, vol, oi in values:
+            batch.append(
+                (stamp, exchange, exchange, "bench", contract, stamp[:10], last, start, last + tick, last - tick, None, None,
+                 start, vol, oi, bid, ask, last - start, round((last - start) / start * 100, 4), stamp[11:19], 0.01, None, None,
+                 created, created)
+            )
+            if len(batch) >= SEED_CHUNK:
+                conn.executemany(sql, batch)
+                batch.clear()
+        conn.executemany(sql, batch)
+        if exchange == "shfe":
+            seed_curve(conn, captured[-CURVE_SNAPSHOTS:], price[-CURVE_SNAPSHOTS:].tolist(), tick)
+
+
+def seed_curve(conn: sqlite3.Connection, stamps: List[str], prices: List[float], tick: float) -> None:
+    placeholders = ", ".join("?" for _ in CURVE_COLUMNS)
+    sql = f"INSERT INTO curve_snapshots ({', '.join(CURVE_COLUMNS)}) VALUES ({placeholders})"
+    today = date.today()
+    rows = []
+    for stamp, price in zip(stamps, prices):
+        for month in range(1, CURVE_MONTHS + 1):
+            index = today.year * 12 + today.month - 1 + month
+            contract = f"NI{index // 12 % 100:02d}{index % 12 + 1:02d}"
+            point = round(price * (1 + 0.002 * month) / tick) * tick
+            rows.append((stamp, "shfe", contract, point, point, point - tick, point + tick, 1000.0 / month, 50000.0 / month, stamp[11:19]))
+    conn.executemany(sql, rows)
+
+
+def seed_daily(years: int, rng: np.random.Generator, today: date) -> int:
+    """Weekday rows for ``years`` years per exchange, written through the bulk upsert path."""
+    from backend.src.storage import save_daily_market_rows
+
+    days = [today - timedelta(days=offset) for offset in range(years * 365, 0, -1)]
+    days = [day.isoformat() for day in days if day.weekday() < 5]
+    rows = []
+    for exchange, (contract, start, tick) in SEED_MARKETS.items():
+        close = _walk(rng, len(days), start, tick, tick * 40)
+        for index, (day, value) in enumerate(zip(days, close.tolist())):
+            prev = close[index - 1] if index else value
+            rows.append(
+                (day, exchange, exchange, "bench", contract, value - tick, value + 4 * tick, value - 4 * tick, value, value,
+                 float(prev), value - prev, round((value - prev) / prev * 100, 4), 100000.0, 150000.0, 0.5, None)
+            )
+    return save_daily_market_rows(rows)
+
+
+def seed_database(path: Path, intraday_rows: int, daily_years: int, seed: int = 5) -> Dict[str, Any]:
+    from backend.src.storage import init_db
+
+    object.__setattr__(get_settings(), "database_url", f"sqlite:///{path}")
+    started = time.perf_counter()
+    init_db()
+    rng = np.random.default_rng(seed)
+    now = datetime.now(timezone.utc)
+    with sqlite3.connect(path) as conn:
+        seed_intraday(conn, intraday_rows, rng, now)
+    daily = seed_daily(daily_years, rng, now.date())
+    with sqlite3.connect(path) as conn:
+        conn.execute("ANALYZE")
+    return {"intraday_rows": intraday_rows, "daily_rows": daily, "seconds": round(time.perf_counter() - started, 1)}
+
+
+def summarise(samples: List[float], errors: int, wall: float) -> Dict[str, float]:
+    ordered = sorted(samples)
+
+    def pick(quantile: float) -> float:
+        return ordered[min(len(ordered) - 1, int(round(quantile * (len(ordered) - 1))))]
+
+    return {
+        "count": len(ordered),
+        "errors": errors,
+        "rps": round(len(ordered) / wall, 1) if wall else 0.0,
+        "p50_ms": round(pick(0.50) * 1000, 3),
+        "p95_ms": round(pick(0.95) * 1000, 3),
+        "p99_ms": round(pick(0.99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+async def drive_route(client: httpx.AsyncClient, path: str, requests: int, concurrency: int) -> Dict[str, float]:
+    """Issue ``requests`` GETs to ``path`` from ``concurrency`` clients sharing one counter."""
+    samples: List[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            response = await client.get(path)
+            samples.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    await client.get(path)  # warm caches and lazy initialisation outside the timed window
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarise(samples, errors, time.perf_counter() - started)
+
+
+async def drive_routes(client: httpx.AsyncClient, routes: List[str], requests: int, concurrency: int) -> Dict[str, Any]:
+    results = {}
+    for path in routes:
+        results[path] = await drive_route(client, path, requests, concurrency)
+        stats = results[path]
+        print(
+            f"  {path:<58}{stats['rps']:>9.1f}{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}"
+            f"{stats['p99_ms']:>10.2f}{stats['errors']:>7}"
+        )
+    return results
+
+
+def run_inprocess(routes: List[str], requests: int, concurrency: int) -> Dict[str, Any]:
+    from backend.src.api.main import app
+
+    async def main() -> Dict[str, Any]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            return await drive_routes(client, routes, requests, concurrency)
+
+    return asyncio.run(main())
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def run_uvicorn(database: Path, workdir: Path, routes: List[str], requests: int, concurrency: int, workers: int) -> Dict[str, Any]:
+    """Serve the app from a separate uvicorn process pointed at the seeded database.
+
+    Settings only come from ``.env``, so the server runs in ``workdir`` with its own one.
+    """
+    port = _free_port()
+    (workdir / ".env").write_text(
+        f"NICKEL_DATABASE_URL=sqlite:///{database}\nNICKEL_METRICS_DIR={workdir / 'metrics'}\n", encoding="utf-8"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")]))}
+    command = [sys.executable, "-m", "uvicorn", "backend.src.api.main:app", "--host", "127.0.0.1",
+               "--port", str(port), "--workers", str(workers), "--log-level", "warning", "--no-access-log"]
+    server = subprocess.Popen(command, cwd=workdir, env=env)
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                httpx.get(f"{base_url}/health", timeout=1.0)
+                break
+            except httpx.TransportError:
+                if server.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError("uvicorn did not start")
+                time.sleep(0.2)
+
+        async def main() -> Dict[str, Any]:
+            limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+            async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+                return await drive_routes(client, routes, requests, concurrency)
+
+        return asyncio.run(main())
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    """Print the p95 change of every route measured in both runs."""
+    print(f"p95 vs baseline {baseline.get('revision') or '?'}:")
+    for mode, routes in results["modes"].items():
+        for path, stats in routes.items():
+            before = baseline.get("modes", {}).get(mode, {}).get(path)
+            if before and before["p95_ms"]:
+                change = (stats["p95_ms"] - before["p95_ms"]) / before["p95_ms"] * 100
+                print(f"  {mode:<10}{path:<58}{before['p95_ms']:>10.2f} -> {stats['p95_ms']:>8.2f} ms ({change:+.1f}%)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="API load test and latency benchmark on a seeded SQLite database.")
+    parser.add_argument("--database", type=Path, help="seed database path (default: temporary directory)")
+    parser.add_argument("--reuse", action="store_true", help="reuse an existing seed database")
+    parser.add_argument("--intraday-rows", type=int, default=200_000, help="intraday snapshot rows to seed")
+    parser.add_argument("--daily-years", type=int, default=20, help="years of daily history to seed")
+    parser.add_argument("--mode", choices=("inprocess", "uvicorn", "all"), default="all")
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent clients")
+    parser.add_argument("--requests", type=int, default=500, help="requests per route")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--route", dest="routes", action="append", help="benchmark only this route (repeatable)")
+    parser.add_argument("--json", type=Path, help="also write the results as JSON")
+    parser.add_argument("--baseline", type=Path, help="compare p95 against an earlier --json result")
+    args = parser.parse_args()
+
+    last_year = (date.today() - timedelta(days=365)).isoformat()
+    routes = [route.format(last_year=last_year) for route in (args.routes or DEFAULT_ROUTES)]
+    with tempfile.TemporaryDirectory() as tmp_name:
+        tmp = Path(tmp_name)
+        database = args.database or tmp / "bench_api.db"
+        settings = get_settings()
+        object.__setattr__(settings, "database_url", f"sqlite:///{database}")
+        object.__setattr__(settings, "metrics_dir", str(tmp / "metrics"))
+        if args.reuse and database.exists():
+            seeded: Dict[str, Any] = {"reused": str(database)}
+        else:
+            if database.exists():
+                database.unlink()
+            seeded = seed_database(database, args.intraday_rows, args.daily_years)
+            print(f"seeded {seeded['intraday_rows']} intraday / {seeded['daily_rows']} daily rows in {seeded['seconds']}s")
+
+        results: Dict[str, Any] = {
+            "revision": _git_revision(),
+            "recorded_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+            "python": platform.python_version(),
+            "seed": seeded,
+            "database_mb": round(database.stat().st_size / 1_048_576, 1),
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "modes": {},
+        }
+        header = f"  {'route':<58}{'req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>7}"
+        if args.mode in ("inprocess", "all"):
+            print("inprocess (ASGI)")
+            print(header)
+            results["modes"]["inprocess"] = run_inprocess(routes, args.requests, args.concurrency)
+        if args.mode in ("uvicorn", "all"):
+            print(f"uvicorn ({args.workers} worker{'s' if args.workers > 1 else ''})")
+            print(header)
+            results["workers"] = args.workers
+            results["modes"]["uvicorn"] = run_uvicorn(database, tmp, routes, args.requests, args.concurrency, args.workers)
+
+    if args.baseline:
+        compare(results, json.loads(args.baseline.read_text(encoding="utf-8")))
+    if args.json:
+        args.json.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+#!/usr/bin/env python
+"""
+Offline collector benchmarks on recorded (or sample) AkShare responses.
+
+Two suites run against the replay adapter in backend/src/collectors/akshare_replay.py:
+    parse     -> per-collector DataFrame parsing and bridge normalisation, latency off
+    intraday  -> end-to-end run_intraday_cycle into a throwaway SQLite file,
+                 replaying recorded latencies (scaled) and injected failures
+
+Fixtures come from a recording run (NICKEL_AKSHARE_MODE=record, or --record here,
+which needs network) or from --sample, which writes synthetic frames shaped like
+the AkShare responses so the suites also run on a machine that never went online.
+
+Usage:
+    python scripts/bench_collectors.py --sample
+Optional flags:
+    --fixtures PATH       夹具目录（默认 NICKEL_AKSHARE_FIXTURE_DIR）
+    --record              先联网录制一次夹具（实时 + 历史）
+    --sample              在临时目录生成模拟夹具（无需联网）
+    --suite NAME          parse / intraday / all（默认 all）
+    --iterations N        parse 每项重复次数（默认 200）
+    --cycles N            intraday 周期数（默认 20）
+    --latency-scale F     intraday 回放延迟倍数（默认 1.0）
+    --failure-rate F      intraday 注入失败比例（默认 0）
+    --json PATH           另存机器可读结果
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.src.collectors import akshare_replay  # noqa: E402
+from backend.src.collectors.akshare_replay import AkShareRecorder, AkShareReplay, FixtureStore  # noqa: E402
+from backend.src.config import get_settings  # noqa: E402
+
+
+def sample_fixtures(store: FixtureStore, days: int = 750, seed: int = 11) -> None:
+    """Write synthetic frames for every AkShare call the default instruments make."""
+    rng = np.random.default_rng(seed)
+    today = date.today()
+    dates = [today - timedelta(days=offset) for offset in range(days, 0, -1)]
+    close = 125000 + np.cumsum(rng.normal(0, 900, days))
+    store.save(
+        "futures_symbol_mark",
+        (),
+        {},
+        pd.DataFrame({"exchange": ["上海期货交易所"] * 2, "symbol": ["沪镍", "沪铜"], "mark": ["ni_qh", "cu_qh"]}),
+        0.4,
+    )
+    months = [(today.replace(day=1) + timedelta(days=31 * step)).strftime("%y%m") for step in range(12)]
+    store.save(
+        "futures_zh_realtime",
+        (),
+        {"symbol": "沪镍"},
+        pd.DataFrame(
+            {
+                "symbol": ["NI0", *[f"NI{month}" for month in months]],
+                "exchange": "shfe",
+                "name": "沪镍",
+                "trade": close[-1] + rng.normal(0, 200, 13),
+                "settlement": 0.0,
+                "presettlement": close[-2] + rng.normal(0, 200, 13),
+                "open": close[-1] - 300,
+                "high": close[-1] + 800,
+                "low": close[-1] - 900,
+                "close": 0.0,
+                "bidprice1": close[-1] - 10,
+                "askprice1": close[-1] + 10,
+                "bidvol": rng.integers(1, 50, 13),
+                "askvol": rng.integers(1, 50, 13),
+                "volume": rng.integers(100, 200000, 13),
+                "position": rng.integers(1000, 150000, 13),
+                "ticktime": "14:03:30",
+                "tradedate": today.isoformat(),
+                "preclose": close[-2],
+                "changepercent": 0.004,
+            }
+        ),
+        0.35,
+    )
+    store.save(
+        "futures_main_sina",
+        (),
+        {"symbol": "NI0"},
+        pd.DataFrame(
+            {
+                "日期": dates,
+                "开盘价": close - 200,
+                "最高价": close + 700,
+                "最低价": close - 800,
+                "收盘价": close,
+                "成交量": rng.integers(50000, 400000, days),
+                "持仓量": rng.integers(80000, 200000, days),
+                "动态结算价": close + rng.normal(0, 80, days),
+            }
+        ),
+        1.2,
+    )
+    lme = 15500 + np.cumsum(rng.normal(0, 120, days))
+    store.save(
+        "futures_foreign_commodity_realtime",
+        (),
+        {"symbol": "NID"},
+        pd.DataFrame(
+            [
+                {
+                    "名称": "LME镍3个月",
+                    "最新价": lme[-1],
+                    "人民币报价": lme[-1] * 7.1,
+                    "涨跌额": lme[-1] - lme[-2],
+                    "涨跌幅": (lme[-1] / lme[-2] - 1) * 100,
+                    "开盘价": lme[-1] - 40,
+                    "最高价": lme[-1] + 90,
+                    "最低价": lme[-1] - 110,
+                    "昨日结算价": lme[-2],
+                    "持仓量": 230000,
+                    "买价": lme[-1] - 5,
+                    "卖价": lme[-1] + 5,
+                    "行情时间": "14:03:30",
+                    "日期": today.isoformat(),
+                }
+            ]
+        ),
+        0.5,
+    )
+    store.save(
+        "futures_foreign_hist",
+        (),
+        {"symbol": "NID"},
+        pd.DataFrame(
+            {
+                "date": dates,
+                "open": lme - 30,
+                "high": lme + 120,
+                "low": lme - 130,
+                "close": lme,
+                "volume": rng.integers(1000, 9000, days),
+                "position": rng.integers(200000, 260000, days),
+            }
+        ),
+        0.9,
+    )
+
+
+def record_fixtures(store: FixtureStore) -> None:
+    """Run every default collector once against the live upstream, saving the responses."""
+    from backend.src.collectors import SHFE_data_collection as shfe
+    from backend.src.collectors import lme_data_collection as lme
+
+    akshare_replay.install(AkShareRecorder(store))
+    try:
+        yesterday = (date.today() - timedelta(days=1)).isoformat()
+        shfe.get_realtime_nickel()
+        shfe.get_historical_nickel(yesterday)
+        lme.get_realtime_lme_nickel()
+    finally:
+        akshare_replay.uninstall()
+
+
+def summarise(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+
+    def pick(quantile: float) -> float:
+        return ordered[min(len(ordered) - 1, int(round(quantile * (len(ordered) - 1))))]
+
+    return {
+        "count": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "p50_ms": round(pick(0.50) * 1000, 3),
+        "p95_ms": round(pick(0.95) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def time_calls(iterations: int, function: Callable[[], Any]) -> List[float]:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def _latest_history_date(fetch: Callable[[str], Any], lookback_days: int = 10) -> str:
+    """Most recent day the recorded history has a row for (weekends and holidays have none)."""
+    for offset in range(1, lookback_days + 1):
+        candidate = (date.today() - timedelta(days=offset)).isoformat()
+        if fetch(candidate) is not None:
+            return candidate
+    return (date.today() - timedelta(days=1)).isoformat()
+
+
+def parse_suite(store: FixtureStore, iterations: int) -> Dict[str, Dict[str, float]]:
+    """Collector parse time and bridge normalisation time with replay latency switched off."""
+    from backend.src.collectors import SHFE_data_collection as shfe
+    from backend.src.collectors import lme_data_collection as lme
+    from backend.src.tasks.collectors_bridge import _prepare_daily_record, _prepare_intraday_record
+
+    akshare_replay.install(AkShareReplay(store, latency_scale=0.0))
+    try:
+        shfe_date = _latest_history_date(shfe.get_historical_nickel)
+        lme_date = _latest_history_date(lme.get_historical_lme_nickel)
+        cases = {
+            "shfe_realtime": (shfe.get_realtime_nickel, _prepare_intraday_record, "shfe"),
+            "lme_realtime": (lme.get_realtime_lme_nickel, _prepare_intraday_record, "lme"),
+            "shfe_history": (lambda: shfe.get_historical_nickel(shfe_date), _prepare_daily_record, "shfe"),
+            "lme_history": (lambda: lme.get_historical_lme_nickel(lme_date), _prepare_daily_record, "lme"),
+        }
+        results: Dict[str, Dict[str, float]] = {}
+        for name, (collect, prepare, exchange) in cases.items():
+            record = collect()
+            if record is None:
+                print(f"{name:<15} skipped (no fixture or unparseable response)")
+                continue
+            results[f"{name}.parse"] = summarise(time_calls(iterations, collect))
+            results[f"{name}.normalize"] = summarise(time_calls(iterations, lambda: prepare(exchange, dict(record))))
+        return results
+    finally:
+        akshare_replay.uninstall()
+
+
+def intraday_suite(store: FixtureStore, cycles: int, latency_scale: float, failure_rate: float) -> Dict[str, Any]:
+    """End-to-end run_intraday_cycle latency (fetch, normalise, dedup, store, cleanup) on a temp database."""
+    from backend.src.storage import init_db
+    from backend.src.tasks import scheduler
+    from backend.src.tasks.job_ledger import JOB_LEDGER
+
+    akshare_replay.install(AkShareReplay(store, latency_scale=latency_scale, failure_rate=failure_rate, seed=3))
+    try:
+        init_db()
+        samples = time_calls(cycles, lambda: scheduler.run_intraday_cycle(0, trigger="benchmark"))
+        JOB_LEDGER.close()
+        return {
+            "cycle": summarise(samples),
+            "dedup": scheduler.INTRADAY_DEDUP.stats(),
+            "latency_scale": latency_scale,
+            "failure_rate": failure_rate,
+        }
+    finally:
+        akshare_replay.uninstall()
+
+
+def _isolate(tmp: Path) -> None:
+    """Point storage at a scratch database and lift limits that would dominate offline timings."""
+    settings = get_settings()
+    object.__setattr__(settings, "database_url", f"sqlite:///{tmp / 'bench.db'}")
+    object.__setattr__(settings, "metrics_dir", str(tmp / "metrics"))
+    # In-process fetches: the replay adapter is installed here, not in fresh worker processes.
+    object.__setattr__(settings, "fetch_workers", 0)
+    object.__setattr__(settings, "max_retries", 0)
+    for name in ("upstream_rate_per_minute", "source_rate_per_minute"):
+        object.__setattr__(settings, name, 1_000_000.0)
+    for name in ("upstream_burst", "source_burst"):
+        object.__setattr__(settings, name, 1_000_000)
+    object.__setattr__(settings, "breaker_failure_threshold", 1_000_000)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline collector benchmarks on replayed AkShare fixtures.")
+    parser.add_argument("--fixtures", type=Path, help="fixture directory (default: NICKEL_AKSHARE_FIXTURE_DIR)")
+    parser.add_argument("--record", action="store_true", help="record fresh fixtures from the live upstream first")
+    parser.add_argument("--sample", action="store_true", help="use synthetic fixtures in a temporary directory")
+    parser.add_argument("--suite", choices=("parse", "intraday", "all"), default="all")
+    parser.add_argument("--iterations", type=int, default=200, help="repetitions per parse case")
+    parser.add_argument("--cycles", type=int, default=20, help="run_intraday_cycle repetitions")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="factor applied to recorded latencies")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="share of replayed calls that fail")
+    parser.add_argument("--json", type=Path, help="also write the results as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_name:
+        tmp = Path(tmp_name)
+        _isolate(tmp)
+        if args.sample:
+            store = FixtureStore(tmp / "fixtures")
+            sample_fixtures(store)
+        else:
+            store = FixtureStore(args.fixtures or Path(get_settings().akshare_fixture_dir))
+        if args.record:
+            record_fixtures(store)
+
+        results: Dict[str, Any] = {"fixtures": "sample" if args.sample else str(store.directory)}
+        if args.suite in ("parse", "all"):
+            results["parse"] = parse_suite(store, args.iterations)
+            print(f"{'case':<26}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}")
+            for name, stats in results["parse"].items():
+                print(f"{name:<26}{stats['mean_ms']:>10.3f}{stats['p50_ms']:>10.3f}{stats['p95_ms']:>10.3f}")
+        if args.suite in ("intraday", "all"):
+            results["intraday"] = intraday_suite(store, args.cycles, args.latency_scale, args.failure_rate)
+            cycle = results["intraday"]["cycle"]
+            print(
+                f"run_intraday_cycle x{cycle['count']}: p50 {cycle['p50_ms']:.1f} ms, "
+                f"p95 {cycle['p95_ms']:.1f} ms, max {cycle['max_ms']:.1f} ms, dedup {results['intraday']['dedup']}"
+            )
+    if args.json:
+        args.json.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""
+Benchmark per-row vs columnar normalisation of daily history (the backfill path).
+
+Both paths start from the same synthetic Sina main-contract frame and end with
+tuples ready for ``executemany`` on daily_market_data:
+    per-row  -> _sina_history_record per date -> _prepare_daily_record -> DailyMarketRecord.to_row
+    columnar -> _sina_history_columns -> _prepare_daily_columns -> DailyColumns.rows()
+
+No network access is needed; with --sqlite the rows are also upserted into a
+throwaway SQLite file in a temporary directory.
+
+Usage:
+    python scripts/bench_daily_normalization.py
+Optional flags:
+    --rows N              合成历史的行数（默认 5000）
+    --repeat N            每条路径重复次数，取最优（默认 5）
+    --sqlite              同时计时写入临时 SQLite 的 executemany
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, List
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.src.collectors.SHFE_data_collection import _sina_history_columns, _sina_history_record  # noqa: E402
+from backend.src.tasks.collectors_bridge import _prepare_daily_columns, _prepare_daily_record  # noqa: E402
+
+
+def synthetic_history(rows: int, seed: int = 7) -> pd.DataFrame:
+    """A frame shaped like ``_load_sina_history`` output: sorted ``date`` objects plus numeric columns."""
+    rng = np.random.default_rng(seed)
+    start = date(2000, 1, 3)
+    close = 120000 + np.cumsum(rng.normal(0, 800, rows))
+    frame = pd.DataFrame(
+        {
+            "date": [start + timedelta(days=offset) for offset in range(rows)],
+            "open": close + rng.normal(0, 300, rows),
+            "high": close + np.abs(rng.normal(0, 600, rows)),
+            "low": close - np.abs(rng.normal(0, 600, rows)),
+            "close": close,
+            "volume": rng.integers(50000, 400000, rows).astype(float),
+            "open_interest": rng.integers(80000, 200000, rows).astype(float),
+            "settlement": close + rng.normal(0, 100, rows),
+        }
+    )
+    # Sprinkle blanks so both paths exercise their missing-value handling.
+    frame.loc[rng.choice(rows, size=max(1, rows // 50), replace=False), "settlement"] = np.nan
+    return frame
+
+
+def per_row(frame: pd.DataFrame, dates: List[str]) -> List[tuple]:
+    rows = []
+    for date_str in dates:
+        record = _sina_history_record(frame, date_str, 0.0)
+        if record is not None:
+            rows.append(_prepare_daily_record("shfe", record).to_row())
+    return rows
+
+
+def columnar(frame: pd.DataFrame, dates: List[str]) -> List[tuple]:
+    return _prepare_daily_columns("shfe", _sina_history_columns(frame, dates, 0.0)).rows()
+
+
+def best_of(repeat: int, function: Callable[[], List[tuple]]) -> tuple[float, List[tuple]]:
+    best = float("inf")
+    result: List[tuple] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def time_sqlite(rows: List[tuple]) -> float:
+    from backend.src.config import get_settings
+    from backend.src.storage import init_db, save_daily_market_rows
+
+    with tempfile.TemporaryDirectory() as tmp:
+        object.__setattr__(get_settings(), "database_url", f"sqlite:///{Path(tmp) / 'bench.db'}")
+        init_db()
+        started = time.perf_counter()
+        save_daily_market_rows(rows)
+        return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark daily history normalisation paths.")
+    parser.add_argument("--rows", type=int, default=5000, help="synthetic history rows")
+    parser.add_argument("--repeat", type=int, default=5, help="best-of repetitions per path")
+    parser.add_argument("--sqlite", action="store_true", help="also time executemany into a temporary SQLite file")
+    args = parser.parse_args()
+
+    frame = synthetic_history(args.rows)
+    dates = [value.isoformat() for value in frame["date"]]
+
+    row_seconds, row_tuples = best_of(args.repeat, lambda: per_row(frame, dates))
+    column_seconds, column_tuples = best_of(args.repeat, lambda: columnar(frame, dates))
+
+    # Market values must agree; extras differ by design (columnar rows carry none).
+    mismatched = sum(1 for left, right in zip(row_tuples, column_tuples) if left[:-1] != right[:-1])
+    print(f"rows              {len(column_tuples)} (per-row {len(row_tuples)}, mismatched {mismatched})")
+    assert len(row_tuples) == len(column_tuples) and mismatched == 0, "per-row and columnar paths disagree"
+    print(f"per-row           {row_seconds * 1000:9.1f} ms")
+    print(f"columnar          {column_seconds * 1000:9.1f} ms  (x{row_seconds / max(column_seconds, 1e-9):.1f})")
+    if args.sqlite:
+        print(f"sqlite executemany {time_sqlite(column_tuples) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+"""
+Build the yearly report data set from the annual PPTX in a single pass.
+
+Stages run in memory over one opened PPTX:
+    extract  -> per-slide chart payloads (incremental, see extract_ppt_charts.py)
+    patch    -> slide-06 bar/line combo chart (patch_slide06_combo.py)
+    reorder  -> chronological category order (reorder_yearly_charts.py)
+    markdown -> consolidated chart tables split per slide (split_report_markdown.py)
+    frontend -> unhashed slide-XX.json copies in frontend/public/yearly
+
+Slide payloads are written once as content-hashed files (slide-06.<hash>.json)
+together with a manifest.json that both the API and the frontend read. The
+frontend copies back the static fallback used when the API is unreachable, so
+they are rewritten by every build. Once a manifest exists the API no longer
+reads the unhashed slide-XX.json files in the output directory, so they are
+removed along with stale hashed artifacts.
+
+Usage:
+    python scripts/build_yearly_data.py
+Optional flags:
+    --pptx PATH           年报 PPTX（默认在 docs/ 下查找）
+    --out-dir PATH        产物目录（默认 backend/resources/yearly_data）
+    --markdown PATH       图表 Markdown 索引（默认 docs/年报/年报数据.md）
+    --frontend-dir PATH   前端静态回退副本目录（默认 frontend/public/yearly）
+    --skip-frontend       不同步前端静态副本
+    --workers N           并行抽取的进程数
+    --force               忽略缓存，全量重建
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from extract_ppt_charts import (
+    MANIFEST_VERSION,
+    ChartData,
+    build_json_payloads,
+    build_markdown,
+    extract_charts_incremental,
+    load_manifest,
+    load_workbooks,
+    save_manifest,
+    write_text_if_changed,
+)
+from patch_slide06_combo import CHART_PATH as COMBO_CHART_PATH
+from patch_slide06_combo import apply_combo_patch, extract_combo_series, find_pptx
+from reorder_yearly_charts import reorder_payload
+from split_report_markdown import split_markdown_text
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = Path(__file__).resolve().parent
+DEFAULT_OUT_DIR = REPO_ROOT / "backend" / "resources" / "yearly_data"
+DEFAULT_FRONTEND_DIR = REPO_ROOT / "frontend" / "public" / "yearly"
+DEFAULT_MARKDOWN = REPO_ROOT / "docs" / "年报" / "年报数据.md"
+DEFAULT_CACHE = REPO_ROOT / ".cache" / "yearly" / "extract-manifest.json"
+
+MANIFEST_FILENAME = "manifest.json"
+BUILD_MANIFEST_VERSION = 1
+HASH_LENGTH = 12
+HASHED_ARTIFACT_RE = re.compile(r"^slide-\d{2}\.[0-9a-f]{%d}\.json$" % HASH_LENGTH)
+# Pre-manifest layout; still what the frontend fallback serves from frontend/public/yearly.
+PLAIN_SLIDE_RE = re.compile(r"^slide-\d{2}\.json$")
+
+# Scripts whose logic shapes the artifacts; editing any of them invalidates the build key.
+PIPELINE_SOURCES = (
+    "build_yearly_data.py",
+    "extract_ppt_charts.py",
+    "patch_slide06_combo.py",
+    "reorder_yearly_charts.py",
+    "split_report_markdown.py",
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build yearly slide JSON, manifest and markdown from the annual PPTX.")
+    parser.add_argument("--pptx", type=Path, help="Path to the PPTX (default: first *.pptx under docs/).")
+    parser.add_argument("--out-dir", type=Path, default=DEFAULT_OUT_DIR, help="Directory for hashed slide JSON and manifest.json.")
+    parser.add_argument("--markdown", type=Path, default=DEFAULT_MARKDOWN, help="Markdown index path; per-slide files go to its slides/ sibling.")
+    parser.add_argument("--frontend-dir", type=Path, default=DEFAULT_FRONTEND_DIR, help="Directory for the frontend's static fallback copies.")
+    parser.add_argument("--skip-frontend", action="store_true", help="Do not sync the frontend's static fallback copies.")
+    parser.add_argument("--cache", type=Path, default=DEFAULT_CACHE, help="Chart extraction cache used for incremental builds.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes used to extract changed charts.")
+    parser.add_argument("--force", action="store_true", help="Ignore caches and rebuild everything.")
+    return parser.parse_args()
+
+
+def compute_build_key(pptx_path: Path) -> str:
+    digest = hashlib.sha256(f"v{BUILD_MANIFEST_VERSION}".encode("ascii"))
+    with pptx_path.open("rb") as stream:
+        for chunk in iter(lambda: stream.read(1 << 20), b""):
+            digest.update(chunk)
+    for name in PIPELINE_SOURCES:
+        digest.update((SCRIPTS_DIR / name).read_bytes())
+    return digest.hexdigest()
+
+
+def load_build_manifest(out_dir: Path) -> Dict[str, object]:
+    path = out_dir / MANIFEST_FILENAME
+    if not path.exists():
+        return {}
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def artifacts_present(out_dir: Path, manifest: Dict[str, object], frontend_dir: Optional[Path] = None) -> bool:
+    slides = manifest.get("slides")
+    if not isinstance(slides, list):
+        return False
+    entries = [entry for entry in slides if isinstance(entry, dict)]
+    if not all((out_dir / str(entry.get("file"))).exists() for entry in entries):
+        return False
+    if frontend_dir is None:
+        return True
+    return all((frontend_dir / f"slide-{int(entry['slide']):02d}.json").exists() for entry in entries)
+
+
+# ---------------------------------------------------------------------------
+# Stages
+# ---------------------------------------------------------------------------
+
+def stage_patch(ppt: zipfile.ZipFile, payloads: Dict[int, Dict[str, object]]) -> List[int]:
+    """Apply the slide-06 combo chart patch to whichever slide carries that chart."""
+    if COMBO_CHART_PATH not in ppt.namelist():
+        return []
+    categories, series_payloads = extract_combo_series(ppt, load_workbooks(ppt))
+    return [slide for slide, payload in payloads.items() if apply_combo_patch(payload, categories, series_payloads)]
+
+
+def stage_reorder(payloads: Dict[int, Dict[str, object]]) -> List[int]:
+    return [slide for slide, payload in payloads.items() if reorder_payload(payload)]
+
+
+def stage_markdown(charts: List[ChartData], markdown_path: Path) -> int:
+    """Render the chart tables and write only the per-slide documents that changed."""
+    index_text, slides = split_markdown_text(build_markdown(charts))
+    slides_dir = markdown_path.parent / "slides"
+    slides_dir.mkdir(parents=True, exist_ok=True)
+    written = sum(write_text_if_changed(slides_dir / name, content) for name, content in slides.items())
+    written += write_text_if_changed(markdown_path, index_text)
+    return written
+
+
+def _payload_text(payload: Dict[str, object]) -> str:
+    return json.dumps(payload, ensure_ascii=False, indent=2) + "\n"
+
+
+def stage_frontend(frontend_dir: Path, payloads: Dict[int, Dict[str, object]]) -> int:
+    """Sync the unhashed copies the frontend falls back to, dropping slides that no longer exist."""
+    frontend_dir.mkdir(parents=True, exist_ok=True)
+    expected = {f"slide-{slide:02d}.json": _payload_text(payload) for slide, payload in payloads.items()}
+    written = sum(write_text_if_changed(frontend_dir / name, text) for name, text in sorted(expected.items()))
+    for path in frontend_dir.iterdir():
+        if PLAIN_SLIDE_RE.match(path.name) and path.name not in expected:
+            path.unlink()
+    return written
+
+
+def write_artifacts(out_dir: Path, payloads: Dict[int, Dict[str, object]]) -> List[Dict[str, object]]:
+    """Write each slide payload under a content-hashed name unless it already exists."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    entries: List[Dict[str, object]] = []
+    for slide in sorted(payloads):
+        payload = payloads[slide]
+        text = _payload_text(payload)
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        filename = f"slide-{slide:02d}.{digest[:HASH_LENGTH]}.json"
+        target = out_dir / filename
+        if not target.exists():
+            tmp_path = target.with_name(filename + ".tmp")
+            tmp_path.write_text(text, encoding="utf-8")
+            os.replace(tmp_path, target)
+        entries.append(
+            {
+                "slide": slide,
+                "title": payload.get("title"),
+                "file": filename,
+                "hash": digest,
+                "chartCount": len(payload.get("charts") or []),  # type: ignore[arg-type]
+            }
+        )
+    return entries
+
+
+def prune_artifacts(out_dir: Path, entries: List[Dict[str, object]]) -> int:
+    """Remove unreferenced hashed artifacts and the pre-manifest slide-XX.json files."""
+    referenced = {entry["file"] for entry in entries}
+    removed = 0
+    for path in out_dir.iterdir():
+        stale_hashed = HASHED_ARTIFACT_RE.match(path.name) and path.name not in referenced
+        if stale_hashed or PLAIN_SLIDE_RE.match(path.name):
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def build(
+    pptx_path: Path,
+    out_dir: Path,
+    markdown_path: Path,
+    cache_path: Path,
+    workers: int,
+    force: bool = False,
+    frontend_dir: Optional[Path] = DEFAULT_FRONTEND_DIR,
+) -> Optional[Dict[str, object]]:
+    """Run every stage and return the new manifest, or None when already up to date."""
+    build_key = compute_build_key(pptx_path)
+    previous = load_build_manifest(out_dir)
+    if not force and previous.get("buildKey") == build_key and artifacts_present(out_dir, previous, frontend_dir):
+        return None
+
+    cache = {} if force else load_manifest(cache_path)
+    with zipfile.ZipFile(pptx_path) as ppt:
+        charts, chart_entries, extracted = extract_charts_incremental(ppt, cache, workers)
+        payloads = build_json_payloads(charts)
+        patched = stage_patch(ppt, payloads)
+    save_manifest(cache_path, {"version": MANIFEST_VERSION, "charts": chart_entries, "slides": {}})
+    reordered = stage_reorder(payloads)
+    markdown_written = stage_markdown(charts, markdown_path)
+
+    entries = write_artifacts(out_dir, payloads)
+    manifest: Dict[str, object] = {
+        "version": BUILD_MANIFEST_VERSION,
+        "buildKey": build_key,
+        "source": pptx_path.name,
+        "slides": entries,
+    }
+    save_manifest(out_dir / MANIFEST_FILENAME, manifest)
+    removed = prune_artifacts(out_dir, entries)
+    frontend_written = stage_frontend(frontend_dir, payloads) if frontend_dir is not None else 0
+    print(
+        f"Extracted {extracted}/{len(charts)} charts, patched slides {patched or '-'}, "
+        f"reordered slides {reordered or '-'}, {markdown_written} markdown files written, "
+        f"{frontend_written} frontend copies updated, {removed} stale artifacts removed"
+    )
+    return manifest
+
+
+def main() -> None:
+    args = parse_args()
+    pptx_path = args.pptx or find_pptx(REPO_ROOT / "docs")
+    frontend_dir = None if args.skip_frontend else args.frontend_dir
+    manifest = build(pptx_path, args.out_dir, args.markdown, args.cache, args.workers, args.force, frontend_dir)
+    if manifest is None:
+        print(f"{args.out_dir / MANIFEST_FILENAME} is up to date with {pptx_path.name}")
+        return
+    print(f"Wrote {len(manifest['slides'])} slides to {args.out_dir}")  # type: ignore[arg-type]
+
+
+if __name__ == "__main__":
+    main()
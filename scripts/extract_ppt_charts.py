@@ -2,17 +2,20 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import io
 import json
 import math
+import os
 import posixpath
 import re
 import zipfile
 from collections import defaultdict
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from pathlib import Path, PurePosixPath
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 import xml.etree.ElementTree as ET
 
 CHART_NS = {"c": "http://schemas.openxmlformats.org/drawingml/2006/chart"}
@@ -21,6 +24,13 @@ PRESENTATION_NS = {"p": "http://schemas.openxmlformats.org/presentationml/2006/m
 REL_NS = {"r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships"}
 PKG_REL_NS = {"rel": "http://schemas.openxmlformats.org/package/2006/relationships"}
 SHEET_NS = {"s": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+PACKAGE_REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/package"
+
+SHEET_ROW_TAG = f"{{{SHEET_NS['s']}}}row"
+SHEET_CELL_TAG = f"{{{SHEET_NS['s']}}}c"
+
+# Bump whenever the extraction logic changes so cached chart payloads are discarded.
+MANIFEST_VERSION = 1
 
 EXCEL_DATE_BASE = datetime(1899, 12, 30)
 
@@ -131,18 +141,26 @@ class EmbeddedWorkbook:
                 sheet_paths[name] = target
         return sheet_paths
 
+    def _iter_sheet_rows(self, path: str) -> Iterable[ET.Element]:
+        """Stream <row> elements from a sheet, releasing each one once consumed."""
+        with self._zip.open(path) as stream:
+            for _, element in ET.iterparse(stream, events=("end",)):
+                if element.tag != SHEET_ROW_TAG:
+                    continue
+                yield element
+                element.clear()
+
     def _load_sheet(self, sheet_name: str) -> Dict[int, Dict[int, Optional[float | str]]]:
         if sheet_name in self._sheet_cache:
             return self._sheet_cache[sheet_name]
         path = self._sheet_paths.get(sheet_name)
         if not path:
             raise KeyError(f"Sheet {sheet_name} not found in workbook {self.name}")
-        root = ET.fromstring(self._zip.read(path))
         data: Dict[int, Dict[int, Optional[float | str]]] = {}
-        for row in root.findall(".//s:row", SHEET_NS):
+        for row in self._iter_sheet_rows(path):
             row_idx = int(row.get("r", "0"))
             row_values: Dict[int, Optional[float | str]] = {}
-            for cell in row.findall("s:c", SHEET_NS):
+            for cell in row.iter(SHEET_CELL_TAG):
                 ref = cell.get("r")
                 if not ref:
                     continue
@@ -266,29 +284,65 @@ def normalize_path(base: str, target: str) -> str:
     return posixpath.normpath(joined)
 
 
-def load_workbooks(ppt: zipfile.ZipFile) -> Dict[str, EmbeddedWorkbook]:
-    workbooks: Dict[str, EmbeddedWorkbook] = {}
-    for name in ppt.namelist():
-        if not name.startswith("ppt/embeddings/") or not name.endswith(".xlsx"):
-            continue
-        workbooks[name] = EmbeddedWorkbook(name, ppt.read(name))
-    return workbooks
+class LazyWorkbooks(Mapping[str, EmbeddedWorkbook]):
+    """Read-only mapping of embedded workbook paths that parses each workbook on first access.
+
+    Keys, ``len()`` and membership cover every embedded workbook; iterating ``items()`` or
+    ``values()`` parses them all.
+    """
+
+    def __init__(self, ppt: zipfile.ZipFile):
+        self._ppt = ppt
+        self._names = sorted(
+            name
+            for name in ppt.namelist()
+            if name.startswith("ppt/embeddings/") and name.endswith(".xlsx")
+        )
+        self._known = frozenset(self._names)
+        self._parsed: Dict[str, EmbeddedWorkbook] = {}
 
+    def __getitem__(self, name: str) -> EmbeddedWorkbook:
+        workbook = self._parsed.get(name)
+        if workbook is None:
+            if name not in self._known:
+                raise KeyError(name)
+            workbook = self._parsed[name] = EmbeddedWorkbook(name, self._ppt.read(name))
+        return workbook
 
-def get_chart_workbook(ppt: zipfile.ZipFile, chart_path: str, workbooks: Dict[str, EmbeddedWorkbook]) -> Optional[EmbeddedWorkbook]:
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._known
+
+
+def load_workbooks(ppt: zipfile.ZipFile) -> Mapping[str, EmbeddedWorkbook]:
+    return LazyWorkbooks(ppt)
+
+
+def chart_workbook_paths(ppt: zipfile.ZipFile, chart_path: str) -> List[str]:
     rel_path = f"{posixpath.dirname(chart_path)}/_rels/{posixpath.basename(chart_path)}.rels"
     if rel_path not in ppt.namelist():
-        return None
+        return []
     rels = ET.fromstring(ppt.read(rel_path))
+    paths: List[str] = []
     for rel in rels.findall("rel:Relationship", PKG_REL_NS):
-        if rel.get("Type") == "http://schemas.openxmlformats.org/officeDocument/2006/relationships/package":
+        if rel.get("Type") == PACKAGE_REL_TYPE:
             target = rel.get("Target")
             if not target:
                 continue
-            normalized = normalize_path(chart_path, target)
-            workbook = workbooks.get(normalized)
-            if workbook:
-                return workbook
+            paths.append(normalize_path(chart_path, target))
+    return paths
+
+
+def get_chart_workbook(ppt: zipfile.ZipFile, chart_path: str, workbooks: Mapping[str, EmbeddedWorkbook]) -> Optional[EmbeddedWorkbook]:
+    for path in chart_workbook_paths(ppt, chart_path):
+        workbook = workbooks.get(path)
+        if workbook:
+            return workbook
     return None
 
 
@@ -314,7 +368,7 @@ def extract_chart_data(
     chart_path: str,
     slide_map: Dict[str, List[int]],
     slide_titles: Dict[int, str],
-    workbooks: Dict[str, EmbeddedWorkbook],
+    workbooks: Mapping[str, EmbeddedWorkbook],
     theme_colors: Dict[str, str],
 ) -> ChartData:
     root = ET.fromstring(ppt.read(chart_path))
@@ -567,14 +621,33 @@ def build_json_payloads(charts: List[ChartData]) -> Dict[int, Dict[str, object]]
     return payloads
 
 
-def write_json_payloads(json_dir: Path, payloads: Dict[int, Dict[str, object]]) -> None:
+def slide_json_filename(slide: int) -> str:
+    return f"slide-{slide:02d}.json" if slide > 0 else "slide-00.json"
+
+
+def write_json_payloads(
+    json_dir: Path,
+    payloads: Dict[int, Dict[str, object]],
+    previous_hashes: Optional[Dict[str, str]] = None,
+) -> Dict[str, str]:
+    """Write per-slide JSON files, skipping those whose content hash is unchanged.
+
+    Returns the content hash of every payload keyed by filename so callers can
+    persist it for the next incremental run.
+    """
     json_dir.mkdir(parents=True, exist_ok=True)
+    previous_hashes = previous_hashes or {}
+    hashes: Dict[str, str] = {}
     for slide, payload in payloads.items():
-        filename = f"slide-{slide:02d}.json" if slide > 0 else "slide-00.json"
-        (json_dir / filename).write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        filename = slide_json_filename(slide)
+        text = json.dumps(payload, ensure_ascii=False, indent=2)
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        hashes[filename] = digest
+        target = json_dir / filename
+        if previous_hashes.get(filename) == digest and target.exists():
+            continue
+        target.write_text(text, encoding="utf-8")
+    return hashes
 
 
 def build_markdown(charts: List[ChartData]) -> str:
@@ -650,6 +723,163 @@ def build_markdown(charts: List[ChartData]) -> str:
                 lines.append('')
     return "\n".join(lines).strip() + "\n"
 
+def chart_fingerprint(
+    ppt: zipfile.ZipFile,
+    chart_path: str,
+    slide_map: Dict[str, List[int]],
+    slide_titles: Dict[int, str],
+    theme_colors: Dict[str, str],
+) -> str:
+    """Hash everything that feeds a chart payload without decompressing any member.
+
+    The chart XML, its relationships and the embedded workbook are identified by the
+    CRC-32 and size recorded in the zip central directory; slide placement, titles and
+    theme colours are hashed as JSON because they are baked into ChartData too.
+    """
+    names = set(ppt.namelist())
+    rel_path = f"{posixpath.dirname(chart_path)}/_rels/{posixpath.basename(chart_path)}.rels"
+    members = [chart_path, rel_path, *chart_workbook_paths(ppt, chart_path)]
+    digest = hashlib.sha256(f"v{MANIFEST_VERSION}".encode("ascii"))
+    for member in members:
+        if member not in names:
+            continue
+        info = ppt.getinfo(member)
+        digest.update(f"{member}:{info.CRC:08x}:{info.file_size}".encode("utf-8"))
+    slides = slide_map.get(chart_path, [])
+    context = {
+        "slides": slides,
+        "titles": [slide_titles.get(num, "") for num in slides],
+        "theme": theme_colors,
+    }
+    digest.update(json.dumps(context, ensure_ascii=False, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def chart_from_dict(data: Dict[str, object]) -> ChartData:
+    series = [SeriesData(**item) for item in data.get("series", [])]  # type: ignore[union-attr]
+    return ChartData(**{**data, "series": series})  # type: ignore[arg-type]
+
+
+def load_manifest(path: Optional[Path]) -> Dict[str, object]:
+    if path is None or not path.exists():
+        return {}
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest
+
+
+def save_manifest(path: Path, manifest: Dict[str, object]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+_WORKER_PPT: Optional[zipfile.ZipFile] = None
+_WORKER_WORKBOOKS: Optional[Mapping[str, EmbeddedWorkbook]] = None
+
+
+def _init_extract_worker(pptx_path: str) -> None:
+    global _WORKER_PPT, _WORKER_WORKBOOKS
+    _WORKER_PPT = zipfile.ZipFile(pptx_path)
+    _WORKER_WORKBOOKS = load_workbooks(_WORKER_PPT)
+
+
+def _extract_chart_in_worker(
+    chart_path: str,
+    slide_map: Dict[str, List[int]],
+    slide_titles: Dict[int, str],
+    theme_colors: Dict[str, str],
+) -> ChartData:
+    assert _WORKER_PPT is not None and _WORKER_WORKBOOKS is not None
+    return extract_chart_data(_WORKER_PPT, chart_path, slide_map, slide_titles, _WORKER_WORKBOOKS, theme_colors)
+
+
+def extract_charts(
+    pptx_path: Path,
+    chart_paths: List[str],
+    slide_map: Dict[str, List[int]],
+    slide_titles: Dict[int, str],
+    theme_colors: Dict[str, str],
+    workers: int = 1,
+) -> Dict[str, ChartData]:
+    """Extract the given charts, fanning out to a process pool when it pays off.
+
+    Each worker opens the PPTX once and parses embedded workbooks lazily, so a
+    workbook is only decompressed by the processes whose charts reference it.
+    """
+    if not chart_paths:
+        return {}
+    slide_map = dict(slide_map)
+    workers = max(1, min(workers, len(chart_paths)))
+    if workers == 1:
+        with zipfile.ZipFile(pptx_path) as ppt:
+            workbooks = load_workbooks(ppt)
+            return {
+                chart_path: extract_chart_data(ppt, chart_path, slide_map, slide_titles, workbooks, theme_colors)
+                for chart_path in chart_paths
+            }
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_extract_worker,
+        initargs=(str(pptx_path),),
+    ) as pool:
+        futures = {
+            chart_path: pool.submit(_extract_chart_in_worker, chart_path, slide_map, slide_titles, theme_colors)
+            for chart_path in chart_paths
+        }
+        return {chart_path: future.result() for chart_path, future in futures.items()}
+
+
+def extract_charts_incremental(
+    ppt: zipfile.ZipFile,
+    manifest: Dict[str, object],
+    workers: int = 1,
+) -> Tuple[List[ChartData], Dict[str, Dict[str, object]], int]:
+    """Reuse cached charts whose fingerprint is unchanged and re-extract the rest.
+
+    Returns the charts in chart-path order, the refreshed chart manifest entries and
+    the number of charts that had to be re-extracted.
+    """
+    cached_entries: Dict[str, Dict[str, object]] = manifest.get("charts") or {}  # type: ignore[assignment]
+    slide_titles = load_slide_titles(ppt)
+    slide_chart_map = map_charts_to_slides(ppt)
+    chart_paths = sorted(name for name in ppt.namelist() if name.startswith("ppt/charts/chart") and name.endswith(".xml"))
+    theme_colors = load_theme_colors(ppt)
+    fingerprints = {
+        chart_path: chart_fingerprint(ppt, chart_path, slide_chart_map, slide_titles, theme_colors)
+        for chart_path in chart_paths
+    }
+
+    reused: Dict[str, ChartData] = {}
+    stale: List[str] = []
+    for chart_path in chart_paths:
+        entry = cached_entries.get(chart_path)
+        if entry and entry.get("hash") == fingerprints[chart_path]:
+            reused[chart_path] = chart_from_dict(entry["data"])  # type: ignore[arg-type]
+        else:
+            stale.append(chart_path)
+
+    extracted = extract_charts(Path(ppt.filename), stale, slide_chart_map, slide_titles, theme_colors, workers)
+    charts = [reused.get(chart_path) or extracted[chart_path] for chart_path in chart_paths]
+    entries = {
+        chart.chart_path: {"hash": fingerprints[chart.chart_path], "data": asdict(chart)}
+        for chart in charts
+    }
+    return charts, entries, len(stale)
+
+
+def write_text_if_changed(path: Path, text: str) -> bool:
+    if path.exists() and path.read_text(encoding="utf-8") == text:
+        return False
+    path.write_text(text, encoding="utf-8")
+    return True
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Extract chart data from a PPTX file.")
     parser.add_argument("pptx", type=Path, help="Path to PPTX file.")
@@ -659,22 +889,36 @@ def main() -> None:
         type=Path,
         help="Optional directory to write per-slide JSON payloads.",
     )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        help="Content-hash manifest used for incremental runs (default: <output>.manifest.json).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes used to extract changed charts (default: CPU count).",
+    )
+    parser.add_argument("--force", action="store_true", help="Ignore the manifest and re-extract every chart.")
     args = parser.parse_args()
 
+    manifest_path = args.manifest or args.output.with_suffix(".manifest.json")
+    manifest = {} if args.force else load_manifest(manifest_path)
     with zipfile.ZipFile(args.pptx) as ppt:
-        slide_titles = load_slide_titles(ppt)
-        slide_chart_map = map_charts_to_slides(ppt)
-        workbooks = load_workbooks(ppt)
-        chart_paths = sorted(name for name in ppt.namelist() if name.startswith("ppt/charts/chart") and name.endswith(".xml"))
-        theme_colors = load_theme_colors(ppt)
-        charts: List[ChartData] = []
-        for chart_path in chart_paths:
-            charts.append(extract_chart_data(ppt, chart_path, slide_chart_map, slide_titles, workbooks, theme_colors))
-        markdown = build_markdown(charts)
-    args.output.write_text(markdown, encoding="utf-8")
+        charts, chart_entries, extracted_count = extract_charts_incremental(ppt, manifest, args.workers)
+
+    markdown = build_markdown(charts)
+    write_text_if_changed(args.output, markdown)
+    slide_hashes: Dict[str, str] = manifest.get("slides") or {}  # type: ignore[assignment]
     if args.json_dir:
         payloads = build_json_payloads(charts)
-        write_json_payloads(args.json_dir, payloads)
+        slide_hashes = write_json_payloads(args.json_dir, payloads, slide_hashes)
+    save_manifest(
+        manifest_path,
+        {"version": MANIFEST_VERSION, "charts": chart_entries, "slides": slide_hashes},
+    )
+    print(f"Extracted {extracted_count} of {len(charts)} charts ({len(charts) - extracted_count} unchanged)")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+"""
+End-to-end load test driven by the synthetic market generator.
+
+The scheduler's intraday cycle runs with backend/src/tasks/synthetic.py in
+place of the collectors bridge, at ``--speedup`` times the production polling
+rate, into a throwaway SQLite file. Intraday retention follows the simulated
+clock, so cleanup runs at the same accelerated pace. Meanwhile reader threads
+hit the dashboard endpoints in-process. The run ends with a throughput report:
+ticks/s against the production rate, dedup outcome, cycle latency, API
+latency per endpoint and the rows left after retention.
+
+Usage:
+    python scripts/load_synthetic.py --instruments 20 --speedup 1000
+Optional flags:
+    --instruments N       合成品种数量（默认 20，SHFE / LME 交易时段交替）
+    --speedup F           相对生产采集频率的倍数（默认 100）
+    --duration S          运行时长，秒（默认 30）
+    --interval S          模拟的采集间隔，秒（默认 NICKEL_INTRADAY_INTERVAL_SECONDS）
+    --retention-hours H   日内数据保留小时数（默认 NICKEL_INTRADAY_RETENTION_HOURS）
+    --start ISO           模拟时钟起点（默认当前时间，休市时取最近开盘）
+    --readers N           并发请求看板接口的线程数（默认 2，0 表示不压测接口）
+    --seed N              随机种子（默认 7）
+    --database PATH       写入指定 SQLite 文件而非临时文件
+    --json PATH           另存机器可读结果
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.src.config import get_retention_hours, get_session_calendar, get_settings  # noqa: E402
+from backend.src.tasks.synthetic import (  # noqa: E402
+    SyntheticClock,
+    SyntheticMarket,
+    default_start,
+    synthetic_instruments,
+)
+
+
+def _isolate(tmp: Path, database: Path | None, retention_hours: int | None) -> Path:
+    """Point storage and metrics at scratch paths (or the given database) and disable collector retries."""
+    settings = get_settings()
+    path = database or tmp / "load.db"
+    object.__setattr__(settings, "database_url", f"sqlite:///{path}")
+    object.__setattr__(settings, "metrics_dir", str(tmp / "metrics"))
+    object.__setattr__(settings, "max_retries", 0)
+    if retention_hours is not None:
+        object.__setattr__(settings, "intraday_retention_hours", retention_hours)
+    return path
+
+
+def _summarise(samples: List[float]) -> Dict[str, float]:
+    from backend.src.tasks.scheduler import _latency_summary
+
+    return {"count": len(samples), **_latency_summary(samples)}
+
+
+class DashboardReaders:
+    """Threads that cycle through the dashboard endpoints of every synthetic instrument until stopped."""
+
+    def __init__(self, instruments: List[Tuple[str, str]], curve_exchanges: List[str], threads: int) -> None:
+        self.paths = [f"/api/v1/dashboard/latest?exchange={exchange}&instrument={key}" for exchange, key in instruments]
+        self.paths += [
+            f"/api/v1/dashboard/intraday?exchange={exchange}&instrument={key}&limit=30" for exchange, key in instruments
+        ]
+        self.paths += [f"/api/v1/dashboard/curve?exchange={exchange}" for exchange in curve_exchanges]
+        self.threads = threads
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._samples: Dict[str, List[float]] = {}
+        self._statuses: Dict[str, Dict[str, int]] = {}
+        self._workers: List[threading.Thread] = []
+
+    def _run(self, offset: int) -> None:
+        from fastapi.testclient import TestClient
+
+        from backend.src.api.main import app
+
+        client = TestClient(app)
+        index = offset
+        while not self._stop.is_set():
+            path = self.paths[index % len(self.paths)]
+            index += 1
+            endpoint = path.split("?", 1)[0].rsplit("/", 1)[-1]
+            started = time.perf_counter()
+            status = client.get(path).status_code
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._samples.setdefault(endpoint, []).append(elapsed)
+                counts = self._statuses.setdefault(endpoint, {})
+                counts[str(status)] = counts.get(str(status), 0) + 1
+
+    def start(self) -> None:
+        for offset in range(self.threads):
+            worker = threading.Thread(target=self._run, args=(offset,), name=f"reader-{offset}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def stop(self, elapsed: float) -> Dict[str, Any]:
+        self._stop.set()
+        for worker in self._workers:
+            worker.join()
+        with self._lock:
+            requests = sum(len(samples) for samples in self._samples.values())
+            return {
+                "readers": self.threads,
+                "requests": requests,
+                "requests_per_second": round(requests / elapsed, 1) if elapsed else 0.0,
+                "endpoints": {
+                    endpoint: {**_summarise(samples), "status": self._statuses[endpoint]}
+                    for endpoint, samples in sorted(self._samples.items())
+                },
+            }
+
+
+def _storage_report(path: Path) -> Dict[str, Any]:
+    with sqlite3.connect(path) as conn:
+        intraday = conn.execute("SELECT COUNT(*) FROM intraday_snapshots").fetchone()[0]
+        curve = conn.execute("SELECT COUNT(*) FROM curve_snapshots").fetchone()[0]
+    return {
+        "intraday_rows": intraday,
+        "curve_rows": curve,
+        "database_mb": round(path.stat().st_size / 1_048_576, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Synthetic end-to-end load test of scheduler, storage and API.")
+    parser.add_argument("--instruments", type=int, default=20, help="number of synthetic instruments")
+    parser.add_argument("--speedup", type=float, default=100.0, help="multiple of the production polling rate")
+    parser.add_argument("--duration", type=float, default=30.0, help="wall seconds to run")
+    parser.add_argument("--interval", type=int, help="simulated polling interval in seconds")
+    parser.add_argument("--retention-hours", type=int, help="intraday retention window in hours")
+    parser.add_argument("--start", type=datetime.fromisoformat, help="simulated clock start (ISO8601)")
+    parser.add_argument("--readers", type=int, default=2, help="dashboard reader threads (0 disables)")
+    parser.add_argument("--seed", type=int, default=7, help="random seed")
+    parser.add_argument("--database", type=Path, help="write into this SQLite file instead of a temporary one")
+    parser.add_argument("--json", type=Path, help="also write the report as JSON")
+    args = parser.parse_args()
+
+    from backend.src.storage import init_db
+    from backend.src.tasks.job_ledger import JOB_LEDGER
+    from backend.src.tasks.scheduler import run_synthetic_load
+
+    with tempfile.TemporaryDirectory() as tmp_name:
+        database = _isolate(Path(tmp_name), args.database, args.retention_hours)
+        init_db()
+        instruments = synthetic_instruments(args.instruments)
+        calendar = get_session_calendar()
+        start = args.start
+        if start is not None and start.tzinfo is None:
+            start = start.replace(tzinfo=timezone.utc)
+        start = start or default_start(calendar, sorted({instrument.session for instrument in instruments}))
+        market = SyntheticMarket(instruments, SyntheticClock(start, args.speedup), seed=args.seed, calendar=calendar)
+
+        readers = DashboardReaders(
+            [(instrument.exchange, instrument.key) for instrument in instruments],
+            [instrument.exchange for instrument in instruments if instrument.session == "shfe"],
+            args.readers,
+        )
+        readers.start()
+        started = time.perf_counter()
+        try:
+            report: Dict[str, Any] = {"scheduler": run_synthetic_load(market, args.duration, interval=args.interval)}
+        finally:
+            report_api = readers.stop(time.perf_counter() - started)
+            JOB_LEDGER.close()
+        if args.readers:
+            report["api"] = report_api
+        report["storage"] = {**_storage_report(database), "retention_hours": get_retention_hours()}
+
+    scheduler = report["scheduler"]
+    cycle = scheduler["cycle_ms"]
+    print(
+        f"ticks {scheduler['ticks']} in {scheduler['wall_seconds']}s: {scheduler['ticks_per_second']}/s "
+        f"(target {scheduler['target_ticks_per_second']}/s, achieved x{scheduler['achieved_speedup']} production, "
+        f"{scheduler['late_cycles']} late cycles)"
+    )
+    print(
+        f"stored {scheduler['stored']} (inserted {scheduler['inserted']}, confirmed {scheduler['confirmed']}, "
+        f"failed {scheduler['failed']}); cycle p50 {cycle['p50_ms']} ms, p95 {cycle['p95_ms']} ms, max {cycle['max_ms']} ms"
+    )
+    print(f"simulated {scheduler['simulated_from']} -> {scheduler['simulated_to']}")
+    if "api" in report:
+        print(f"api {report['api']['requests']} requests ({report['api']['requests_per_second']}/s)")
+        for endpoint, stats in report["api"]["endpoints"].items():
+            print(f"  {endpoint:<10} p50 {stats['p50_ms']:>8} ms  p95 {stats['p95_ms']:>8} ms  status {stats['status']}")
+    storage = report["storage"]
+    print(
+        f"storage {storage['intraday_rows']} intraday / {storage['curve_rows']} curve rows after retention "
+        f"({storage['retention_hours']}h), {storage['database_mb']} MB"
+    )
+    if args.json:
+        args.json.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
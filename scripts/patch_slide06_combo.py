@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+import posixpath
 import zipfile
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
@@ -118,54 +119,66 @@ def extract_color(ser: ET.Element) -> Optional[str]:
     return None
 
 
+def extract_combo_series(
+    ppt: zipfile.ZipFile,
+    workbooks,
+    chart_path: str = CHART_PATH,
+) -> Tuple[List[Optional[str]], List[SeriesPayload]]:
+    workbook = get_chart_workbook(ppt, chart_path, workbooks)
+    if not workbook:
+        raise SystemExit(f"Embedded workbook for {posixpath.basename(chart_path)} not found.")
+    root = ET.fromstring(ppt.read(chart_path))
+    plot_area = root.find("c:chart/c:plotArea", CHART_NS)
+    if plot_area is None:
+        raise SystemExit(f"plotArea missing from {posixpath.basename(chart_path)}")
+    has_date_axis = root.find(".//c:dateAx", CHART_NS) is not None
+    categories: List[Optional[str]] = []
+    payloads: List[SeriesPayload] = []
+    for child in plot_area:
+        tag = child.tag.split("}")[-1]
+        if not tag.endswith("Chart"):
+            continue
+        render_as = "line" if "line" in tag.lower() else "bar"
+        ser_nodes = child.findall("c:ser", CHART_NS)
+        for index, ser in enumerate(ser_nodes):
+            text_node = ser.find(".//a:t", {**CHART_NS, **DRAWING_NS})
+            if text_node is not None and text_node.text:
+                name = text_node.text
+            else:
+                name = ser.findtext(".//c:v", default=f"Series {index + 1}", namespaces=CHART_NS)
+            if not categories:
+                categories = read_category_values(ser.find("c:cat", CHART_NS), workbook, has_date_axis)
+            values = read_axis_values(ser.find("c:val", CHART_NS), workbook)
+            payloads.append(
+                SeriesPayload(
+                    name=name or f"Series {index + 1}",
+                    values=values,
+                    color=extract_color(ser),
+                    render_as=render_as,
+                )
+            )
+    return categories, payloads
+
+
 def extract_series_from_chart(ppt_path: Path) -> Tuple[List[Optional[str]], List[SeriesPayload]]:
     with zipfile.ZipFile(ppt_path) as ppt:
-        workbooks = load_workbooks(ppt)
-        workbook = get_chart_workbook(ppt, CHART_PATH, workbooks)
-        if not workbook:
-            raise SystemExit("Embedded workbook for chart6.xml not found.")
-        root = ET.fromstring(ppt.read(CHART_PATH))
-        plot_area = root.find("c:chart/c:plotArea", CHART_NS)
-        if plot_area is None:
-            raise SystemExit("plotArea missing from chart6.xml")
-        has_date_axis = root.find(".//c:dateAx", CHART_NS) is not None
-        categories: List[Optional[str]] = []
-        payloads: List[SeriesPayload] = []
-        for child in plot_area:
-            tag = child.tag.split("}")[-1]
-            if not tag.endswith("Chart"):
-                continue
-            render_as = "line" if "line" in tag.lower() else "bar"
-            ser_nodes = child.findall("c:ser", CHART_NS)
-            for index, ser in enumerate(ser_nodes):
-                text_node = ser.find(".//a:t", {**CHART_NS, **DRAWING_NS})
-                if text_node is not None and text_node.text:
-                    name = text_node.text
-                else:
-                    name = ser.findtext(".//c:v", default=f"Series {index + 1}", namespaces=CHART_NS)
-                if not categories:
-                    categories = read_category_values(ser.find("c:cat", CHART_NS), workbook, has_date_axis)
-                values = read_axis_values(ser.find("c:val", CHART_NS), workbook)
-                payloads.append(
-                    SeriesPayload(
-                        name=name or f"Series {index + 1}",
-                        values=values,
-                        color=extract_color(ser),
-                        render_as=render_as,
-                    )
-                )
-        return categories, payloads
+        return extract_combo_series(ppt, load_workbooks(ppt))
 
 
-def update_slide_json(json_path: Path, categories: List[Optional[str]], series_payloads: List[SeriesPayload]) -> None:
-    data = json.loads(json_path.read_text(encoding="utf-8"))
+def apply_combo_patch(
+    data: dict,
+    categories: List[Optional[str]],
+    series_payloads: List[SeriesPayload],
+    chart_path: str = CHART_PATH,
+) -> bool:
+    """Rewrite the combo chart inside a slide payload in place; False if it is absent."""
     combo_chart = None
     for chart in data.get("charts", []):
-        if chart.get("chartPath") == CHART_PATH:
+        if chart.get("chartPath") == chart_path:
             combo_chart = chart
             break
     if combo_chart is None:
-        raise SystemExit(f"{json_path} does not contain {CHART_PATH}")
+        return False
 
     if categories:
         combo_chart["categoryLabels"] = categories
@@ -187,6 +200,13 @@ def update_slide_json(json_path: Path, categories: List[Optional[str]], series_p
             "dataMin": min(numeric_values),
             "dataMax": max(numeric_values),
         }
+    return True
+
+
+def update_slide_json(json_path: Path, categories: List[Optional[str]], series_payloads: List[SeriesPayload]) -> None:
+    data = json.loads(json_path.read_text(encoding="utf-8"))
+    if not apply_combo_patch(data, categories, series_payloads):
+        raise SystemExit(f"{json_path} does not contain {CHART_PATH}")
     json_path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
 
 
@@ -74,17 +74,24 @@ def reorder_chart(chart: dict) -> bool:
     return True
 
 
-def process_file(path: Path, dry_run: bool, indent: int) -> None:
-    data = json.loads(path.read_text(encoding="utf-8"))
+def reorder_payload(data: dict) -> List[int] | None:
+    """Reorder every chart of a slide payload in place; None when there is no charts array."""
     charts = data.get("charts")
     if not isinstance(charts, list):
-        print(f"{path}: no charts array, skipped")
-        return
-
+        return None
     changed_indices: List[int] = []
     for idx, chart in enumerate(charts):
         if isinstance(chart, dict) and reorder_chart(chart):
             changed_indices.append(idx)
+    return changed_indices
+
+
+def process_file(path: Path, dry_run: bool, indent: int) -> None:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    changed_indices = reorder_payload(data)
+    if changed_indices is None:
+        print(f"{path}: no charts array, skipped")
+        return
 
     if not changed_indices:
         print(f"{path}: already in chronological order or unsupported labels")
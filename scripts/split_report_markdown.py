@@ -4,20 +4,15 @@ import re
 from pathlib import Path
 
 
-def split_markdown(source: Path) -> None:
-    """Split a consolidated '年报数据.md' into per-slide files plus an index."""
-    if not source.exists():
-        raise FileNotFoundError(source)
-    slides_dir = source.parent / "slides"
-    slides_dir.mkdir(parents=True, exist_ok=True)
-
+def split_markdown_text(text: str) -> tuple[str, dict[str, str]]:
+    """Split consolidated markdown into an index document and per-slide documents keyed by filename."""
     sections: list[tuple[int, str, list[str]]] = []
     pattern = re.compile(r"^##\s+Slide\s+(\d+):\s*(.*)$")
     current_lines: list[str] | None = None
     current_num: int | None = None
     current_title: str | None = None
 
-    for line in source.read_text(encoding="utf-8").splitlines():
+    for line in text.splitlines():
         match = pattern.match(line)
         if match:
             if current_lines is not None and current_num is not None and current_title is not None:
@@ -40,21 +35,34 @@ def split_markdown(source: Path) -> None:
         "数据表拆分为每页独立文件，按需打开以避免单个 Markdown 过大。",
         "",
     ]
+    slides: dict[str, str] = {}
 
     for num, title, lines in sorted(sections, key=lambda item: item[0]):
         relative_name = f"slide-{num:02d}.md"
-        target = slides_dir / relative_name
         section = "\n".join(lines).strip()
         section_lines = section.splitlines()
         if section_lines:
             header = section_lines[0]
             if header.startswith("##"):
                 section_lines[0] = "# " + header[3:]
-        target.write_text("\n".join(section_lines).strip() + "\n", encoding="utf-8")
+        slides[relative_name] = "\n".join(section_lines).strip() + "\n"
         index_lines.append(f"- [Slide {num}: {title}](slides/{relative_name})")
 
     index_lines.append("")
-    source.write_text("\n".join(index_lines), encoding="utf-8")
+    return "\n".join(index_lines), slides
+
+
+def split_markdown(source: Path) -> None:
+    """Split a consolidated '年报数据.md' into per-slide files plus an index."""
+    if not source.exists():
+        raise FileNotFoundError(source)
+    slides_dir = source.parent / "slides"
+    slides_dir.mkdir(parents=True, exist_ok=True)
+
+    index_text, slides = split_markdown_text(source.read_text(encoding="utf-8"))
+    for relative_name, content in slides.items():
+        (slides_dir / relative_name).write_text(content, encoding="utf-8")
+    source.write_text(index_text, encoding="utf-8")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+"""
+Merge and summarise the span traces written with NICKEL_TRACE_ENABLED.
+
+Every scheduler / API process writes its own Chrome Trace Event file under
+NICKEL_TRACE_DIR. This script merges them into one ``{"traceEvents": [...]}``
+document (open it in ui.perfetto.dev or chrome://tracing: scheduler job runs,
+their fetch / normalise / save spans and the API requests share one epoch
+timeline) and prints per-span latency, capture-to-dashboard latency, and the
+spans of the slowest delivered traces.
+
+Usage:
+    python scripts/trace_report.py --output merged.trace.json
+Optional flags:
+    --dir PATH            trace 目录（默认 NICKEL_TRACE_DIR）
+    --output PATH         另存合并后的 trace 文件
+    --slowest N           列出端到端最慢的 N 条 trace 明细（默认 5）
+    --json PATH           另存机器可读统计
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.src.config import get_settings  # noqa: E402
+from backend.src.tracing import DELIVERY_CATEGORY, TRACE_SUFFIX, load_trace_events  # noqa: E402
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+
+    def pick(quantile: float) -> float:
+        return ordered[min(len(ordered) - 1, int(round(quantile * (len(ordered) - 1))))]
+
+    return {
+        "count": len(ordered),
+        "p50_ms": round(pick(0.50), 3),
+        "p95_ms": round(pick(0.95), 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+def load_events(directory: Path) -> List[Dict[str, Any]]:
+    events: List[Dict[str, Any]] = []
+    for path in sorted(directory.glob(f"*{TRACE_SUFFIX}")):
+        try:
+            events.extend(load_trace_events(path))
+        except (OSError, ValueError) as exc:
+            print(f"skipping {path}: {exc}", file=sys.stderr)
+    return events
+
+
+def span_stats(events: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """Duration percentiles (ms) per span name."""
+    durations: Dict[str, List[float]] = defaultdict(list)
+    for event in events:
+        if event.get("ph") == "X":
+            durations[event["name"]].append(event.get("dur", 0) / 1000)
+    return {name: _percentiles(samples) for name, samples in sorted(durations.items())}
+
+
+def deliveries(events: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """trace_id -> capture-to-dashboard latency (ms) and where it was served, from the async begin/end pairs."""
+    begins: Dict[str, Dict[str, Any]] = {}
+    result: Dict[str, Dict[str, Any]] = {}
+    for event in events:
+        if event.get("cat") != DELIVERY_CATEGORY:
+            continue
+        if event["ph"] == "b":
+            begins[event["id"]] = event
+        elif event["ph"] == "e" and event["id"] in begins:
+            begin = begins.pop(event["id"])
+            result[event["id"]] = {
+                "latency_ms": (event["ts"] - begin["ts"]) / 1000,
+                **{key: value for key, value in begin.get("args", {}).items() if key != "trace_id"},
+            }
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Merge span traces and report capture-to-dashboard latency.")
+    parser.add_argument("--dir", type=Path, help="trace directory (default NICKEL_TRACE_DIR)")
+    parser.add_argument("--output", type=Path, help="write the merged Chrome trace here")
+    parser.add_argument("--slowest", type=int, default=5, help="list the spans of the N slowest delivered traces")
+    parser.add_argument("--json", type=Path, help="also write the statistics as JSON")
+    args = parser.parse_args()
+
+    directory = args.dir or Path(get_settings().trace_dir)
+    events = load_events(directory)
+    if not events:
+        print(f"no trace events under {directory}", file=sys.stderr)
+        sys.exit(1)
+
+    spans = span_stats(events)
+    delivered = deliveries(events)
+    report: Dict[str, Any] = {"events": len(events), "spans": spans}
+    print(f"{len(events)} events from {directory}")
+    print(f"{'span':<40} {'count':>7} {'p50 ms':>10} {'p95 ms':>10} {'max ms':>10}")
+    for name, stats in spans.items():
+        print(f"{name:<40} {stats['count']:>7} {stats['p50_ms']:>10} {stats['p95_ms']:>10} {stats['max_ms']:>10}")
+
+    if delivered:
+        report["capture_to_dashboard"] = _percentiles([item["latency_ms"] for item in delivered.values()])
+        overall = report["capture_to_dashboard"]
+        print(
+            f"capture -> dashboard: {overall['count']} traces, p50 {overall['p50_ms']} ms, "
+            f"p95 {overall['p95_ms']} ms, max {overall['max_ms']} ms"
+        )
+        by_trace: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for event in events:
+            trace_id = (event.get("args") or {}).get("trace_id")
+            if event.get("ph") == "X" and trace_id in delivered:
+                by_trace[trace_id].append(event)
+        slowest = sorted(delivered.items(), key=lambda item: item[1]["latency_ms"], reverse=True)[: args.slowest]
+        report["slowest"] = []
+        for trace_id, delivery in slowest:
+            trace_spans = sorted(by_trace.get(trace_id, []), key=lambda event: event["ts"])
+            report["slowest"].append(
+                {
+                    "trace_id": trace_id,
+                    **delivery,
+                    "spans": [{"name": event["name"], "dur_ms": event.get("dur", 0) / 1000} for event in trace_spans],
+                }
+            )
+            print(f"  {trace_id} {delivery['latency_ms']:.1f} ms via {delivery.get('route', '?')} ({delivery.get('exchange', '?')})")
+            for event in trace_spans:
+                print(f"    {event['name']:<36} {event.get('dur', 0) / 1000:>10.3f} ms")
+    else:
+        print("no capture -> dashboard deliveries recorded (is the API also running with tracing enabled?)")
+
+    if args.output:
+        args.output.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}), encoding="utf-8")
+        print(f"merged trace written to {args.output}")
+    if args.json:
+        args.json.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
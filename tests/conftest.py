@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture
+def database(tmp_path: Path) -> Iterator[Path]:
+    """Point storage at an empty SQLite file for the duration of one test."""
+    from backend.src.config import get_settings
+
+    settings = get_settings()
+    previous = settings.database_url
+    path = tmp_path / "nickel.db"
+    object.__setattr__(settings, "database_url", f"sqlite:///{path}")
+    try:
+        yield path
+    finally:
+        object.__setattr__(settings, "database_url", previous)
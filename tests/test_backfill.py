@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+
+from backend.src.config import Instrument
+from backend.src.tasks import scheduler
+from backend.src.tasks.collectors_bridge import CollectorError, SourceUnavailableError
+
+SHFE = Instrument("shfe", "shfe", "NI0", "sina_futures", "shfe", 15, 30)
+
+
+@pytest.fixture
+def ledger(monkeypatch: pytest.MonkeyPatch) -> List[tuple]:
+    entries: List[tuple] = []
+    monkeypatch.setattr(scheduler.JOB_LEDGER, "record", lambda *args: entries.append(args))
+    monkeypatch.setattr(scheduler.time, "sleep", lambda seconds: None)
+    return entries
+
+
+def test_open_breaker_is_recorded_as_circuit_open(ledger: List[tuple], monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+
+    def refuse(instrument, dates):
+        calls.append(dates)
+        raise SourceUnavailableError("shfe_history", 120)
+
+    monkeypatch.setattr(scheduler, "collect_daily_range", refuse)
+
+    assert scheduler._backfill_instrument(SHFE, ["2026-10-16"], max_retries=3) is None
+    assert len(calls) == 1  # no retries against an open breaker
+    (entry,) = ledger
+    assert entry[0] == "shfe_backfill"
+    assert entry[7] == "circuit_open"
+    assert isinstance(entry[8], SourceUnavailableError)
+
+
+def test_collector_failure_retries_then_records_failure(ledger: List[tuple], monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(instrument, dates):
+        raise CollectorError("boom")
+
+    monkeypatch.setattr(scheduler, "collect_daily_range", fail)
+
+    assert scheduler._backfill_instrument(SHFE, ["2026-10-16"], max_retries=2) is None
+    (entry,) = ledger
+    assert entry[5] == 3
+    assert entry[7] == "failure"
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from backend.src import dashboard, storage
+from backend.src.config import Instrument
+from backend.src.storage import IntradaySnapshotRecord
+
+
+def _save(instrument: str, exchange: str, contract: str, captured_at: str, price: float) -> None:
+    storage.save_intraday_snapshot(
+        IntradaySnapshotRecord(
+            exchange, "test", contract, captured_at, quote_date="2026-10-19", latest_price=price, instrument=instrument
+        )
+    )
+
+
+@pytest.fixture
+def market(database: Path) -> None:
+    storage.init_db()
+    _save("shfe", "shfe", "NI2611", "2026-10-19T01:00:00+00:00", 120000.0)
+    _save("lme", "lme", "LME NID", "2026-10-19T01:00:00+00:00", 15000.0)
+    # Copper ticks land later on both exchanges and must not replace the nickel cards.
+    _save("shfe_cu", "shfe", "CU2611", "2026-10-19T01:00:30+00:00", 80000.0)
+    _save("lme_cu", "lme", "LME CAD", "2026-10-19T01:00:30+00:00", 9000.0)
+
+
+def test_cards_come_from_the_nickel_instruments(market: None) -> None:
+    data = dashboard.build_dashboard_snapshot(sparkline_points=10)["data"]
+
+    assert data["exchanges"]["shfe"]["latest"]["contract"] == "NI2611"
+    assert data["exchanges"]["lme"]["latest"]["contract"] == "LME NID"
+    assert data["exchanges"]["shfe"]["today_range"]["points"] == 1
+    assert data["exchanges"]["lme"]["sparkline"] == [["2026-10-19T01:00:00+00:00", 15000.0]]
+    assert data["shfe_lme_ratio"] == 8.0
+
+
+def test_no_ratio_between_different_products(market: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    # SHFE nickel disabled, so the SHFE card falls back to copper.
+    primary = {
+        "shfe": Instrument("shfe_cu", "shfe", "CU0", "sina_futures", "shfe", 15, 30),
+        "lme": Instrument("lme", "lme", "NID", "lme_foreign", "lme", 9, 0),
+    }
+    monkeypatch.setattr(dashboard, "primary_instrument", primary.get)
+    body = dashboard.build_dashboard_snapshot(sparkline_points=10)
+
+    assert body["data"]["exchanges"]["shfe"]["latest"]["contract"] == "CU2611"
+    assert body["data"]["shfe_lme_ratio"] is None
+    assert body["meta"]["instruments"] == {"lme": "lme", "shfe": "shfe_cu"}
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Dict, List, Tuple
+
+import pytest
+
+from backend.src.storage import IntradaySnapshotRecord
+from backend.src.tasks import dedup
+
+
+class FakeStorage:
+    """Stands in for the intraday insert / confirm calls the deduplicator makes."""
+
+    def __init__(self) -> None:
+        self.inserted: List[IntradaySnapshotRecord] = []
+        self.confirmed: List[Tuple[int, str]] = []
+        self.missing: set = set()
+
+    def save(self, record: IntradaySnapshotRecord) -> int:
+        self.inserted.append(record)
+        return len(self.inserted)
+
+    def confirm(self, row_id: int, confirmed_at: str) -> bool:
+        if row_id in self.missing:
+            return False
+        self.confirmed.append((row_id, confirmed_at))
+        return True
+
+
+@pytest.fixture
+def storage(monkeypatch: pytest.MonkeyPatch) -> FakeStorage:
+    fake = FakeStorage()
+    monkeypatch.setattr(dedup, "save_intraday_snapshot", fake.save)
+    monkeypatch.setattr(dedup, "confirm_intraday_snapshot", fake.confirm)
+    return fake
+
+
+def _tick(exchange: str = "shfe", contract: str = "NI2611", captured_at: str = "2026-10-19T01:00:00+00:00", **fields) -> IntradaySnapshotRecord:
+    values: Dict[str, object] = {"latest_price": 120000.0, "bid": 119990.0, "ask": 120010.0, "volume": 10.0, **fields}
+    return IntradaySnapshotRecord(exchange, "test", contract, captured_at, **values)
+
+
+def test_unchanged_tick_confirms_previous_row(storage: FakeStorage) -> None:
+    deduplicator = dedup.IntradayDeduplicator()
+    first = deduplicator.save(_tick())
+    second = deduplicator.save(_tick(captured_at="2026-10-19T01:00:30+00:00", elapsed_seconds=0.4))
+
+    assert first == second == 1
+    assert len(storage.inserted) == 1
+    assert storage.confirmed == [(1, "2026-10-19T01:00:30+00:00")]
+    assert deduplicator.stats() == {"shfe": {"inserted": 1, "confirmed": 1}}
+    assert deduplicator.ratio("shfe") == 0.5
+
+
+def test_changed_market_field_inserts(storage: FakeStorage) -> None:
+    deduplicator = dedup.IntradayDeduplicator()
+    deduplicator.save(_tick())
+    row_id = deduplicator.save(_tick(latest_price=120010.0))
+
+    assert row_id == 2
+    assert storage.confirmed == []
+    # The new row becomes the one later unchanged ticks confirm.
+    deduplicator.save(_tick(latest_price=120010.0, captured_at="2026-10-19T01:01:00+00:00"))
+    assert storage.confirmed == [(2, "2026-10-19T01:01:00+00:00")]
+
+
+def test_fingerprints_are_kept_per_exchange_and_contract(storage: FakeStorage) -> None:
+    deduplicator = dedup.IntradayDeduplicator()
+    deduplicator.save(_tick(contract="NI2611"))
+    deduplicator.save(_tick(contract="CU2611"))
+    deduplicator.save(_tick(exchange="lme", contract="NI2611"))
+
+    assert len(storage.inserted) == 3
+    assert storage.confirmed == []
+
+    deduplicator.save(_tick(contract="CU2611", captured_at="2026-10-19T01:00:30+00:00"))
+    assert storage.confirmed == [(2, "2026-10-19T01:00:30+00:00")]
+    assert deduplicator.stats() == {
+        "shfe": {"inserted": 2, "confirmed": 1},
+        "lme": {"inserted": 1, "confirmed": 0},
+    }
+    assert deduplicator.ratio() == 0.25
+    assert deduplicator.ratio("lme") == 0.0
+
+
+def test_confirm_of_vanished_row_falls_back_to_insert(storage: FakeStorage) -> None:
+    deduplicator = dedup.IntradayDeduplicator()
+    deduplicator.save(_tick())
+    storage.missing.add(1)  # e.g. removed by retention cleanup
+
+    assert deduplicator.save(_tick(captured_at="2026-10-19T01:00:30+00:00")) == 2
+    assert len(storage.inserted) == 2
+    assert deduplicator.save(_tick(captured_at="2026-10-19T01:01:00+00:00")) == 2
+
+
+def test_fingerprint_ignores_capture_metadata() -> None:
+    tick = _tick()
+    assert dedup.fingerprint(tick) == dedup.fingerprint(replace(tick, captured_at="2026-10-19T02:00:00+00:00", elapsed_seconds=3.0))
+    assert dedup.fingerprint(tick) != dedup.fingerprint(replace(tick, tick_time="10:00:01"))
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import logging
+import logging.handlers
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from backend.src.logging import SCHEDULER_LOGGERS, JsonFormatter, SuccessSampler, configure_fetch_worker_logging
+from backend.src.tasks.collectors_bridge import FETCH_WORKER_PRELOAD
+from backend.src.tasks.fetch_executor import _resolve
+
+
+@pytest.fixture
+def scheduler_loggers(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.chdir(tmp_path)
+    loggers = [logging.getLogger(name) for name in SCHEDULER_LOGGERS]
+    saved = [(logger.handlers[:], logger.level, logger.propagate) for logger in loggers]
+    for logger in loggers:
+        logger.handlers.clear()
+    try:
+        yield
+    finally:
+        for logger, (handlers, level, propagate) in zip(loggers, saved):
+            for handler in logger.handlers:
+                handler.close()
+            logger.handlers[:] = handlers
+            logger.setLevel(level)
+            logger.propagate = propagate
+
+
+def test_fetch_workers_configure_logging_first() -> None:
+    assert _resolve(FETCH_WORKER_PRELOAD[0]) is configure_fetch_worker_logging
+
+
+def test_fetch_worker_logging_matches_the_scheduler(scheduler_loggers: None) -> None:
+    from backend.src.config import get_settings
+
+    settings = get_settings()
+    previous = settings.log_format
+    object.__setattr__(settings, "log_format", "json")
+    try:
+        configure_fetch_worker_logging()
+    finally:
+        object.__setattr__(settings, "log_format", previous)
+    collectors = logging.getLogger("nickel.collectors")
+    handlers = collectors.handlers
+
+    assert not collectors.propagate
+    assert any(isinstance(handler, logging.handlers.WatchedFileHandler) for handler in handlers)
+    assert not any(isinstance(handler, logging.handlers.TimedRotatingFileHandler) for handler in handlers)
+    assert all(isinstance(handler.formatter, JsonFormatter) for handler in handlers)
+    assert all(any(isinstance(f, SuccessSampler) for f in handler.filters) for handler in handlers)
+
+    logging.getLogger("nickel.collectors.shfe").warning("SHFE realtime request failed: %s", "boom", extra={"exchange": "shfe"})
+    line = Path("logs/scheduler.log").read_text(encoding="utf-8")
+    assert '"exchange": "shfe"' in line and "boom" in line
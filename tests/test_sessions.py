@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+import pytest
+
+from backend.src.config.sessions import DEFAULT_SESSIONS, SHANGHAI_TZ, ExchangeSessions, SessionCalendar
+
+
+def _calendar(shfe_holidays=(), lme_holidays=()) -> SessionCalendar:
+    holidays = {"shfe": frozenset(shfe_holidays), "lme": frozenset(lme_holidays)}
+    return SessionCalendar(
+        {
+            exchange: ExchangeSessions(tz, day, night, holidays[exchange])
+            for exchange, (tz, day, night) in DEFAULT_SESSIONS.items()
+        }
+    )
+
+
+def _shanghai(*args: int) -> datetime:
+    return datetime(*args, tzinfo=SHANGHAI_TZ)
+
+
+def _utc(*args: int) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    ("at", "expected"),
+    [
+        (_shanghai(2026, 10, 16, 20, 59), False),
+        (_shanghai(2026, 10, 16, 21, 0), True),
+        # Friday's night session runs past midnight into Saturday.
+        (_shanghai(2026, 10, 17, 0, 30), True),
+        (_shanghai(2026, 10, 17, 1, 0), False),
+        (_shanghai(2026, 10, 17, 21, 30), False),
+    ],
+)
+def test_shfe_friday_night_session(at: datetime, expected: bool) -> None:
+    assert _calendar().is_open("shfe", at) is expected
+
+
+def test_shfe_next_open_after_friday_night_is_monday_morning() -> None:
+    assert _calendar().next_open("shfe", _shanghai(2026, 10, 17, 2, 0)) == _shanghai(2026, 10, 19, 9, 0)
+
+
+def test_shfe_day_session_breaks() -> None:
+    calendar = _calendar()
+    assert calendar.is_open("shfe", _shanghai(2026, 10, 14, 10, 0))
+    assert not calendar.is_open("shfe", _shanghai(2026, 10, 14, 10, 20))
+    assert not calendar.is_open("shfe", _shanghai(2026, 10, 14, 12, 0))
+    assert calendar.is_open("shfe", _shanghai(2026, 10, 14, 14, 59))
+
+
+def test_shfe_skips_night_session_before_holiday() -> None:
+    calendar = _calendar(shfe_holidays=[date(2026, 10, 1), date(2026, 10, 2)])
+    # Sept 30 trades by day, but Oct 1 is a holiday, so there is no night session.
+    assert calendar.is_open("shfe", _shanghai(2026, 9, 30, 14, 0))
+    assert not calendar.is_open("shfe", _shanghai(2026, 9, 30, 21, 30))
+    assert calendar.next_open("shfe", _shanghai(2026, 9, 30, 15, 0)) == _shanghai(2026, 10, 5, 9, 0)
+
+
+def test_shfe_skips_friday_night_before_monday_holiday() -> None:
+    calendar = _calendar(shfe_holidays=[date(2026, 10, 19)])
+    assert not calendar.is_open("shfe", _shanghai(2026, 10, 16, 21, 30))
+    assert not calendar.is_trading_day("shfe", "2026-10-19")
+    assert calendar.next_open("shfe", _shanghai(2026, 10, 16, 15, 0)) == _shanghai(2026, 10, 20, 9, 0)
+
+
+@pytest.mark.parametrize(
+    ("at", "expected"),
+    [
+        # British Summer Time (UTC+1): 01:00-19:00 London is 00:00-18:00 UTC.
+        (_utc(2026, 10, 23, 0, 0), True),
+        (_utc(2026, 10, 23, 17, 59), True),
+        (_utc(2026, 10, 23, 18, 0), False),
+        # BST ends on 25 October 2026; from Monday the session is 01:00-19:00 UTC.
+        (_utc(2026, 10, 26, 0, 30), False),
+        (_utc(2026, 10, 26, 1, 0), True),
+        (_utc(2026, 10, 26, 18, 30), True),
+        (_utc(2026, 10, 26, 19, 0), False),
+    ],
+)
+def test_lme_sessions_across_bst_boundary(at: datetime, expected: bool) -> None:
+    assert _calendar().is_open("lme", at) is expected
+
+
+def test_lme_next_open_after_clock_change() -> None:
+    assert _calendar().next_open("lme", _utc(2026, 10, 25, 12, 0)) == _utc(2026, 10, 26, 1, 0)
+    # Spring forward: Monday 30 March 2026 opens at 01:00 BST, i.e. 00:00 UTC.
+    assert _calendar().next_open("lme", _utc(2026, 3, 29, 12, 0)) == _utc(2026, 3, 30, 0, 0)
+
+
+def test_unknown_exchange_raises() -> None:
+    with pytest.raises(ValueError):
+        _calendar().is_open("comex", _utc(2026, 10, 19, 12, 0))
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import math
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from backend.src.collectors.SHFE_data_collection import _coerce_to_float, _sina_history_columns, _sina_history_record
+
+
+def _history() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "date": [date(2026, 10, 14), date(2026, 10, 15), date(2026, 10, 16)],
+            "open": [120000.0, 121000.0, 122000.0],
+            "high": [121500.0, 122500.0, 123000.0],
+            "low": [119500.0, 120500.0, 121000.0],
+            "close": [121000.0, 122000.0, 121700.0],
+            "volume": [100000.0, 110000.0, 120000.0],
+            "open_interest": [150000.0, 151000.0, 152000.0],
+            "settlement": [120900.0, np.nan, 121650.0],
+        }
+    )
+
+
+def test_blank_settlement_is_missing_not_nan() -> None:
+    record = _sina_history_record(_history(), "2026-10-15", 0.0)
+
+    assert record["settlement"] is None
+    # Falls back to close, like the columnar path.
+    assert record["change"] == 1100.0
+    assert record["change_pct"] == round(1100.0 / 120900.0 * 100, 6)
+    assert _coerce_to_float(float("nan")) is None
+
+
+def test_per_row_and_columnar_history_agree() -> None:
+    frame = _history()
+    dates = [value.isoformat() for value in frame["date"]]
+    columns = _sina_history_columns(frame, dates, 0.0)["columns"]
+
+    for index, date_str in enumerate(dates):
+        record = _sina_history_record(frame, date_str, 0.0)
+        for field, values in columns.items():
+            if field == "date":
+                continue
+            value = values[index]
+            assert record[field] == (None if isinstance(value, float) and math.isnan(value) else value), field
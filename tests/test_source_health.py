@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import pytest
+
+from backend.src.tasks.source_health import CLOSED, HALF_OPEN, OPEN, SourceHealth, TokenBucket
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def health(clock: FakeClock) -> SourceHealth:
+    # Generous rate limits so the token buckets never make a test sleep.
+    return SourceHealth(
+        rate_per_minute=6000,
+        burst=100,
+        failure_threshold=3,
+        cooldown_seconds=60,
+        max_cooldown_seconds=200,
+        slow_call_seconds=10,
+        clock=clock,
+    )
+
+
+def _state(health: SourceHealth, source: str = "shfe") -> str:
+    return {row["source"]: row for row in health.snapshot()}[source]["state"]
+
+
+def _fail(health: SourceHealth, times: int = 1, source: str = "shfe") -> None:
+    for _ in range(times):
+        health.record(source, ok=False, latency=0.1, error="boom")
+
+
+def test_breaker_opens_at_failure_threshold(health: SourceHealth) -> None:
+    _fail(health, 2)
+    assert _state(health) == CLOSED
+    assert health.before_call("shfe") is None
+
+    _fail(health)
+    assert _state(health) == OPEN
+    assert health.before_call("shfe") == pytest.approx(60)
+    assert health.retry_in("shfe") == pytest.approx(60)
+
+
+def test_half_open_probe_success_closes(health: SourceHealth, clock: FakeClock) -> None:
+    _fail(health, 3)
+    clock.advance(59)
+    assert health.before_call("shfe") == pytest.approx(1)
+
+    clock.advance(1)
+    assert health.before_call("shfe") is None
+    assert _state(health) == HALF_OPEN
+    # Only the one probe goes through while half-open.
+    assert health.before_call("shfe") == pytest.approx(15)
+
+    health.record("shfe", ok=True, latency=0.1)
+    assert _state(health) == CLOSED
+    assert health.before_call("shfe") is None
+    assert health.snapshot()[0]["cooldown_seconds"] == 0.0
+
+
+def test_failed_probe_reopens_with_doubled_cooldown(health: SourceHealth, clock: FakeClock) -> None:
+    _fail(health, 3)
+    expected = [120, 200, 200]  # doubles each time, capped at max_cooldown_seconds
+    cooldown = 60
+    for next_cooldown in expected:
+        clock.advance(cooldown)
+        assert health.before_call("shfe") is None
+        assert _state(health) == HALF_OPEN
+
+        _fail(health)  # a single failed probe is enough to reopen
+        assert _state(health) == OPEN
+        assert health.retry_in("shfe") == pytest.approx(next_cooldown)
+        cooldown = next_cooldown
+
+
+def test_success_resets_cooldown_for_next_trip(health: SourceHealth, clock: FakeClock) -> None:
+    _fail(health, 3)
+    clock.advance(60)
+    health.before_call("shfe")
+    _fail(health)
+    assert health.retry_in("shfe") == pytest.approx(120)
+
+    clock.advance(120)
+    health.before_call("shfe")
+    health.record("shfe", ok=True, latency=0.1)
+    _fail(health, 3)
+    assert health.retry_in("shfe") == pytest.approx(60)
+
+
+def test_breakers_are_per_source(health: SourceHealth) -> None:
+    _fail(health, 3, source="shfe")
+    assert health.before_call("shfe") is not None
+    assert health.before_call("lme") is None
+    assert health.retry_in("lme") == 0.0
+
+
+def test_token_bucket_times_out_when_empty() -> None:
+    bucket = TokenBucket(rate_per_second=0.01, capacity=1)
+    assert bucket.acquire(timeout=0)
+    assert not bucket.acquire(timeout=0.01)
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+from backend.src import storage
+from backend.src.storage import DailyMarketRecord, IntradaySnapshotRecord
+
+
+def _tick(instrument: str, exchange: str, contract: str, captured_at: str, price: float) -> IntradaySnapshotRecord:
+    return IntradaySnapshotRecord(exchange, "test", contract, captured_at, latest_price=price, instrument=instrument)
+
+
+def test_intraday_reads_filter_by_instrument(database: Path) -> None:
+    storage.init_db()
+    storage.save_intraday_snapshot(_tick("shfe", "shfe", "NI2611", "2026-10-19T01:00:00+00:00", 120000.0))
+    storage.save_intraday_snapshot(_tick("shfe_cu", "shfe", "CU2611", "2026-10-19T01:00:30+00:00", 80000.0))
+
+    assert storage.get_latest_intraday("shfe").contract == "CU2611"
+    assert storage.get_latest_intraday("shfe", instrument="shfe").contract == "NI2611"
+    assert [record.contract for record in storage.list_intraday("shfe", instrument="shfe_cu")] == ["CU2611"]
+    assert storage.get_intraday_range("shfe", instrument="shfe")["high"] == 120000.0
+
+
+def test_list_daily_filters_by_contract_and_instrument(database: Path) -> None:
+    storage.init_db()
+    storage.save_daily_market_data(DailyMarketRecord("shfe", "test", "NI_main", "2026-10-16", close=1.0, instrument="shfe"))
+    storage.save_daily_market_data(DailyMarketRecord("shfe", "test", "CU_main", "2026-10-16", close=2.0, instrument="shfe_cu"))
+
+    assert [record.contract for record in storage.list_daily("shfe")] == ["CU_main", "NI_main"]
+    assert [record.contract for record in storage.list_daily("shfe", contract="CU_main")] == ["CU_main"]
+    assert [record.instrument for record in storage.list_daily("shfe", instrument="shfe")] == ["shfe"]
+
+
+def test_migration_tags_existing_rows_with_their_exchange(database: Path) -> None:
+    conn = sqlite3.connect(database)
+    conn.executescript(
+        """
+        CREATE TABLE intraday_snapshots (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, captured_at TEXT NOT NULL, exchange TEXT NOT NULL,
+            source_detail TEXT NOT NULL, contract TEXT NOT NULL, latest_price REAL,
+            created_at TEXT NOT NULL, updated_at TEXT NOT NULL
+        );
+        INSERT INTO intraday_snapshots (captured_at, exchange, source_detail, contract, latest_price, created_at, updated_at)
+        VALUES ('2026-10-19T01:00:00+00:00', 'lme', 'test', 'LME NID', 16000.0, 'x', 'x');
+        """
+    )
+    conn.commit()
+    conn.close()
+
+    storage.init_db()
+    latest = storage.get_latest_intraday("lme", instrument="lme")
+    assert latest is not None and latest.instrument == "lme"